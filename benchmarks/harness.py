@@ -0,0 +1,309 @@
+"""
+Benchmark harness: timing, memory measurement, results files and comparison.
+
+Each measurement runs one workload at one size: an optional warm-up, a fixed
+number of timed repeats (garbage collected beforehand, collector disabled
+while timing, a fresh setup per repeat so caches never carry over), then one
+untimed run under ``tracemalloc`` for the peak allocation.  Results are
+written as JSON (``SCHEMA`` below) and two results files can be compared to
+flag regressions.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import math
+import os
+import platform
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+# Version of the results file layout
+SCHEMA = 1
+
+# Relative slowdown (or memory growth) reported as a regression
+DEFAULT_THRESHOLD = 0.10
+
+PERCENTILES = (50, 90, 99)
+
+# Sizes run by default: 10^3 ... 10^7
+DEFAULT_SIZES = (10**3, 10**4, 10**5, 10**6, 10**7)
+
+
+@dataclass(frozen=True)
+class Workload:
+    """
+    A benchmarked operation.
+
+    Args:
+        name: Identifier used in results files
+        setup: ``setup(size)`` returning the zero-argument callable to time;
+            called afresh for every repeat, outside the timed region
+        max_size: Largest size the workload is run at
+        unit: What ``size`` counts, for throughput reporting
+    """
+
+    name: str
+    setup: Callable[[int], Callable[[], Any]]
+    max_size: int
+    unit: str = "indices"
+
+
+@dataclass
+class Measurement:
+    """Timings and peak memory of one workload at one size."""
+
+    workload: str
+    size: int
+    unit: str
+    repeats: int
+    seconds: dict[str, float]
+    throughput: float
+    peak_bytes: int | None = None
+
+    @property
+    def key(self) -> tuple[str, int]:
+        return (self.workload, self.size)
+
+
+@dataclass
+class Change:
+    """A metric that moved by more than the threshold against the baseline."""
+
+    workload: str
+    size: int
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Relative change, e.g. 0.25 for 25% worse (higher)."""
+        return self.current / self.baseline - 1.0 if self.baseline else math.inf
+
+
+@dataclass
+class Comparison:
+    """Result of comparing a run against a baseline."""
+
+    regressions: list[Change] = field(default_factory=list)
+    improvements: list[Change] = field(default_factory=list)
+    missing: list[tuple[str, int]] = field(default_factory=list)
+
+
+def percentile(samples: list[float], p: float) -> float:
+    """Nearest-rank percentile of *samples* (0 < p <= 100)."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(p / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """Min, max, mean and percentiles of the repeat timings, in seconds."""
+    stats = {
+        "min": min(samples),
+        "max": max(samples),
+        "mean": sum(samples) / len(samples),
+    }
+    for p in PERCENTILES:
+        stats[f"p{p}"] = percentile(samples, p)
+    return stats
+
+
+def _timed(fn: Callable[[], Any]) -> float:
+    gc.collect()
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        t0 = time.perf_counter()
+        fn()
+        return time.perf_counter() - t0
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _peak_bytes(fn: Callable[[], Any]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure(
+    workload: Workload,
+    size: int,
+    repeats: int = 5,
+    warmup: int = 1,
+    memory: bool = True,
+) -> Measurement:
+    """
+    Benchmark *workload* at *size*.
+
+    Args:
+        workload: The operation to run
+        size: Problem size passed to ``workload.setup``
+        repeats: Timed runs (at least 1)
+        warmup: Untimed runs before timing
+        memory: Also record the peak traced allocation of one extra run
+
+    Returns:
+        Measurement: Timing statistics, throughput from the median and peak
+        memory
+    """
+    if repeats < 1:
+        raise ValueError("repeats must be >= 1")
+    for _ in range(warmup):
+        workload.setup(size)()
+    samples = [_timed(workload.setup(size)) for _ in range(repeats)]
+    seconds = summarize(samples)
+    median = seconds["p50"]
+    return Measurement(
+        workload=workload.name,
+        size=size,
+        unit=workload.unit,
+        repeats=repeats,
+        seconds=seconds,
+        throughput=size / median if median > 0 else math.inf,
+        peak_bytes=_peak_bytes(workload.setup(size)) if memory else None,
+    )
+
+
+def environment() -> dict[str, Any]:
+    """Interpreter, platform and library versions recorded with results."""
+    try:
+        import numpy
+
+        numpy_version: str | None = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    try:
+        from snell_vern_matrix import __version__ as package_version
+    except ImportError:
+        package_version = None
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "numpy": numpy_version,
+        "snell_vern_matrix": package_version,
+    }
+
+
+def write_results(
+    path: str, measurements: Iterable[Measurement], config: dict[str, Any]
+) -> dict[str, Any]:
+    """Write *measurements* to *path* as a JSON results file."""
+    document = {
+        "schema": SCHEMA,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": environment(),
+        "config": config,
+        "results": [asdict(m) for m in measurements],
+    }
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(document, fh, indent=2)
+        fh.write("\n")
+    return document
+
+
+def read_results(path: str) -> list[Measurement]:
+    """
+    Read the measurements from a JSON results file.
+
+    Raises:
+        ValueError: If the file uses an unsupported schema
+    """
+    with open(path, encoding="utf-8") as fh:
+        document = json.load(fh)
+    if document.get("schema") != SCHEMA:
+        raise ValueError(f"unsupported results schema {document.get('schema')!r}")
+    return [Measurement(**entry) for entry in document["results"]]
+
+
+def compare(
+    baseline: Iterable[Measurement],
+    current: Iterable[Measurement],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> Comparison:
+    """
+    Compare median time and peak memory of matching (workload, size) pairs.
+
+    A metric more than *threshold* (relative) worse than the baseline is a
+    regression; more than *threshold* better is an improvement.  Baseline
+    entries absent from *current* are listed as missing.
+    """
+    result = Comparison()
+    latest = {m.key: m for m in current}
+    for base in baseline:
+        now = latest.get(base.key)
+        if now is None:
+            result.missing.append(base.key)
+            continue
+        metrics = [("median_seconds", base.seconds["p50"], now.seconds["p50"])]
+        if base.peak_bytes and now.peak_bytes is not None:
+            metrics.append(("peak_bytes", base.peak_bytes, now.peak_bytes))
+        for metric, old, new in metrics:
+            entry = Change(base.workload, base.size, metric, old, new)
+            if new > old * (1 + threshold):
+                result.regressions.append(entry)
+            elif new < old * (1 - threshold):
+                result.improvements.append(entry)
+    return result
+
+
+# -- reporting -------------------------------------------------------------
+
+
+def format_bytes(n: int | None) -> str:
+    if n is None:
+        return "-"
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if n < 1024 or unit == "GiB":
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return str(n)
+
+
+def format_measurement(m: Measurement) -> str:
+    s = m.seconds
+    return (
+        f"{m.workload:<28} {m.size:>10,} "
+        f"{s['p50'] * 1e3:>10.3f} {s['p90'] * 1e3:>10.3f} {s['p99'] * 1e3:>10.3f} "
+        f"{m.throughput:>14,.0f} {format_bytes(m.peak_bytes):>11}"
+    )
+
+
+HEADER = (
+    f"{'workload':<28} {'size':>10} {'p50 ms':>10} {'p90 ms':>10} "
+    f"{'p99 ms':>10} {'items/s':>14} {'peak mem':>11}"
+)
+
+
+def format_comparison(comparison: Comparison, threshold: float) -> str:
+    lines = []
+    for title, entries in (
+        (f"Regressions (> {threshold:.0%} worse)", comparison.regressions),
+        (f"Improvements (> {threshold:.0%} better)", comparison.improvements),
+    ):
+        lines.append(f"{title}: {len(entries)}")
+        for e in entries:
+            lines.append(
+                f"  {e.workload} @ {e.size:,} {e.metric}: "
+                f"{e.baseline:.6g} -> {e.current:.6g} ({e.change:+.1%})"
+            )
+    if comparison.missing:
+        lines.append(f"Missing from current run: {len(comparison.missing)}")
+        for name, size in comparison.missing:
+            lines.append(f"  {name} @ {size:,}")
+    return "\n".join(lines)
@@ -0,0 +1,141 @@
+"""
+Run the benchmark suite or compare two results files.
+
+Usage::
+
+    python benchmarks/run.py run --output results.json
+    python benchmarks/run.py run --sizes 1000,100000 --workloads compute_field
+    python benchmarks/run.py run --baseline baseline.json --output results.json
+    python benchmarks/run.py compare baseline.json results.json
+
+``run`` prints a table and optionally writes JSON; with ``--baseline`` it
+also compares against a stored results file.  Both ``run --baseline`` and
+``compare`` exit with status 1 when a regression is found.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+# Benchmark the working tree, as pytest does via ``pythonpath = ["src"]``
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from harness import (  # noqa: E402
+    DEFAULT_SIZES,
+    DEFAULT_THRESHOLD,
+    HEADER,
+    compare,
+    format_comparison,
+    format_measurement,
+    measure,
+    read_results,
+    write_results,
+)
+
+
+def _int_list(text: str) -> list[int]:
+    return [int(float(part)) for part in text.split(",") if part]
+
+
+def _run(args: argparse.Namespace) -> int:
+    # Imported here so that ``compare`` works without the package installed
+    from workloads import WORKLOADS
+
+    names = args.workloads.split(",") if args.workloads else list(WORKLOADS)
+    unknown = [name for name in names if name not in WORKLOADS]
+    if unknown:
+        print(f"unknown workloads: {', '.join(unknown)}", file=sys.stderr)
+        print(f"available: {', '.join(WORKLOADS)}", file=sys.stderr)
+        return 2
+    sizes = [s for s in args.sizes if s <= args.max_size]
+    print(HEADER)
+    measurements = []
+    for name in names:
+        workload = WORKLOADS[name]
+        for size in sizes:
+            if size > workload.max_size:
+                continue
+            m = measure(
+                workload,
+                size,
+                repeats=args.repeats,
+                warmup=args.warmup,
+                memory=not args.no_memory,
+            )
+            print(format_measurement(m), flush=True)
+            measurements.append(m)
+    if args.output:
+        config = {
+            "workloads": names,
+            "sizes": sizes,
+            "repeats": args.repeats,
+            "warmup": args.warmup,
+            "memory": not args.no_memory,
+        }
+        write_results(args.output, measurements, config)
+        print(f"\nwrote {args.output}")
+    if args.baseline:
+        baseline = read_results(args.baseline)
+        return _report(compare(baseline, measurements, args.threshold), args)
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    baseline = read_results(args.baseline)
+    current = read_results(args.current)
+    return _report(compare(baseline, current, args.threshold), args)
+
+
+def _report(comparison, args: argparse.Namespace) -> int:
+    print()
+    print(format_comparison(comparison, args.threshold))
+    return 1 if comparison.regressions else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the benchmark suite")
+    run.add_argument(
+        "--workloads", help="comma-separated subset (default: all in workloads.py)"
+    )
+    run.add_argument(
+        "--sizes",
+        type=_int_list,
+        default=list(DEFAULT_SIZES),
+        help="comma-separated sizes (default: 1e3,1e4,1e5,1e6,1e7)",
+    )
+    run.add_argument(
+        "--max-size", type=lambda s: int(float(s)), default=10**7, help="skip larger"
+    )
+    run.add_argument("--repeats", type=int, default=5, help="timed runs per size")
+    run.add_argument("--warmup", type=int, default=1, help="untimed runs first")
+    run.add_argument(
+        "--no-memory", action="store_true", help="skip the tracemalloc peak run"
+    )
+    run.add_argument("--output", help="write results to this JSON file")
+    run.add_argument("--baseline", help="compare against this results file")
+    run.set_defaults(handler=_run)
+
+    cmp = commands.add_parser("compare", help="compare two results files")
+    cmp.add_argument("baseline", help="baseline results file")
+    cmp.add_argument("current", help="results file to check")
+    cmp.set_defaults(handler=_compare)
+
+    for sub in (run, cmp):
+        sub.add_argument(
+            "--threshold",
+            type=float,
+            default=DEFAULT_THRESHOLD,
+            help="relative change flagged as a regression (default: 0.10)",
+        )
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""
+Benchmark workloads for the math and field core.
+
+Every workload is deterministic: sizes fully determine the inputs, and each
+timed run gets a new ``DriveMatrix`` so the field, result and sequence caches
+start empty.  ``max_size`` caps workloads whose cost or output grows faster
+than linearly (exact big-integer sequences, dict results).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from harness import Workload
+
+from snell_vern_matrix import DriveMatrix
+from snell_vern_matrix.recursive_field import (
+    FieldBuffer,
+    FieldIndex,
+    nearest_index,
+    position,
+    positions,
+    rasterize,
+)
+
+# Modulus whose Pisano period (about 2·10⁹) is never reached, so the
+# module-level period cache cannot shortcut repeated runs
+_MODULUS = 1_000_000_007
+
+# Largest index queried by the nearest_index workload
+_LOOKUP_SPAN = 10**3
+
+
+def _matrix() -> DriveMatrix:
+    return DriveMatrix()
+
+
+def _positions(n: int) -> Callable[[], Any]:
+    return lambda: positions(1, n)
+
+
+def _positions_float32(n: int) -> Callable[[], Any]:
+    return lambda: positions(1, n, dtype="float32")
+
+
+def _position_scalar(n: int) -> Callable[[], Any]:
+    def run() -> None:
+        for i in range(1, n + 1):
+            position(i)
+
+    return run
+
+
+def _nearest_index(n: int) -> Callable[[], Any]:
+    # n lookups cycling over the points of indices 1.._LOOKUP_SPAN, so the
+    # per-lookup cost (which grows with the radius) stays fixed
+    field = FieldBuffer.compute(1, _LOOKUP_SPAN)
+    points = [field[i % _LOOKUP_SPAN] for i in range(n)]
+
+    def run() -> None:
+        for x, y in points:
+            nearest_index(x, y)
+
+    return run
+
+
+def _compute_field(n: int) -> Callable[[], Any]:
+    matrix = _matrix()
+    return lambda: matrix.compute_field(1, n)
+
+
+def _compute_field_grow(n: int) -> Callable[[], Any]:
+    # Grow a cached range in 1% steps; only the new indices are computed
+    step = max(n // 100, 1)
+    matrix = _matrix()
+
+    def run() -> None:
+        for end in range(step, n + 1, step):
+            matrix.compute_field(1, end)
+
+    return run
+
+
+def _field_index(n: int) -> Callable[[], Any]:
+    field = FieldBuffer.compute(1, n)
+    return lambda: FieldIndex(field)
+
+
+def _rasterize(n: int) -> Callable[[], Any]:
+    return lambda: rasterize(1, n, 512, 512)
+
+
+def _compute_r_theta_field(n: int) -> Callable[[], Any]:
+    matrix = _matrix()
+    return lambda: matrix.compute_r_theta_field(1, n)
+
+
+def _compute_sequences(n: int) -> Callable[[], Any]:
+    matrix = _matrix()
+    return lambda: matrix.compute_sequences(n)
+
+
+def _compute_sequences_modular(n: int) -> Callable[[], Any]:
+    matrix = _matrix()
+    return lambda: matrix.compute_sequences(n, modulus=_MODULUS)
+
+
+def _analyze_lucas_ratios(n: int) -> Callable[[], Any]:
+    matrix = _matrix()
+    return lambda: matrix.analyze_lucas_ratios(n)
+
+
+def _analyze_lucas_ratios_float(n: int) -> Callable[[], Any]:
+    matrix = _matrix()
+    return lambda: matrix.analyze_lucas_ratios(n, precision="float")
+
+
+WORKLOADS: dict[str, Workload] = {
+    w.name: w
+    for w in (
+        Workload("positions", _positions, 10**7),
+        Workload("positions_float32", _positions_float32, 10**7),
+        Workload("position_scalar", _position_scalar, 10**6),
+        Workload("nearest_index", _nearest_index, 10**4, unit="lookups"),
+        Workload("compute_field", _compute_field, 10**7),
+        Workload("compute_field_grow", _compute_field_grow, 10**7),
+        Workload("field_index_build", _field_index, 10**7),
+        Workload("rasterize", _rasterize, 10**7),
+        Workload("compute_r_theta_field", _compute_r_theta_field, 10**6),
+        Workload("compute_sequences", _compute_sequences, 10**4, unit="terms"),
+        Workload(
+            "compute_sequences_modular", _compute_sequences_modular, 10**7, "terms"
+        ),
+        Workload("analyze_lucas_ratios", _analyze_lucas_ratios, 10**3, "ratios"),
+        Workload(
+            "analyze_lucas_ratios_float", _analyze_lucas_ratios_float, 10**7, "ratios"
+        ),
+    )
+}
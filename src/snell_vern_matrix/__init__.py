@@ -35,15 +35,34 @@ except ImportError:  # recursive_field_math not on sys.path
     F = L = egypt_4_7_11 = lucas_ratio_cfrac = None
     r_theta = ratio = ratio_error_bounds = signature_summary = None
 
-from .drive_matrix import DriveMatrix, MatrixState
+from .async_matrix import AsyncDriveMatrix, ProgressEvent
+from .drive_matrix import STATE_CODES, DriveMatrix, MatrixState
 from .memory import FieldMemory, lucas_phi_hash, validate_sce88
-from .recursive_field import angle, golden_angle, position, radius
+from .r_theta_table import RThetaTable
+from .recursive_field import (
+    FieldBuffer,
+    angle,
+    golden_angle,
+    index_range_for_radius,
+    nearest_index,
+    position,
+    positions,
+    positions_array,
+    radius,
+)
+from .result_cache import ResultCache
 from .self_model import ConstraintViolation, SelfModel, TernaryStability
+from .sequences import SequenceEngine
 
 __all__ = [
     # Drive Matrix
     "DriveMatrix",
     "MatrixState",
+    "STATE_CODES",
+    "AsyncDriveMatrix",
+    "ProgressEvent",
+    "ResultCache",
+    "RThetaTable",
     # Memory
     "FieldMemory",
     "lucas_phi_hash",
@@ -70,6 +89,13 @@ __all__ = [
     "radius",
     "angle",
     "position",
+    "index_range_for_radius",
+    "nearest_index",
+    "positions",
+    "positions_array",
+    "FieldBuffer",
+    # Sequences
+    "SequenceEngine",
     # Self-Model
     "SelfModel",
     "ConstraintViolation",
@@ -6,7 +6,7 @@ import os
 import sys
 from typing import Any
 
-from ..recursive_field import angle, golden_angle, position, radius
+from ..recursive_field import angle, golden_angle, positions, radius
 from . import AgentRole, BaseAgent, Task, TaskType
 
 
@@ -47,9 +47,10 @@ class FieldWeaverAgent(BaseAgent):
         n = int(payload.get("n", 10))
 
         if action == "field":
+            xs, ys = positions(1, n)
             points = [
-                {"n": i, "x": position(i)[0], "y": position(i)[1]}
-                for i in range(1, n + 1)
+                {"n": i, "x": x, "y": y}
+                for i, x, y in zip(range(1, n + 1), xs.tolist(), ys.tolist())
             ]
             return {
                 "status": "completed",
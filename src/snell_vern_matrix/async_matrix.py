@@ -0,0 +1,350 @@
+"""
+Async Drive Matrix: asyncio front-end for DriveMatrix computations.
+
+Long computations are split into chunks that run one at a time on an
+executor, so the event loop stays responsive while a job is in progress.
+Between chunks the job reports a :class:`ProgressEvent` and can be
+cancelled; a cancelled job leaves ``field_data`` and the result cache as
+they were (a chunk already running finishes in the background and is
+discarded).
+
+Results go through the wrapped matrix's field and result caches, so the
+synchronous and asynchronous APIs share work.  The executor must be
+thread-based (the default executor of the running loop is used when none is
+given); for multi-process field computation, configure the wrapped
+``DriveMatrix(workers=...)`` instead.  Field chunks then span at least
+``PARALLEL_MIN_POINTS`` indices, so each one is fanned out to the workers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, TypeVar
+
+from .drive_matrix import (
+    DEFAULT_CHUNK_SIZE,
+    PARALLEL_MIN_POINTS,
+    DriveMatrix,
+    MatrixState,
+    lucas_analysis,
+    lucas_ratio_span,
+)
+from .recursive_field import FieldBuffer
+from .recursive_field.batch import check_dtype
+from .recursive_field.parallel import concat_columns
+from .result_cache import copy_result
+from .sequences import float_lucas_ratios, modular_sequences
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    """Progress of an asynchronous computation after a completed chunk."""
+
+    operation: str
+    done: int
+    total: int
+
+    @property
+    def fraction(self) -> float:
+        """Completed share of the work, from 0.0 to 1.0."""
+        return self.done / self.total if self.total else 1.0
+
+
+ProgressCallback = Callable[[ProgressEvent], None]
+
+
+class AsyncDriveMatrix:
+    """
+    Asynchronous wrapper around a :class:`DriveMatrix`.
+
+    Args:
+        matrix: Matrix to drive (default: a new ``DriveMatrix()``)
+        executor: Thread-based executor for chunks (default: the running
+            loop's default executor)
+        chunk_size: Indices per chunk (default: ``DEFAULT_CHUNK_SIZE``)
+
+    Raises:
+        ValueError: If chunk_size is not positive
+    """
+
+    def __init__(
+        self,
+        matrix: DriveMatrix | None = None,
+        executor: Executor | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        self.matrix = matrix if matrix is not None else DriveMatrix()
+        self.executor = executor
+        self.chunk_size = chunk_size
+
+    # -- field -------------------------------------------------------------
+
+    async def compute_field(
+        self,
+        start: int,
+        end: int,
+        progress: ProgressCallback | None = None,
+        dtype: str = "float64",
+    ) -> FieldBuffer:
+        """
+        Compute phyllotaxis field positions for a range of indices.
+
+        Equivalent to :meth:`DriveMatrix.compute_field`; each chunk is served
+        from (and added to) the matrix's field cache.  With ``workers > 1``
+        on the matrix, chunks are widened to ``PARALLEL_MIN_POINTS`` indices
+        so that they are computed by the worker processes.
+
+        Args:
+            start: Starting index (must be positive)
+            end: Ending index
+            progress: Called with a ProgressEvent after every chunk
+            dtype: Column type, ``"float64"`` or ``"float32"``
+
+        Returns:
+            FieldBuffer of (x, y) positions, also stored as ``field_data``
+        """
+        cache = self.matrix._field_cache(dtype)
+        field = await self._track(
+            MatrixState.FIELD_ANALYSIS,
+            self._compute_field(start, end, cache.get, dtype, progress),
+        )
+        self.matrix.field_data = field
+        return field
+
+    async def _compute_field(
+        self,
+        start: int,
+        end: int,
+        get: Callable[[int, int], FieldBuffer],
+        dtype: str,
+        progress: ProgressCallback | None,
+    ) -> FieldBuffer:
+        size = self.chunk_size
+        if self.matrix.workers > 1:
+            size = max(size, PARALLEL_MIN_POINTS)
+        chunks = [
+            chunk
+            async for chunk in self._chunks(
+                start, end, get, "compute_field", progress, size
+            )
+        ]
+        if len(chunks) <= 1:
+            return chunks[0] if chunks else FieldBuffer.empty(start, dtype=dtype)
+        xs = concat_columns([chunk.xs for chunk in chunks])
+        ys = concat_columns([chunk.ys for chunk in chunks])
+        return FieldBuffer(xs, ys, start)
+
+    async def iter_field(
+        self,
+        start: int,
+        end: int,
+        progress: ProgressCallback | None = None,
+        dtype: str = "float64",
+    ) -> AsyncIterator[FieldBuffer]:
+        """
+        Stream field positions chunk by chunk without storing them.
+
+        Like :meth:`DriveMatrix.iter_field`, ``field_data`` and the field
+        cache are left untouched, and the matrix is in FIELD_ANALYSIS from
+        the first chunk until the range is exhausted (COMPLETE), computation
+        fails (ERROR) or the iterator is closed or cancelled early (IDLE).
+
+        Args:
+            start: Starting index (must be positive)
+            end: Ending index
+            progress: Called with a ProgressEvent after every chunk
+            dtype: Column type, ``"float64"`` or ``"float32"``
+
+        Returns:
+            Async iterator of FieldBuffer chunks covering [start, end]
+        """
+        compute = partial(FieldBuffer.compute, dtype=check_dtype(dtype))
+        matrix = self.matrix
+        # The transitions of _track, which cannot wrap an async generator;
+        # closing or cancelling the stream early returns to IDLE
+        matrix.state = MatrixState.FIELD_ANALYSIS
+        final = MatrixState.IDLE
+        try:
+            async for chunk in self._chunks(
+                start, end, compute, "iter_field", progress
+            ):
+                yield chunk
+            final = MatrixState.COMPLETE
+        except Exception:
+            final = MatrixState.ERROR
+            raise
+        finally:
+            matrix.state = final
+
+    async def _chunks(
+        self,
+        start: int,
+        end: int,
+        compute: Callable[[int, int], FieldBuffer],
+        operation: str,
+        progress: ProgressCallback | None,
+        size: int | None = None,
+    ) -> AsyncIterator[FieldBuffer]:
+        total = max(end - start + 1, 0)
+        for lo, hi in self._spans(start, end, size):
+            chunk = await self._run(compute, lo, hi)
+            _report(progress, operation, hi - start + 1, total)
+            yield chunk
+
+    # -- sequences ---------------------------------------------------------
+
+    async def compute_sequences(
+        self,
+        max_n: int,
+        modulus: int | None = None,
+        progress: ProgressCallback | None = None,
+    ) -> dict[str, Any]:
+        """
+        Compute Fibonacci and Lucas sequences up to max_n.
+
+        Equivalent to :meth:`DriveMatrix.compute_sequences`.  The exact
+        sequence cache is extended one chunk of indices at a time; modular
+        sequences are computed in a single executor call.
+
+        Args:
+            max_n: Maximum index to compute
+            modulus: Optional modulus for F(n) mod m and L(n) mod m
+            progress: Called with a ProgressEvent after every chunk
+
+        Returns:
+            Dictionary with 'fibonacci' and 'lucas' {n: term} mappings
+        """
+        return await self._track(
+            MatrixState.COMPUTING,
+            self._cached(
+                ("sequences", max_n, modulus),
+                lambda: self._compute_sequences(max_n, modulus, progress),
+            ),
+        )
+
+    async def _compute_sequences(
+        self, max_n: int, modulus: int | None, progress: ProgressCallback | None
+    ) -> dict[str, Any]:
+        total = max(max_n + 1, 0)
+        if modulus is not None:
+            result = await self._run(modular_sequences, max_n, modulus)
+            _report(progress, "compute_sequences", total, total)
+            return result
+        engine = self.matrix.sequences
+        for _, hi in self._spans(len(engine), max_n):
+            await self._run(engine.extend, hi)
+            _report(progress, "compute_sequences", hi + 1, total)
+        return dict(engine.view(max_n))
+
+    async def analyze_lucas_ratios(
+        self,
+        max_n: int,
+        precision: str = "exact",
+        progress: ProgressCallback | None = None,
+    ) -> dict[str, Any]:
+        """
+        Analyze Lucas number ratios and their convergence to PHI.
+
+        Equivalent to :meth:`DriveMatrix.analyze_lucas_ratios`.  Exact ratios
+        are evaluated one chunk of indices at a time; the vectorised float
+        sweep runs in a single executor call.
+
+        Args:
+            max_n: Maximum index for analysis
+            precision: ``"exact"`` or ``"float"``
+            progress: Called with a ProgressEvent after every chunk
+
+        Returns:
+            Analysis results including ratios and error bounds
+
+        Raises:
+            ValueError: If precision is not "exact" or "float"
+        """
+        if precision not in ("exact", "float"):
+            raise ValueError("precision must be 'exact' or 'float'")
+        return await self._track(
+            MatrixState.FIELD_ANALYSIS,
+            self._cached(
+                ("lucas_analysis", max_n, precision),
+                lambda: self._analyze_lucas_ratios(max_n, precision, progress),
+            ),
+        )
+
+    async def _analyze_lucas_ratios(
+        self, max_n: int, precision: str, progress: ProgressCallback | None
+    ) -> dict[str, Any]:
+        total = max(max_n, 0)
+        if precision == "float":
+            data = dict(await self._run(float_lucas_ratios, max_n))
+            _report(progress, "analyze_lucas_ratios", total, total)
+            return lucas_analysis(precision, data)
+        ratios: dict[int, float] = {}
+        bounds: dict[int, tuple[float, float]] = {}
+        for lo, hi in self._spans(1, max_n):
+            span_ratios, span_bounds = await self._run(lucas_ratio_span, lo, hi)
+            ratios.update(span_ratios)
+            bounds.update(span_bounds)
+            _report(progress, "analyze_lucas_ratios", hi, total)
+        return lucas_analysis(precision, {"ratios": ratios, "error_bounds": bounds})
+
+    # -- internals ---------------------------------------------------------
+
+    def _spans(
+        self, start: int, end: int, size: int | None = None
+    ) -> Iterator[tuple[int, int]]:
+        size = size or self.chunk_size
+        for lo in range(start, end + 1, size):
+            yield lo, min(lo + size - 1, end)
+
+    async def _run(self, fn: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, fn, *args)
+
+    async def _cached(
+        self, key: tuple[Any, ...], compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Async counterpart of ``DriveMatrix._cached``."""
+        matrix = self.matrix
+        result = matrix.result_cache.get(key)
+        if result is None:
+            result = await compute()
+            if matrix.result_cache.put(key, result):
+                result = copy_result(result)
+        else:
+            result = copy_result(result)
+        matrix.computation_results[key[0]] = result
+        return result
+
+    async def _track(self, state: MatrixState, work: Awaitable[T]) -> T:
+        """
+        Run *work* with the matrix in *state*, then COMPLETE.
+
+        Failures set ERROR; cancellation returns the matrix to IDLE.
+        """
+        matrix = self.matrix
+        matrix.state = state
+        try:
+            result = await work
+        except asyncio.CancelledError:
+            matrix.state = MatrixState.IDLE
+            raise
+        except Exception:
+            matrix.state = MatrixState.ERROR
+            raise
+        matrix.state = MatrixState.COMPLETE
+        return result
+
+
+def _report(
+    progress: ProgressCallback | None, operation: str, done: int, total: int
+) -> None:
+    if progress is not None:
+        progress(ProgressEvent(operation, done, total))
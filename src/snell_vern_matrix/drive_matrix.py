@@ -7,15 +7,18 @@ This module provides the DriveMatrix class that integrates all components:
 - Recursive Field for phyllotaxis patterns
 """
 
+import math
+import threading
+from array import array
+from collections.abc import Callable, Generator, Iterable
 from enum import Enum
+from functools import partial
 from typing import Any
 
 from glyph_phase_engine import GlyphPhaseEngine, PhaseState
 from recursive_field_math import (
     PHI,
     PSI,
-    F,
-    L,
     egypt_4_7_11,
     r_theta,
     ratio,
@@ -23,8 +26,90 @@ from recursive_field_math import (
     signature_summary,
 )
 
+from .r_theta_table import RThetaTable
+from .recursive_field import (
+    DensityGrid,
+    FieldBuffer,
+    FieldCache,
+    FieldHeader,
+    FieldIndex,
+    FieldSink,
+    golden_angle,
+    index_range_for_radius,
+    open_field,
+    positions,
+    radius,
+    rasterize,
+    read_field_header,
+    write_field,
+)
 from .recursive_field import angle as rf_angle
-from .recursive_field import golden_angle, position, radius
+from .recursive_field.batch import DTYPES, check_dtype
+from .recursive_field.cache import DEFAULT_CACHE_BYTES
+from .recursive_field.parallel import map_range, parallel_positions, resolve_workers
+from .recursive_field.raster import DEFAULT_TILE_SIZE, Extent, field_extent
+from .result_cache import DEFAULT_RESULT_CACHE_BYTES, ResultCache, copy_result
+from .sequences import SequenceEngine, float_lucas_ratios, modular_sequences
+
+# Default number of indices per chunk for streamed field computation
+DEFAULT_CHUNK_SIZE = 1 << 16
+# Ranges shorter than this are computed serially even when workers > 1,
+# since process start-up would dominate
+PARALLEL_MIN_POINTS = 1 << 18
+
+_TWO_PI = 2.0 * math.pi
+
+# Lucas 4-7-11 invariants, identical for every analysis
+_SIGNATURE = signature_summary()
+_EGYPTIAN_FRACTION = egypt_4_7_11()
+
+
+def _r_theta_span(lo: int, hi: int) -> list[tuple[float, float]]:
+    """Compute r_theta over [lo, hi] (module-level so workers can unpickle it)."""
+    return [r_theta(n) for n in range(lo, hi + 1)]
+
+
+def lucas_ratio_span(
+    lo: int, hi: int
+) -> tuple[dict[int, float], dict[int, tuple[float, float]]]:
+    """
+    Exact Lucas ratios and their error bounds over [lo, hi].
+
+    Args:
+        lo: First index
+        hi: Last index (inclusive)
+
+    Returns:
+        Tuple of ({n: ratio}, {n: (lower, upper)}) mappings
+    """
+    ratios = {}
+    bounds = {}
+    for n in range(lo, hi + 1):
+        ratios[n] = ratio(n)
+        bounds[n] = ratio_error_bounds(n)
+    return ratios, bounds
+
+
+def lucas_analysis(precision: str, data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Wrap ratio data in the ``analyze_lucas_ratios`` result layout.
+
+    Args:
+        precision: ``"exact"`` or ``"float"``
+        data: Ratio entries (``ratios``, ``error_bounds`` and so on)
+
+    Returns:
+        Analysis result with the PHI/PSI constants and 4-7-11 invariants
+    """
+    result: dict[str, Any] = {
+        "phi": PHI,
+        "psi": PSI,
+        "precision": precision,
+    }
+    result.update(data)
+    result["signature"] = dict(_SIGNATURE)
+    result["egyptian_fraction"] = _EGYPTIAN_FRACTION
+    return result
 
 
 class MatrixState(Enum):
@@ -38,6 +123,29 @@ class MatrixState(Enum):
     ERROR = "error"
 
 
+# Compact state codes used by DriveMatrix.process_inputs: the code of a state
+# is its position in this tuple
+STATE_CODES: tuple[MatrixState, ...] = tuple(MatrixState)
+_SYNC_CODE = STATE_CODES.index(MatrixState.PHASE_SYNC)
+_COMPLETE_CODE = STATE_CODES.index(MatrixState.COMPLETE)
+_ERROR_CODE = STATE_CODES.index(MatrixState.ERROR)
+
+
+class _Context:
+    """Per-request state of a DriveMatrix."""
+
+    def __init__(self) -> None:
+        self.state = MatrixState.IDLE
+        self.phase_engine = GlyphPhaseEngine()
+        self.computation_results: dict[str, Any] = {}
+        self.field_data = FieldBuffer.empty()
+        self.field_index: FieldIndex | None = None
+
+
+class _ThreadContext(_Context, threading.local):
+    """Per-request state kept separately for every thread."""
+
+
 class DriveMatrix:
     """
     Unified Drive Matrix Engine that combines all recursive field computations.
@@ -47,15 +155,80 @@ class DriveMatrix:
     - Lucas and Fibonacci sequence calculations
     - Phyllotaxis field pattern analysis
     - Phase-state synchronization
+
+    Args:
+        workers: Processes used for large field ranges (default: 1, serial;
+            ``None`` uses every CPU).  Parallel results are bit-for-bit
+            identical to the serial path.
+        field_cache_bytes: Budget for cached field ranges reused by
+            ``compute_field``, per column dtype (default: 256 MiB; ``None``
+            for no limit); larger ranges are computed without being cached
+        result_cache_bytes: Budget for cached results of
+            ``compute_r_theta_field``, ``compute_sequences`` and
+            ``analyze_lucas_ratios`` keyed on their arguments (default:
+            64 MiB; ``None`` for no limit)
+        concurrent: Keep ``state``, ``phase_engine``, ``field_data`` and
+            ``computation_results`` per thread, so one instance can serve a
+            thread pool.  The sequence, field and result caches are shared
+            by all threads either way and are safe to use concurrently.
+        r_theta_table: Precomputed table consulted by
+            ``compute_r_theta_field`` and ``compute_r_theta_columns`` for the
+            ranges it covers (see :meth:`load_r_theta_table`)
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        workers: int | None = 1,
+        field_cache_bytes: int | None = DEFAULT_CACHE_BYTES,
+        result_cache_bytes: int | None = DEFAULT_RESULT_CACHE_BYTES,
+        concurrent: bool = False,
+        r_theta_table: RThetaTable | None = None,
+    ):
         """Initialize the Drive Matrix with all component engines."""
-        self.state = MatrixState.IDLE
-        self.phase_engine = GlyphPhaseEngine()
-        self.computation_results: dict[str, Any] = {}
-        self.field_data: list[tuple[float, float]] = []
-        self.sequence_cache: dict[str, dict[int, int]] = {"fibonacci": {}, "lucas": {}}
+        self.workers = resolve_workers(workers)
+        self.concurrent = concurrent
+        self._ctx = _ThreadContext() if concurrent else _Context()
+        self._field_cache_bytes = field_cache_bytes
+        self._field_caches: dict[str, FieldCache] = {}
+        # float64 cache; float32 ranges get their own cache on first use
+        self.field_cache = self._field_cache("float64")
+        self.result_cache = ResultCache(result_cache_bytes)
+        self.r_theta_table = r_theta_table
+        self.sequences = SequenceEngine()
+        self.sequence_cache: dict[str, list[int]] = {
+            "fibonacci": self.sequences.fibonacci,
+            "lucas": self.sequences.lucas,
+        }
+
+    # -- per-request state (per thread when concurrent) ---------------------
+
+    @property
+    def state(self) -> MatrixState:
+        """State of the latest operation (of the calling thread if concurrent)."""
+        return self._ctx.state
+
+    @state.setter
+    def state(self, value: MatrixState) -> None:
+        self._ctx.state = value
+
+    @property
+    def phase_engine(self) -> GlyphPhaseEngine:
+        """Phase engine used for symbolic input."""
+        return self._ctx.phase_engine
+
+    @property
+    def computation_results(self) -> dict[str, Any]:
+        """Latest result per computation name."""
+        return self._ctx.computation_results
+
+    @property
+    def field_data(self) -> FieldBuffer:
+        """Field computed or loaded by the latest field operation."""
+        return self._ctx.field_data
+
+    @field_data.setter
+    def field_data(self, value: FieldBuffer) -> None:
+        self._ctx.field_data = value
 
     def process_input(self, symbolic_input: str) -> MatrixState:
         """
@@ -79,26 +252,338 @@ class DriveMatrix:
 
         return self.state
 
-    def compute_field(self, start: int, end: int) -> list[tuple[float, float]]:
+    def process_inputs(
+        self, inputs: Iterable[str], stop_on_error: bool = False
+    ) -> dict[str, Any]:
+        """
+        Stream many symbolic inputs through the phase engine.
+
+        Each input is mapped exactly as :meth:`process_input` would map it,
+        but the per-input result is stored as a one-byte state code (see
+        ``STATE_CODES``) instead of a ``MatrixState``, and the matrix state
+        is updated once at the end to that of the last processed input.
+
+        Args:
+            inputs: Iterable of symbolic input strings (consumed lazily)
+            stop_on_error: Stop after the first input that yields ERROR
+
+        Returns:
+            Dictionary with 'codes' (``array('B')`` of state codes in input
+            order), 'counts' ({state value: count}), 'processed' and
+            'first_error' (index of the first ERROR input, or None)
+        """
+        process = self.phase_engine.process_symbolic_input
+        stabilized, error = PhaseState.STABILIZED, PhaseState.ERROR
+        codes = array("B")
+        append = codes.append
+        first_error = None
+        for i, symbolic_input in enumerate(inputs):
+            phase = process(symbolic_input)
+            if phase is stabilized:
+                append(_COMPLETE_CODE)
+            elif phase is error:
+                append(_ERROR_CODE)
+                if first_error is None:
+                    first_error = i
+                    if stop_on_error:
+                        break
+            else:
+                append(_SYNC_CODE)
+
+        if codes:
+            self.state = STATE_CODES[codes[-1]]
+        counts = {
+            STATE_CODES[code].value: codes.count(code)
+            for code in (_COMPLETE_CODE, _SYNC_CODE, _ERROR_CODE)
+        }
+        return {
+            "codes": codes,
+            "counts": counts,
+            "processed": len(codes),
+            "first_error": first_error,
+        }
+
+    def compute_field(
+        self, start: int, end: int, dtype: str = "float64"
+    ) -> FieldBuffer:
         """
         Compute phyllotaxis field positions for a range of indices.
 
+        The result is stored column-wise; it reads as a sequence of (x, y)
+        tuples, and ``to_list()`` materialises a plain tuple list on demand.
+        Ranges overlapping a previously computed one are served from
+        ``field_cache``, computing only the missing indices at either end.
+
         Args:
             start: Starting index (must be positive)
             end: Ending index
+            dtype: Column type, ``"float64"`` or ``"float32"``; float32 halves
+                memory and I/O with coordinates within 2⁻²⁴·a√n of the
+                float64 values (see :mod:`~.recursive_field.batch`)
 
         Returns:
-            List of (x, y) positions for each index
+            FieldBuffer of (x, y) positions for each index
         """
         self.state = MatrixState.FIELD_ANALYSIS
-        self.field_data = []
+        self.field_data = self._field_cache(dtype).get(start, end)
+        self.state = MatrixState.COMPLETE
+        return self.field_data
 
-        for n in range(start, end + 1):
-            pos = position(n)
-            self.field_data.append(pos)
+    def _field_cache(self, dtype: str) -> FieldCache:
+        """Field range cache for *dtype* columns, created on first use."""
+        cache = self._field_caches.get(dtype)
+        if cache is None:
+            check_dtype(dtype)
+            cache = FieldCache(
+                self._field_cache_bytes,
+                compute=partial(self._positions, dtype=dtype),
+                dtype=dtype,
+            )
+            cache = self._field_caches.setdefault(dtype, cache)
+        return cache
+
+    def clear_field_cache(self) -> None:
+        """Drop the cached field ranges of every dtype."""
+        for cache in list(self._field_caches.values()):
+            cache.clear()
+
+    def _positions(
+        self, start: int, end: int, dtype: str = "float64"
+    ) -> tuple[Any, Any]:
+        """Position columns for [start, end], fanned out when the span is large."""
+        if self._use_workers(start, end):
+            return parallel_positions(start, end, workers=self.workers, dtype=dtype)
+        return positions(start, end, dtype=dtype)
+
+    def iter_field(
+        self,
+        start: int,
+        end: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        dtype: str = "float64",
+    ) -> Generator[FieldBuffer, None, None]:
+        """
+        Stream phyllotaxis field positions in fixed-size chunks.
+
+        Only one chunk is held at a time and ``field_data`` is left untouched.
+        The matrix enters FIELD_ANALYSIS when the first chunk is requested and
+        COMPLETE once the range is exhausted (ERROR if computation fails, IDLE
+        if the generator is closed early).
 
+        Args:
+            start: Starting index (must be positive)
+            end: Ending index
+            chunk_size: Maximum number of indices per chunk
+            dtype: Column type, ``"float64"`` or ``"float32"``
+
+        Returns:
+            Generator of FieldBuffer chunks covering [start, end] in order
+
+        Raises:
+            ValueError: If chunk_size is not positive or dtype is unknown
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        return self._iter_field(start, end, chunk_size, check_dtype(dtype))
+
+    def _iter_field(
+        self, start: int, end: int, chunk_size: int, dtype: str
+    ) -> Generator[FieldBuffer, None, None]:
+        self.state = MatrixState.FIELD_ANALYSIS
+        # Closed before exhaustion (the consumer stopped early): back to IDLE
+        final = MatrixState.IDLE
+        try:
+            for lo in range(start, end + 1, chunk_size):
+                hi = min(lo + chunk_size - 1, end)
+                yield FieldBuffer.compute(lo, hi, dtype=dtype)
+            final = MatrixState.COMPLETE
+        except Exception:
+            final = MatrixState.ERROR
+            raise
+        finally:
+            self.state = final
+
+    def stream_field(
+        self,
+        start: int,
+        end: int,
+        sink: FieldSink,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        dtype: str = "float64",
+    ) -> int:
+        """
+        Compute a field range chunk-by-chunk straight into *sink*.
+
+        Args:
+            start: Starting index (must be positive)
+            end: Ending index
+            sink: Object whose ``write(chunk)`` receives each FieldBuffer
+            chunk_size: Maximum number of indices per chunk
+            dtype: Column type, ``"float64"`` or ``"float32"``
+
+        Returns:
+            Number of positions written
+        """
+        count = 0
+        chunks = self.iter_field(start, end, chunk_size, dtype)
+        try:
+            for chunk in chunks:
+                sink.write(chunk)
+                count += len(chunk)
+        except Exception:
+            chunks.close()
+            self.state = MatrixState.ERROR
+            raise
+        return count
+
+    @property
+    def field_index(self) -> FieldIndex:
+        """Spatial index over ``field_data``, rebuilt when the field changes."""
+        ctx = self._ctx
+        if ctx.field_index is None or ctx.field_index.field is not ctx.field_data:
+            ctx.field_index = FieldIndex(ctx.field_data)
+        return ctx.field_index
+
+    def query_field(self, x: float, y: float, radius: float) -> list[int]:
+        """
+        Find computed field points within *radius* of ``(x, y)``.
+
+        Args:
+            x: Query x coordinate
+            y: Query y coordinate
+            radius: Search radius
+
+        Returns:
+            Ascending field indices of the matching points
+        """
+        return self.field_index.query_radius(x, y, radius)
+
+    def nearest_field_indices(self, x: float, y: float, k: int = 1) -> list[int]:
+        """
+        Find the *k* computed field points nearest to ``(x, y)``.
+
+        Args:
+            x: Query x coordinate
+            y: Query y coordinate
+            k: Number of neighbours
+
+        Returns:
+            Field indices ordered by distance
+        """
+        return self.field_index.nearest(x, y, k)
+
+    def compute_annulus(self, r_min: float, r_max: float) -> FieldBuffer:
+        """
+        Compute only the field points whose radius lies in [r_min, r_max].
+
+        The index band is derived analytically from r = a * sqrt(n), so no
+        full field pass is needed; ``field_data`` is left untouched.
+
+        Args:
+            r_min: Inner radius
+            r_max: Outer radius
+
+        Returns:
+            FieldBuffer covering the contiguous index band
+        """
+        self.state = MatrixState.FIELD_ANALYSIS
+        n_lo, n_hi = index_range_for_radius(r_min, r_max, self.field_data.a)
+        band = self._field_range(n_lo, n_hi)
         self.state = MatrixState.COMPLETE
-        return self.field_data
+        return band
+
+    def compute_region(
+        self, x: float, y: float, radius: float
+    ) -> dict[int, tuple[float, float]]:
+        """
+        Compute the field points within *radius* of ``(x, y)``.
+
+        Only the index band of the annulus around the point's own radius is
+        evaluated (reusing ``field_data`` where it already covers the band),
+        so the cost is independent of the total field size.
+
+        Args:
+            x: Query x coordinate
+            y: Query y coordinate
+            radius: Region radius
+
+        Returns:
+            Dictionary mapping field index to (x, y) for points in the region
+        """
+        rho = math.hypot(x, y)
+        band = self.compute_annulus(rho - radius, rho + radius)
+        r2 = radius * radius
+        return {
+            n: (px, py)
+            for n, (px, py) in zip(range(band.start, band.end + 1), band)
+            if (px - x) ** 2 + (py - y) ** 2 <= r2
+        }
+
+    def _field_range(self, start: int, end: int) -> FieldBuffer:
+        """Positions for [start, end], sliced from field_data when covered."""
+        field = self.field_data
+        if len(field) and field.start <= start and end <= field.end:
+            return field[start - field.start : end - field.start + 1]
+        return FieldBuffer.compute(start, end, field.a)
+
+    def rasterize_field(
+        self,
+        start: int,
+        end: int,
+        width: int,
+        height: int | None = None,
+        extent: Extent | None = None,
+        tile_size: int = DEFAULT_TILE_SIZE,
+    ) -> DensityGrid:
+        """
+        Bin the field over [start, end] into a fixed-size density grid.
+
+        Positions are generated and binned one tile of *tile_size* indices
+        at a time, so peak memory is one tile plus the grid however long the
+        range is.  With ``workers`` > 1, large ranges are rasterised in
+        worker processes and the partial grids merged.  ``field_data`` and
+        the field cache are left untouched.
+
+        Args:
+            start: Starting index (must be positive)
+            end: Ending index
+            width: Number of bins along x
+            height: Number of bins along y (default: *width*)
+            extent: ``(x_min, x_max, y_min, y_max)`` covered by the grid
+                (default: the square holding every point up to *end*)
+            tile_size: Indices computed and binned per step
+
+        Returns:
+            DensityGrid of point counts per bin
+        """
+        height = width if height is None else height
+        extent = extent or field_extent(end)
+        self.state = MatrixState.FIELD_ANALYSIS
+        result = self._cached(
+            ("density_grid", start, end, width, height, tuple(extent)),
+            lambda: self._rasterize_field(start, end, width, height, extent, tile_size),
+        )
+        self.state = MatrixState.COMPLETE
+        return result
+
+    def _rasterize_field(
+        self,
+        start: int,
+        end: int,
+        width: int,
+        height: int,
+        extent: Extent,
+        tile_size: int,
+    ) -> DensityGrid:
+        raster = partial(
+            rasterize, width=width, height=height, extent=extent, tile_size=tile_size
+        )
+        if not self._use_workers(start, end):
+            return raster(start, end)
+        grid, *rest = map_range(raster, start, end, self.workers)
+        for part in rest:
+            grid.merge(part)
+        return grid
 
     def compute_r_theta_field(
         self, start: int, end: int
@@ -106,6 +591,9 @@ class DriveMatrix:
         """
         Compute radial/angular field values for a range of indices.
 
+        Ranges covered by ``r_theta_table`` are read from the table instead
+        of evaluating ``r_theta`` per index.
+
         Args:
             start: Starting index (must be >= 1)
             end: Ending index
@@ -114,73 +602,251 @@ class DriveMatrix:
             Dictionary mapping index to (radius, theta) pairs
         """
         self.state = MatrixState.FIELD_ANALYSIS
-        result = {}
+        result = self._cached(
+            ("r_theta_field", start, end),
+            lambda: self._compute_r_theta_field(start, end),
+        )
+        self.state = MatrixState.COMPLETE
+        return result
+
+    def _compute_r_theta_field(
+        self, start: int, end: int
+    ) -> dict[int, tuple[float, float]]:
+        return dict(zip(range(start, end + 1), self._r_theta_values(start, end)))
+
+    def _r_theta_values(self, start: int, end: int) -> Iterable[tuple[float, float]]:
+        """``r_theta(n)`` for n in [start, end], from the table when it covers them."""
+        table = self.r_theta_table
+        if table is not None and table.covers(start, end):
+            return table.pairs(start, end)
+        if self._use_workers(start, end):
+            spans = map_range(_r_theta_span, start, end, self.workers)
+            return (v for span in spans for v in span)
+        return map(r_theta, range(start, end + 1))
+
+    def compute_r_theta_columns(
+        self, start: int, end: int, dtype: str = "float64"
+    ) -> FieldBuffer:
+        """
+        Compute radial/angular field values as columns.
+
+        Columnar counterpart of :meth:`compute_r_theta_field`.  θ is reduced
+        to [0, 2π) in float64 before storing, so float32 columns keep an
+        absolute angle error below 2⁻²⁴·2π ≈ 3.7e-7 rad for every n (the
+        unreduced angle grows with n and would lose all angular precision
+        in float32); r is within 2⁻²⁴·r of its float64 value.
 
-        for n in range(start, end + 1):
-            result[n] = r_theta(n)
+        Args:
+            start: Starting index (must be >= 1)
+            end: Ending index
+            dtype: Column type, ``"float64"`` or ``"float32"``
 
-        self.computation_results["r_theta_field"] = result
+        Returns:
+            FieldBuffer whose columns hold r and θ for each index
+        """
+        check_dtype(dtype)
+        self.state = MatrixState.FIELD_ANALYSIS
+        result = self._cached(
+            ("r_theta_columns", start, end, dtype),
+            lambda: self._compute_r_theta_columns(start, end, dtype),
+        )
         self.state = MatrixState.COMPLETE
         return result
 
-    def compute_sequences(self, max_n: int) -> dict[str, dict[int, int]]:
+    def _compute_r_theta_columns(self, start: int, end: int, dtype: str) -> FieldBuffer:
+        rs: array[float] = array(DTYPES[dtype])
+        thetas: array[float] = array(DTYPES[dtype])
+        for r, theta in self._r_theta_values(start, end):
+            rs.append(r)
+            thetas.append(theta % _TWO_PI)
+        return FieldBuffer(rs, thetas, start)
+
+    def build_r_theta_table(
+        self, start: int, end: int, path: str | None = None
+    ) -> RThetaTable:
+        """
+        Precompute ``r_theta`` over [start, end] into ``r_theta_table``.
+
+        Args:
+            start: First index (must be >= 1)
+            end: Last index (inclusive)
+            path: Optional file to save the table to for later
+                :meth:`load_r_theta_table` calls
+
+        Returns:
+            The new RThetaTable
+        """
+        table = RThetaTable.build(start, end, workers=self.workers)
+        if path is not None:
+            table.save(path)
+        self.r_theta_table = table
+        return table
+
+    def load_r_theta_table(self, path: str) -> RThetaTable:
+        """
+        Use the r/θ table saved at *path* (memory-mapped with NumPy).
+
+        Args:
+            path: File written by :meth:`build_r_theta_table` or
+                :meth:`RThetaTable.save`
+
+        Returns:
+            The loaded RThetaTable
+
+        Raises:
+            ValueError: If the file is not a valid table for the current
+                ``r_theta``
+        """
+        self.r_theta_table = RThetaTable.load(path)
+        return self.r_theta_table
+
+    def export_field(self, path: str) -> FieldHeader:
+        """
+        Write ``field_data`` to *path* as a binary field file.
+
+        Args:
+            path: Destination file
+
+        Returns:
+            FieldHeader describing the written file
+        """
+        return write_field(path, self.field_data)
+
+    def export_r_theta_field(self, path: str) -> FieldHeader:
+        """
+        Write the last ``compute_r_theta_field`` result to *path*.
+
+        The (r, θ) pairs are stored as two float64 columns in a field file of
+        kind ``"r_theta"``.
+
+        Args:
+            path: Destination file
+
+        Returns:
+            FieldHeader describing the written file
+
+        Raises:
+            ValueError: If no r/θ field has been computed
+        """
+        values = self.computation_results.get("r_theta_field")
+        if values is None:
+            raise ValueError("no r_theta field has been computed")
+        rs = array("d", (r for r, _ in values.values()))
+        thetas = array("d", (theta for _, theta in values.values()))
+        start = next(iter(values), 1)
+        return write_field(path, FieldBuffer(rs, thetas, start), kind="r_theta")
+
+    def load_field(self, path: str) -> FieldBuffer:
+        """
+        Replace ``field_data`` with the x/y field stored at *path*.
+
+        The file is memory-mapped (see :func:`open_field`), so loading is
+        independent of the field size.
+
+        Args:
+            path: Field file written by :meth:`export_field` or a FieldFileSink
+
+        Returns:
+            The loaded FieldBuffer
+
+        Raises:
+            ValueError: If the file does not hold x/y positions
+        """
+        if read_field_header(path).kind != "xy":
+            raise ValueError("field file does not hold x/y positions")
+        self.field_data = open_field(path)
+        return self.field_data
+
+    def compute_sequences(
+        self, max_n: int, modulus: int | None = None
+    ) -> dict[str, Any]:
         """
         Compute Fibonacci and Lucas sequences up to max_n.
 
+        Only indices beyond the cached prefix are computed, each from the
+        previous two terms.  The returned mappings are views over the cache.
+        With a modulus, residues are computed instead (tiled by the cached
+        Pisano period) and the exact cache is left untouched.
+
         Args:
             max_n: Maximum index to compute
+            modulus: Optional modulus for F(n) mod m and L(n) mod m
 
         Returns:
-            Dictionary with 'fibonacci' and 'lucas' sequences
+            Dictionary with 'fibonacci' and 'lucas' {n: term} mappings (plus
+            'modulus' and 'period' in modular mode)
         """
         self.state = MatrixState.COMPUTING
-
-        for n in range(max_n + 1):
-            if n not in self.sequence_cache["fibonacci"]:
-                self.sequence_cache["fibonacci"][n] = F(n)
-            if n not in self.sequence_cache["lucas"]:
-                self.sequence_cache["lucas"][n] = L(n)
-
-        fib_items = self.sequence_cache["fibonacci"].items()
-        lucas_items = self.sequence_cache["lucas"].items()
-        self.computation_results["sequences"] = {
-            "fibonacci": dict(list(fib_items)[: max_n + 1]),
-            "lucas": dict(list(lucas_items)[: max_n + 1]),
-        }
+        result = self._cached(
+            ("sequences", max_n, modulus),
+            lambda: self._compute_sequences(max_n, modulus),
+        )
         self.state = MatrixState.COMPLETE
-        return self.computation_results["sequences"]
+        return result
+
+    def _compute_sequences(self, max_n: int, modulus: int | None) -> dict[str, Any]:
+        if modulus is None:
+            return dict(self.sequences.view(max_n))
+        return modular_sequences(max_n, modulus)
 
-    def analyze_lucas_ratios(self, max_n: int) -> dict[str, Any]:
+    def analyze_lucas_ratios(
+        self, max_n: int, precision: str = "exact"
+    ) -> dict[str, Any]:
         """
         Analyze Lucas number ratios and their convergence to PHI.
 
         Args:
             max_n: Maximum index for analysis
+            precision: ``"exact"`` evaluates each ratio from exact Lucas
+                numbers; ``"float"`` derives the whole range in one pass from
+                the Binet closed form (vectorised when NumPy is available)
+                and reports natural-log error bounds (``log_lower_bounds`` /
+                ``log_upper_bounds``) that stay finite for huge n
 
         Returns:
             Analysis results including ratios and error bounds
+
+        Raises:
+            ValueError: If precision is not "exact" or "float"
         """
+        if precision not in ("exact", "float"):
+            raise ValueError("precision must be 'exact' or 'float'")
         self.state = MatrixState.FIELD_ANALYSIS
-        ratios = {}
-        bounds = {}
+        result = self._cached(
+            ("lucas_analysis", max_n, precision),
+            lambda: self._analyze_lucas_ratios(max_n, precision),
+        )
+        self.state = MatrixState.COMPLETE
+        return result
 
-        for n in range(1, max_n + 1):
-            ratios[n] = ratio(n)
-            bounds[n] = ratio_error_bounds(n)
+    def _analyze_lucas_ratios(self, max_n: int, precision: str) -> dict[str, Any]:
+        if precision == "float":
+            return lucas_analysis(precision, dict(float_lucas_ratios(max_n)))
+        ratios, bounds = lucas_ratio_span(1, max_n)
+        return lucas_analysis(precision, {"ratios": ratios, "error_bounds": bounds})
 
-        result = {
-            "phi": PHI,
-            "psi": PSI,
-            "ratios": ratios,
-            "error_bounds": bounds,
-            "signature": signature_summary(),
-            "egyptian_fraction": egypt_4_7_11(),
-        }
+    def _cached(self, key: tuple[Any, ...], compute: Callable[[], Any]) -> Any:
+        """
+        Return the result for *key*, computing and caching it on a miss.
 
-        self.computation_results["lucas_analysis"] = result
-        self.state = MatrixState.COMPLETE
+        ``key[0]`` names the result; the latest result per name is also kept
+        in ``computation_results``.  Each call returns its own copy, so
+        callers may modify results without affecting the cache.
+        """
+        result = self.result_cache.get(key)
+        if result is None:
+            result = compute()
+            if self.result_cache.put(key, result):
+                result = copy_result(result)
+        else:
+            result = copy_result(result)
+        self.computation_results[key[0]] = result
         return result
 
+    def _use_workers(self, start: int, end: int) -> bool:
+        """Whether a range is large enough to fan out to worker processes."""
+        return self.workers > 1 and end - start + 1 >= PARALLEL_MIN_POINTS
+
     def get_golden_field_analysis(self) -> dict[str, Any]:
         """
         Get comprehensive golden angle field analysis.
@@ -208,17 +874,41 @@ class DriveMatrix:
         """
         return {
             "matrix_state": self.state.value,
+            "workers": self.workers,
+            "concurrent": self.concurrent,
             "phase_info": self.phase_engine.get_phase_info(),
             "field_data_count": len(self.field_data),
+            "field_cache_bytes": sum(
+                cache.nbytes for cache in self._field_caches.values()
+            ),
+            "field_cache_ranges": self.field_cache.ranges(),
+            "r_theta_table": (
+                None
+                if self.r_theta_table is None
+                else (self.r_theta_table.start, self.r_theta_table.end)
+            ),
             "cached_fibonacci": len(self.sequence_cache["fibonacci"]),
             "cached_lucas": len(self.sequence_cache["lucas"]),
             "computation_results_keys": list(self.computation_results.keys()),
+            "result_cache": self.result_cache.stats(),
         }
 
-    def reset(self) -> None:
-        """Reset the drive matrix to initial state."""
+    def reset(self, keep_result_cache: bool = False) -> None:
+        """
+        Reset the drive matrix to initial state.
+
+        In concurrent mode only the calling thread's state is reset, while
+        clearing the result cache affects every thread.
+
+        Args:
+            keep_result_cache: Keep cached results so that repeated requests
+                after the reset are still served without recomputation
+        """
         self.state = MatrixState.IDLE
         self.phase_engine.reset()
         self.computation_results.clear()
-        self.field_data.clear()
-        # Keep sequence cache for efficiency
+        if not keep_result_cache:
+            self.result_cache.clear()
+        self.field_data = FieldBuffer.empty()
+        # Keep sequence and field range caches and the r/θ table for
+        # efficiency; clear_field_cache() releases the field ranges
@@ -10,27 +10,37 @@ Thread-safe, deterministic, zero new runtime dependencies.
 
 from __future__ import annotations
 
+import heapq
 import json
 import math
 import threading
 import time
+from array import array
+from collections.abc import Iterator, Mapping, MutableMapping
 from typing import Any, Optional
 
 from recursive_field_math import L
 
-from .recursive_field import golden_angle
+from .recursive_field.constants import GOLDEN_ANGLE_RAD
 
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 
 _PRIME = 104_729  # Large prime for Lucas-phi modular mapping
-_GOLDEN_ANGLE_DEG = golden_angle()  # ≈ 137.508°
-_GOLDEN_ANGLE_RAD = math.radians(_GOLDEN_ANGLE_DEG)
+_LUCAS_INDEX_CAP = 30  # Lucas indices used by lucas_phi_hash are 0..29
 
 # SCE-88 constraints (reuse definitions from self_model)
 _SCE88_COHERENCE_BOUNDS = (0.0, 1.0)
 
+# Record storage backends accepted by FieldMemory
+_STORAGES = ("dict", "columnar")
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None
+
 
 def _clamp(value: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, value))
@@ -57,7 +67,7 @@ def lucas_phi_hash(key: str) -> int:
     for i, ch in enumerate(key):
         n += ord(ch) * (i + 1)
     # Cap the Lucas index at 30 to keep values deterministic and bounded
-    idx = n % 30
+    idx = n % _LUCAS_INDEX_CAP
     return int(L(idx)) % _PRIME
 
 
@@ -104,13 +114,257 @@ def _proximity_score(hash_a: int, hash_b: int) -> float:
     theta = norm * 2.0 * math.pi
     # Ternary-logic gate: average of three angular projections
     t0 = math.cos(theta)
-    t1 = math.cos(theta + _GOLDEN_ANGLE_RAD)
-    t2 = math.cos(theta + 2.0 * _GOLDEN_ANGLE_RAD)
+    t1 = math.cos(theta + GOLDEN_ANGLE_RAD)
+    t2 = math.cos(theta + 2.0 * GOLDEN_ANGLE_RAD)
     raw = (t0 + t1 + t2) / 3.0
     # Map from [-1, 1] → [0, 1]
     return _clamp((raw + 1.0) / 2.0, 0.0, 1.0)
 
 
+# Every key hashes to one of 30 values, and proximity depends only on the
+# pair of hashes, so all 30×30 scores are computed once at import.
+_BUCKET_HASHES = tuple(int(L(i)) % _PRIME for i in range(_LUCAS_INDEX_CAP))
+_PROXIMITY_TABLE: dict[tuple[int, int], float] = {
+    (a, b): _proximity_score(a, b) for a in _BUCKET_HASHES for b in _BUCKET_HASHES
+}
+
+
+def _proximity(hash_a: int, hash_b: int) -> float:
+    """Table lookup of :func:`_proximity_score` (computed for other hashes)."""
+    score = _PROXIMITY_TABLE.get((hash_a, hash_b))
+    return _proximity_score(hash_a, hash_b) if score is None else score
+
+
+# ---------------------------------------------------------------------------
+# Eviction queue
+# ---------------------------------------------------------------------------
+
+
+class _EvictionQueue:
+    """Keys ordered for eviction by a lower bound on their coherence.
+
+    Between reads a record's coherence follows ``c·exp(−k·t)`` on the decay
+    clock ``t``, with ``k = rate / (1 + usage_count)``.  Keys are grouped
+    into usage classes ``j = ⌊log2(1 + usage_count)⌋`` (at most 64 of them),
+    and no key in class ``j`` decays faster than ``k_j = rate / 2**j``.  So
+    ``c·exp(−k_j·(t − t0))`` bounds a key's coherence from below, and within
+    a class the order of those bounds never changes: it is the order of the
+    anchor ``log c + k_j·t0``, taken when ``c`` was read at clock ``t0``.  A
+    usage count that grows after the push only slows decay, so the bound
+    stays valid.
+
+    Each class is a min-heap of anchors.  The class heads' bounds at the
+    clock of the last :meth:`peek` are kept in a second min-heap, rebuilt
+    only when the clock moves, so a peek at an unchanged clock (every pop of
+    one prune) costs O(log n).  Entries replaced by a later push, or whose
+    key was discarded, are skipped when they reach a head.
+    """
+
+    def __init__(self, rate: float) -> None:
+        self.rate = rate
+        # usage class → heap of (anchor, seq, key, clock)
+        self._heaps: dict[int, list[tuple[float, int, str, float]]] = {}
+        # key → seq of its current entry
+        self._live: dict[str, int] = {}
+        # (bound at _top_clock, seq, usage class) of class heads, and the
+        # seq of each class's newest entry there
+        self._top: list[tuple[float, int, int]] = []
+        self._top_seq: dict[int, int] = {}
+        self._top_clock: Optional[float] = None
+        self._seq = 0
+        self._entries = 0
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def push(self, key: str, coherence: float, usage: int, clock: float) -> None:
+        """Queue *key* with *coherence* read at *clock*, replacing its entry."""
+        j = (1 + usage).bit_length() - 1
+        if coherence > 0.0:
+            anchor = math.log(coherence) + self.rate / (1 << j) * clock
+        else:
+            anchor = -math.inf
+        self._seq += 1
+        heap = self._heaps.setdefault(j, [])
+        heapq.heappush(heap, (anchor, self._seq, key, clock))
+        self._live[key] = self._seq
+        self._entries += 1
+        if self._entries > 2 * len(self._live) + 64:
+            self._compact()
+        elif self._top_clock is not None and heap[0][1] == self._seq:
+            self._push_head(j, heap, self._top_clock)
+
+    def discard(self, key: str) -> None:
+        """Drop *key* from the queue, if present."""
+        self._live.pop(key, None)
+
+    def peek(self, clock: float) -> Optional[tuple[str, bool]]:
+        """Key with the lowest coherence bound at *clock*, or ``None``.
+
+        Also reports whether that bound is exact, i.e. the key's coherence
+        was read at *clock* (or nothing decays).  Callers re-push a key whose
+        bound is not exact to tighten it.  Ties go to the key queued first.
+        """
+        if clock != self._top_clock or len(self._top) > 2 * len(self._heaps) + 64:
+            self._top = []
+            self._top_seq = {}
+            self._top_clock = clock
+            for j, heap in list(self._heaps.items()):
+                self._push_head(j, heap, clock)
+        top = self._top
+        while top:
+            j, seq = top[0][2], top[0][1]
+            heap = self._heaps.get(j)
+            if heap is not None:
+                while heap and self._live.get(heap[0][2]) != heap[0][1]:
+                    heapq.heappop(heap)
+                    self._entries -= 1
+                if heap and heap[0][1] == seq:
+                    queued_at = heap[0][3]
+                    return heap[0][2], self.rate == 0.0 or queued_at == clock
+            # Stale: the class head was popped or replaced since
+            heapq.heappop(top)
+            if heap and heap[0][1] != self._top_seq.get(j):
+                self._push_head(j, heap, clock)
+            elif heap is not None and not heap:
+                del self._heaps[j]
+        return None
+
+    def _push_head(
+        self, j: int, heap: list[tuple[float, int, str, float]], clock: float
+    ) -> None:
+        while heap and self._live.get(heap[0][2]) != heap[0][1]:
+            heapq.heappop(heap)
+            self._entries -= 1
+        if heap:
+            bound = heap[0][0] - self.rate / (1 << j) * clock
+            heapq.heappush(self._top, (bound, heap[0][1], j))
+            self._top_seq[j] = heap[0][1]
+        else:
+            del self._heaps[j]
+
+    def _compact(self) -> None:
+        heaps: dict[int, list[tuple[float, int, str, float]]] = {}
+        for j, heap in self._heaps.items():
+            live = [e for e in heap if self._live.get(e[2]) == e[1]]
+            if live:
+                heapq.heapify(live)
+                heaps[j] = live
+        self._heaps = heaps
+        self._entries = sum(len(heap) for heap in heaps.values())
+        self._top_clock = None
+
+
+# ---------------------------------------------------------------------------
+# Columnar record storage
+# ---------------------------------------------------------------------------
+
+
+class _RecordView:
+    """Dict-style access to one slot of a :class:`_ColumnarRecords`."""
+
+    __slots__ = ("_columns", "_slot")
+
+    def __init__(self, columns: dict[str, Any], slot: int) -> None:
+        self._columns = columns
+        self._slot = slot
+
+    def __getitem__(self, field: str) -> Any:
+        return self._columns[field][self._slot]
+
+    def __setitem__(self, field: str, value: Any) -> None:
+        self._columns[field][self._slot] = value
+
+
+class _ColumnarRecords(MutableMapping[str, Any]):
+    """FieldMemory records stored as parallel columns indexed by slot.
+
+    Numeric fields live in typed arrays, payloads in a single list, and a
+    key → slot map (insertion-ordered, like a dict) locates them; freed
+    slots are reused.  Values are :class:`_RecordView` objects, so code
+    written against record dicts works unchanged, and whole-memory updates
+    such as :meth:`decay` run over the columns directly.
+    """
+
+    def __init__(self) -> None:
+        self.columns: dict[str, Any] = {
+            "hash": array("q"),
+            "data": [],
+            "coherence_score": array("d"),
+            "timestamp": array("d"),
+            "usage_count": array("q"),
+            "decayed_at": array("d"),
+        }
+        self._slots: dict[str, int] = {}
+        self._free: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._slots)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._slots
+
+    def __getitem__(self, key: str) -> _RecordView:
+        return _RecordView(self.columns, self._slots[key])
+
+    def get(self, key: str, default: Any = None) -> Any:
+        slot = self._slots.get(key)
+        return default if slot is None else _RecordView(self.columns, slot)
+
+    def __setitem__(self, key: str, rec: Mapping[str, Any]) -> None:
+        slot = self._slots.get(key)
+        if slot is None:
+            if self._free:
+                slot = self._free.pop()
+            else:
+                slot = len(self.columns["data"])
+                for column in self.columns.values():
+                    column.append(0)
+            self._slots[key] = slot
+        for field, column in self.columns.items():
+            column[slot] = rec[field]
+
+    def __delitem__(self, key: str) -> None:
+        slot = self._slots.pop(key)
+        self.columns["data"][slot] = None
+        # Free slots hold zero coherence, so decay never counts them
+        self.columns["coherence_score"][slot] = 0.0
+        self._free.append(slot)
+
+    def pop(self, key: str, *default: Any) -> Any:
+        """Remove *key* and return a dict copy of its record."""
+        slot = self._slots.get(key)
+        if slot is None:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        rec = {field: column[slot] for field, column in self.columns.items()}
+        del self[key]
+        return rec
+
+    def decay(self, rate: float, dt: float) -> int:
+        """Eager decay of every slot; returns the number of records that dropped."""
+        coherence = self.columns["coherence_score"]
+        usage = self.columns["usage_count"]
+        if np is not None and len(coherence):
+            old = np.frombuffer(coherence, dtype=np.float64)
+            counts = np.frombuffer(usage, dtype=np.int64)
+            new = np.clip(old * np.exp(-(rate / (1.0 + counts)) * dt), 0.0, 1.0)
+            dropped = int(np.count_nonzero(new < old))
+            old[:] = new
+            return dropped
+        dropped = 0
+        for slot, old_score in enumerate(coherence):
+            factor = math.exp(-rate / (1.0 + usage[slot]) * dt)
+            coherence[slot] = _clamp(old_score * factor, 0.0, 1.0)
+            if coherence[slot] < old_score:
+                dropped += 1
+        return dropped
+
+
 # ---------------------------------------------------------------------------
 # FieldMemory
 # ---------------------------------------------------------------------------
@@ -129,6 +383,28 @@ class FieldMemory:
     coherence_threshold:
         Minimum coherence for a record to survive :meth:`prune`
         (default 0.1).
+    lazy_decay:
+        Defer decay to read time (default ``False``).  :meth:`decay` then
+        only advances a decay clock in O(1); each record remembers the clock
+        reading its coherence was last brought up to date at, and the
+        pending decay is applied when the record is next read (recall,
+        prune, get, persist) or its usage count changes.  Coherence values
+        match eager decay; pending decay uses the current ``decay_rate``.
+    storage:
+        ``"dict"`` (default) keeps one dict per record.  ``"columnar"``
+        keeps hash, coherence, timestamp and usage count in parallel typed
+        arrays indexed by slot, with payloads in one list, cutting the
+        per-record overhead; eager :meth:`decay` then updates the coherence
+        column in one vectorised pass when NumPy is installed.
+
+    Records are indexed by hash bucket (at most 30 buckets, one per
+    Lucas-phi hash value), so :meth:`recall` scores each bucket once and
+    only visits records in buckets that can reach the threshold.  An
+    eviction queue updated on store yields the lowest-coherence records
+    directly, so :meth:`prune` and storing into a full memory remove
+    records one by one without scanning or sorting the rest; records over
+    capacity are picked by ``coherence × (1 + usage_count)`` in one partial
+    selection.
     """
 
     def __init__(
@@ -136,6 +412,8 @@ class FieldMemory:
         capacity: int = 1024,
         decay_rate: float = 0.05,
         coherence_threshold: float = 0.1,
+        lazy_decay: bool = False,
+        storage: str = "dict",
     ) -> None:
         if capacity < 1:
             raise ValueError("capacity must be >= 1")
@@ -143,13 +421,22 @@ class FieldMemory:
             raise ValueError("decay_rate must be in [0.0, 1.0]")
         if not (0.0 <= coherence_threshold <= 1.0):
             raise ValueError("coherence_threshold must be in [0.0, 1.0]")
+        if storage not in _STORAGES:
+            raise ValueError(f"storage must be one of {_STORAGES}")
 
         self._lock = threading.Lock()
-        self._records: dict[str, dict[str, Any]] = {}
+        self.storage = storage
+        self._records: MutableMapping[str, Any] = self._new_records()
+        # hash → keys in that bucket (insertion-ordered, values unused)
+        self._buckets: dict[int, dict[str, None]] = {}
         self.capacity = capacity
         self.decay_rate = decay_rate
         self.coherence_threshold = coherence_threshold
+        self.lazy_decay = lazy_decay
         self.last_tick: float = time.monotonic()
+        # Total time advanced by decay() ticks
+        self._decay_clock = 0.0
+        self._eviction = _EvictionQueue(decay_rate)
 
     # -- core operations ---------------------------------------------------
 
@@ -182,9 +469,10 @@ class FieldMemory:
         now = time.monotonic()
 
         with self._lock:
-            # If at capacity and key is new, prune first
+            # If at capacity and key is new, evict below-threshold records
+            # until there is room
             if key not in self._records and len(self._records) >= self.capacity:
-                self._prune_unlocked()
+                self._prune_unlocked(free=1)
                 # If still at capacity, cannot store
                 if len(self._records) >= self.capacity:
                     return False
@@ -195,7 +483,10 @@ class FieldMemory:
                 "coherence_score": coherence,
                 "timestamp": now,
                 "usage_count": 0,
+                "decayed_at": self._decay_clock,
             }
+            self._buckets.setdefault(h, {})[key] = None
+            self._enqueue_unlocked(key, self._records[key])
             return True
 
     def recall(self, query: str, threshold: float = 0.5) -> list[dict[str, Any]]:
@@ -203,7 +494,10 @@ class FieldMemory:
 
         Uses golden-angle spacing and ternary logic to compute proximity
         scores.  Results are sorted by ``coherence × proximity`` and
-        filtered by *threshold*.
+        filtered by *threshold*; equal scores keep bucket order (highest
+        proximity first), then insertion order.  Proximity is looked up once
+        per hash bucket, and buckets whose proximity is below *threshold*
+        are skipped without visiting their records.
 
         Parameters
         ----------
@@ -222,33 +516,138 @@ class FieldMemory:
         results: list[dict[str, Any]] = []
 
         with self._lock:
-            for key, rec in self._records.items():
-                prox = _proximity_score(q_hash, rec["hash"])
-                combined = rec["coherence_score"] * prox
-                if combined >= threshold:
-                    rec["usage_count"] += 1
-                    results.append(
-                        {
-                            "key": key,
-                            "data": dict(rec["data"]),
-                            "score": combined,
-                            "coherence_score": rec["coherence_score"],
-                        }
-                    )
+            lazy = self.lazy_decay
+            for prox, h in self._ranked_buckets(q_hash, threshold):
+                for key in self._buckets[h]:
+                    rec = self._records[key]
+                    # Pending decay only lowers coherence, so the stored
+                    # value bounds the score from above
+                    combined = rec["coherence_score"] * prox
+                    if combined < threshold:
+                        continue
+                    if lazy:
+                        combined = self._coherence_unlocked(rec) * prox
+                        if combined < threshold:
+                            continue
+                    results.append(self._recalled_unlocked(key, rec, combined))
 
         results.sort(key=lambda r: r["score"], reverse=True)
         return results
 
+    def recall_top_k(
+        self, query: str, k: int, threshold: float = 0.5
+    ) -> list[dict[str, Any]]:
+        """Recall the *k* best records matching *query*.
+
+        Equivalent to ``recall(query, threshold)[:k]``, but buckets are
+        visited in descending proximity with a size-*k* heap of candidates,
+        the scan stops once no remaining bucket can beat the current k-th
+        score, and only the winners are copied and have their
+        ``usage_count`` incremented.
+
+        Parameters
+        ----------
+        query:
+            Query string.
+        k:
+            Maximum number of records to return.
+        threshold:
+            Minimum ``coherence × proximity`` for inclusion (default 0.5).
+
+        Returns
+        -------
+        list[dict]
+            Up to *k* records, best first, in the format of :meth:`recall`.
+
+        Raises
+        ------
+        ValueError
+            If *k* is less than 1.
+        """
+        if k < 1:
+            raise ValueError("k must be >= 1")
+        q_hash = lucas_phi_hash(query)
+        # Min-heap of (score, -visit order, key): the root is the current
+        # k-th best, ties going to the record visited first
+        heap: list[tuple[float, int, str]] = []
+        order = 0
+
+        with self._lock:
+            lazy = self.lazy_decay
+            for prox, h in self._ranked_buckets(q_hash, threshold):
+                # Later records lose ties, so a bucket must beat the root
+                if len(heap) == k and prox <= heap[0][0]:
+                    break
+                for key in self._buckets[h]:
+                    order += 1
+                    rec = self._records[key]
+                    combined = rec["coherence_score"] * prox
+                    if combined < threshold:
+                        continue
+                    if lazy and (len(heap) < k or combined > heap[0][0]):
+                        combined = self._coherence_unlocked(rec) * prox
+                        if combined < threshold:
+                            continue
+                    if len(heap) < k:
+                        heapq.heappush(heap, (combined, -order, key))
+                    elif combined > heap[0][0]:
+                        heapq.heapreplace(heap, (combined, -order, key))
+            heap.sort(reverse=True)
+            return [
+                self._recalled_unlocked(key, self._records[key], score)
+                for score, _, key in heap
+            ]
+
+    def _ranked_buckets(self, q_hash: int, threshold: float) -> list[tuple[float, int]]:
+        """``(proximity, hash)`` of buckets that can reach *threshold*, best first.
+
+        Coherence is at most 1, so no record in a bucket whose proximity is
+        below the threshold can qualify.
+        """
+        ranked = []
+        for h in self._buckets:
+            prox = _proximity(q_hash, h)
+            if prox >= threshold:
+                ranked.append((prox, h))
+        ranked.sort(key=lambda entry: entry[0], reverse=True)
+        return ranked
+
+    def _recalled_unlocked(
+        self, key: str, rec: dict[str, Any], score: float
+    ) -> dict[str, Any]:
+        """Count a recall of *rec* and return its result entry.
+
+        In lazy mode *rec* must already be brought up to date, since its
+        usage count sets the rate of any later pending decay.
+        """
+        rec["usage_count"] += 1
+        return {
+            "key": key,
+            "data": dict(rec["data"]),
+            "score": score,
+            "coherence_score": rec["coherence_score"],
+        }
+
     def decay(self) -> int:
         """Apply exponential decay to idle records.
 
         Records with higher ``usage_count`` decay more slowly.
-        Returns the number of records whose coherence dropped.
+        Returns the number of records whose coherence dropped.  In lazy
+        mode no record is visited: the decay clock advances and the return
+        value is the number of records the tick applies to (all of them, or
+        none when no time passed or ``decay_rate`` is zero).
         """
         now = time.monotonic()
         with self._lock:
             dt = now - self.last_tick
             self.last_tick = now
+            self._decay_clock += dt
+            if self.lazy_decay:
+                if dt > 0.0 and self.decay_rate > 0.0:
+                    return len(self._records)
+                return 0
+            if isinstance(self._records, _ColumnarRecords):
+                return self._records.decay(self.decay_rate, dt)
             count = 0
             for rec in self._records.values():
                 # Dampen decay by usage count
@@ -260,6 +659,23 @@ class FieldMemory:
                     count += 1
             return count
 
+    def _coherence_unlocked(self, rec: dict[str, Any]) -> float:
+        """Coherence of *rec* after applying its pending lazy decay.
+
+        The decayed value is written back, so each tick is applied once.
+        Usage count is constant since the record was last brought up to
+        date, so one exponential covers every tick in between.
+        """
+        if not self.lazy_decay:
+            return rec["coherence_score"]
+        elapsed = self._decay_clock - rec["decayed_at"]
+        if elapsed > 0.0:
+            rate = self.decay_rate / (1.0 + rec["usage_count"])
+            factor = math.exp(-rate * elapsed)
+            rec["coherence_score"] = _clamp(rec["coherence_score"] * factor, 0.0, 1.0)
+            rec["decayed_at"] = self._decay_clock
+        return rec["coherence_score"]
+
     def prune(self) -> int:
         """Remove records below coherence threshold or beyond capacity.
 
@@ -269,33 +685,77 @@ class FieldMemory:
         with self._lock:
             return self._prune_unlocked()
 
-    def _prune_unlocked(self) -> int:
-        """Internal prune without acquiring the lock."""
+    def _prune_unlocked(self, free: int = 0) -> int:
+        """Internal prune without acquiring the lock.
+
+        With *free* > 0, below-threshold records are only evicted until
+        *free* slots below capacity are open (used by :meth:`store`).
+        """
+        if self._eviction.rate != self.decay_rate:
+            self._requeue_unlocked()
         removed = 0
-        # Phase 1: remove records below coherence threshold
-        below = [
-            k
-            for k, rec in self._records.items()
-            if rec["coherence_score"] < self.coherence_threshold
-        ]
-        for k in below:
-            del self._records[k]
+        # Phase 1: remove records below coherence threshold, lowest first
+        while self._records and (not free or len(self._records) > self.capacity - free):
+            k = self._peek_unlocked()
+            if k is None:
+                break
+            if self._coherence_unlocked(self._records[k]) >= self.coherence_threshold:
+                break
+            self._delete_unlocked(k)
             removed += 1
 
-        # Phase 2: if still over capacity, evict lowest-scoring records
-        if len(self._records) > self.capacity:
-            # Sort by (coherence * (1 + usage_count)), ascending → evict lowest
-            ranked = sorted(
-                self._records.items(),
-                key=lambda kv: kv[1]["coherence_score"] * (1 + kv[1]["usage_count"]),
-            )
-            while len(self._records) > self.capacity and ranked:
-                k, _ = ranked.pop(0)
-                del self._records[k]
-                removed += 1
+        # Phase 2: if still over capacity, evict lowest
+        # coherence * (1 + usage_count) first
+        excess = len(self._records) - self.capacity
+        if excess > 0:
+            for k in heapq.nsmallest(
+                excess, self._records, key=self._weighted_unlocked
+            ):
+                self._delete_unlocked(k)
+            removed += excess
 
         return removed
 
+    def _peek_unlocked(self) -> Optional[str]:
+        """Front of the eviction queue, tightening stale bounds on the way."""
+        while True:
+            found = self._eviction.peek(self._decay_clock)
+            if found is None:
+                return None
+            k, exact = found
+            if exact:
+                return k
+            self._enqueue_unlocked(k, self._records[k])
+
+    def _weighted_unlocked(self, key: str) -> float:
+        rec = self._records[key]
+        return self._coherence_unlocked(rec) * (1 + rec["usage_count"])
+
+    def _enqueue_unlocked(self, key: str, rec: dict[str, Any]) -> None:
+        """(Re)queue *key* for eviction after its coherence or usage changed."""
+        if self._eviction.rate != self.decay_rate:
+            self._requeue_unlocked()
+            return
+        coherence = self._coherence_unlocked(rec)
+        self._eviction.push(key, coherence, rec["usage_count"], self._decay_clock)
+
+    def _requeue_unlocked(self) -> None:
+        """Rebuild the eviction queue, e.g. after ``decay_rate`` changed."""
+        self._eviction = _EvictionQueue(self.decay_rate)
+        for key, rec in self._records.items():
+            coherence = self._coherence_unlocked(rec)
+            self._eviction.push(key, coherence, rec["usage_count"], self._decay_clock)
+
+    def _delete_unlocked(self, key: str) -> None:
+        """Remove *key* from the records, its hash bucket and the queue."""
+        self._eviction.discard(key)
+        rec = self._records.pop(key)
+        bucket = self._buckets.get(rec["hash"])
+        if bucket is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                del self._buckets[rec["hash"]]
+
     # -- persistence -------------------------------------------------------
 
     def persist(self, path: str) -> None:
@@ -309,7 +769,7 @@ class FieldMemory:
                     k: {
                         "hash": rec["hash"],
                         "data": rec["data"],
-                        "coherence_score": rec["coherence_score"],
+                        "coherence_score": self._coherence_unlocked(rec),
                         "timestamp": rec["timestamp"],
                         "usage_count": rec["usage_count"],
                     }
@@ -328,15 +788,25 @@ class FieldMemory:
             self.capacity = int(payload["capacity"])
             self.decay_rate = float(payload["decay_rate"])
             self.coherence_threshold = float(payload["coherence_threshold"])
-            self._records = {}
+            self._records = self._new_records()
+            self._buckets = {}
+            self._eviction = _EvictionQueue(self.decay_rate)
             for k, rec in payload.get("records", {}).items():
+                h = int(rec["hash"])
                 self._records[k] = {
-                    "hash": int(rec["hash"]),
+                    "hash": h,
                     "data": dict(rec["data"]),
                     "coherence_score": float(rec["coherence_score"]),
                     "timestamp": float(rec["timestamp"]),
                     "usage_count": int(rec["usage_count"]),
+                    "decayed_at": self._decay_clock,
                 }
+                self._buckets.setdefault(h, {})[k] = None
+                self._enqueue_unlocked(k, self._records[k])
+
+    def _new_records(self) -> MutableMapping[str, Any]:
+        """Empty record mapping for the configured storage backend."""
+        return _ColumnarRecords() if self.storage == "columnar" else {}
 
     # -- introspection -----------------------------------------------------
 
@@ -364,6 +834,6 @@ class FieldMemory:
             return {
                 "key": key,
                 "data": dict(rec["data"]),
-                "coherence_score": rec["coherence_score"],
+                "coherence_score": self._coherence_unlocked(rec),
                 "usage_count": rec["usage_count"],
             }
@@ -0,0 +1,177 @@
+"""
+R/θ Table: Persistent lookup table of precomputed r_theta values.
+
+``r_theta(n)`` is evaluated one index at a time in Python, which dominates
+``DriveMatrix.compute_r_theta_field`` for large ranges.  An
+:class:`RThetaTable` holds r and θ for a contiguous index range as two
+float64 columns, so a lookup is a single array read.
+
+Tables are stored as field files of kind ``"r_theta"`` (see
+:mod:`~.recursive_field.fieldfile`): the header records the file format
+version, the index range and the scale factor, and loading memory-maps the
+columns, so opening even a very large table costs no up-front read.  On load
+the scale and a few sampled entries are checked against ``r_theta``, so a
+table written by a different formula or scale is rejected instead of served.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator
+from typing import Any
+
+from recursive_field_math import ROOT_SCALE, r_theta
+
+from .recursive_field import FieldBuffer, open_field, read_field_header, write_field
+from .recursive_field.fieldfile import FieldHeader
+from .recursive_field.parallel import concat_columns, map_range, resolve_workers
+
+# Entries compared against r_theta when a table is loaded
+_VERIFY_SAMPLES = 8
+
+
+def _r_theta_columns(lo: int, hi: int) -> tuple[array, array]:
+    """r and θ columns over [lo, hi] (module-level so workers can unpickle it)."""
+    rs = array("d")
+    thetas = array("d")
+    for n in range(lo, hi + 1):
+        r, theta = r_theta(n)
+        rs.append(r)
+        thetas.append(theta)
+    return rs, thetas
+
+
+class RThetaTable:
+    """
+    Lookup table of ``r_theta(n)`` for the inclusive index range [start, end].
+
+    Args:
+        columns: FieldBuffer whose columns hold r and θ for each index
+    """
+
+    def __init__(self, columns: FieldBuffer):
+        self.columns = columns
+
+    @classmethod
+    def build(cls, start: int, end: int, workers: int | None = 1) -> RThetaTable:
+        """
+        Evaluate ``r_theta`` over [start, end] into a new table.
+
+        Args:
+            start: First index (must be >= 1)
+            end: Last index (inclusive)
+            workers: Process count for large ranges (``None`` for all CPUs)
+
+        Returns:
+            RThetaTable: Table whose entries equal ``r_theta(n)`` exactly
+
+        Raises:
+            ValueError: If start is less than 1
+        """
+        if start < 1:
+            raise ValueError("start must be >= 1")
+        parts: list[Any] = map_range(
+            _r_theta_columns, start, end, resolve_workers(workers)
+        )
+        rs = concat_columns([r for r, _ in parts])
+        thetas = concat_columns([t for _, t in parts])
+        return cls(FieldBuffer(rs, thetas, start, ROOT_SCALE))
+
+    @classmethod
+    def load(cls, path: str, verify: bool = True) -> RThetaTable:
+        """
+        Open the table stored at *path* (memory-mapped with NumPy).
+
+        Args:
+            path: File written by :meth:`save`
+            verify: Check sampled entries against ``r_theta``
+
+        Returns:
+            RThetaTable: The loaded table
+
+        Raises:
+            ValueError: If the file is not a float64 r/θ table for the current
+                scale, or its entries do not match ``r_theta``
+        """
+        header = read_field_header(path)
+        if header.kind != "r_theta" or header.dtype != "float64":
+            raise ValueError("field file does not hold a float64 r/θ table")
+        if header.a != ROOT_SCALE:
+            raise ValueError(
+                f"r/θ table scale {header.a} does not match ROOT_SCALE {ROOT_SCALE}"
+            )
+        table = cls(open_field(path))
+        if verify:
+            table.verify()
+        return table
+
+    def save(self, path: str) -> FieldHeader:
+        """Write the table to *path* as an ``"r_theta"`` field file."""
+        return write_field(path, self.columns, kind="r_theta")
+
+    def verify(self, samples: int = _VERIFY_SAMPLES) -> None:
+        """
+        Compare evenly spaced entries (including both ends) with ``r_theta``.
+
+        Raises:
+            ValueError: If any sampled entry differs
+        """
+        count = len(self)
+        if not count:
+            return
+        step = max(1, (count - 1) // max(samples - 1, 1))
+        offsets = {*range(0, count, step), count - 1}
+        for n in sorted(offset + self.start for offset in offsets):
+            if self.lookup(n) != tuple(map(float, r_theta(n))):
+                raise ValueError(f"r/θ table entry {n} does not match r_theta")
+
+    # -- lookups -----------------------------------------------------------
+
+    @property
+    def start(self) -> int:
+        """First index in the table."""
+        return self.columns.start
+
+    @property
+    def end(self) -> int:
+        """Last index in the table (``start - 1`` when empty)."""
+        return self.columns.end
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the two columns."""
+        return self.columns.nbytes
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def covers(self, start: int, end: int) -> bool:
+        """Whether every index of [start, end] is in the table."""
+        return end < start or (self.start <= start and end <= self.end)
+
+    def lookup(self, n: int) -> tuple[float, float]:
+        """
+        Return ``(r, θ)`` for index *n*.
+
+        Raises:
+            IndexError: If *n* is outside the table
+        """
+        return self.columns.point(n)
+
+    def pairs(self, start: int, end: int) -> Iterator[tuple[float, float]]:
+        """
+        Iterate ``(r, θ)`` for [start, end] in index order.
+
+        Raises:
+            IndexError: If the range is not covered by the table
+        """
+        if not self.covers(start, end):
+            raise IndexError(
+                f"range [{start}, {end}] outside [{self.start}, {self.end}]"
+            )
+        i = start - self.start
+        j = max(i + end - start + 1, i)
+        return zip(self.columns.xs[i:j].tolist(), self.columns.ys[i:j].tolist())
+
+    def __repr__(self) -> str:
+        return f"RThetaTable(start={self.start}, end={self.end})"
@@ -6,6 +6,46 @@ This module implements the mathematical relationships described in the
 angular progression based on the golden angle.
 """
 
-from .core import angle, golden_angle, position, radius
+from .batch import positions, positions_array
+from .buffer import FieldBuffer, FieldSink, RawFieldSink
+from .cache import FieldCache
+from .core import (
+    angle,
+    golden_angle,
+    index_range_for_radius,
+    nearest_index,
+    position,
+    radius,
+)
+from .fieldfile import (
+    FieldFileSink,
+    FieldHeader,
+    open_field,
+    read_field_header,
+    write_field,
+)
+from .raster import DensityGrid, rasterize
+from .spatial import FieldIndex
 
-__all__ = ["golden_angle", "radius", "angle", "position"]
+__all__ = [
+    "golden_angle",
+    "radius",
+    "angle",
+    "position",
+    "index_range_for_radius",
+    "nearest_index",
+    "positions",
+    "positions_array",
+    "FieldBuffer",
+    "FieldSink",
+    "RawFieldSink",
+    "FieldIndex",
+    "FieldCache",
+    "FieldHeader",
+    "FieldFileSink",
+    "write_field",
+    "open_field",
+    "read_field_header",
+    "DensityGrid",
+    "rasterize",
+]
@@ -0,0 +1,178 @@
+"""
+Recursive Field: Batch evaluation of phyllotaxis positions.
+
+Vectorised counterparts of :func:`~.core.position` that evaluate a whole
+index range in one pass and return contiguous x/y columns instead of a list
+of tuples.  NumPy is used when it is importable; otherwise the columns are
+``array('d')`` buffers filled by a tight pure-Python loop, so the package
+keeps zero hard runtime dependencies.
+
+Columns can also be produced as float32 (``dtype="float32"``), halving their
+memory and I/O size.  Positions are still evaluated in float64 and rounded
+once on store, so each coordinate is the float64 value rounded to the
+nearest float32: the error is at most 2⁻²⁴ of the coordinate's magnitude,
+i.e. ``|Δx|, |Δy| ≤ 2⁻²⁴ · a√n`` (about 5.7e-4 at n = 10⁷ with a = 3, or
+1e-4 of the spacing between neighbouring points).  Angles are reduced
+modulo 360° in float64 before the cast, so the error does not grow with n
+beyond the radius factor.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from typing import Any, Iterable
+
+from .constants import DEG_TO_RAD, GOLDEN_ANGLE_DEG
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None
+
+# A float column: ``numpy.ndarray`` when NumPy is available, else ``array('d')``
+# (``array('f')`` for float32)
+Column = Any
+
+# Supported column element types and their ``array`` typecodes
+DTYPES = {"float64": "d", "float32": "f"}
+
+# Indices per NumPy pass; bounds scratch memory to a few blocks regardless
+# of the total range length
+_BLOCK = 1 << 20
+
+
+def check_dtype(dtype: str) -> str:
+    """
+    Validate a column dtype name.
+
+    Raises:
+        ValueError: If dtype is not "float64" or "float32"
+    """
+    if dtype not in DTYPES:
+        raise ValueError("dtype must be 'float64' or 'float32'")
+    return dtype
+
+
+def _empty_columns(dtype: str = "float64") -> tuple[Column, Column]:
+    if np is not None:
+        return np.empty(0, dtype=dtype), np.empty(0, dtype=dtype)
+    return array(DTYPES[dtype]), array(DTYPES[dtype])
+
+
+def _positions_numpy(n: Any, a: float, x: Any, y: Any) -> None:
+    """Evaluate positions for a float64 index array into *x* and *y*.
+
+    The index array is consumed (reused as scratch space for theta).
+    """
+    # Same operation order as core.position: r = a*sqrt(n),
+    # theta = radians((n * ga) % 360), x = r*cos, y = r*sin
+    r = np.sqrt(n)
+    r *= a
+    theta = n
+    theta *= GOLDEN_ANGLE_DEG
+    np.mod(theta, 360.0, out=theta)
+    theta *= DEG_TO_RAD
+    np.cos(theta, out=x)
+    x *= r
+    np.sin(theta, out=y)
+    y *= r
+
+
+def _positions_python(
+    indices: Iterable[int], a: float, dtype: str = "float64"
+) -> tuple[Column, Column]:
+    """Pure-Python fallback producing ``array('d')`` (or ``array('f')``) columns."""
+    xs: array[float] = array(DTYPES[dtype])
+    ys: array[float] = array(DTYPES[dtype])
+    sqrt, cos, sin = math.sqrt, math.cos, math.sin
+    ga, d2r = GOLDEN_ANGLE_DEG, DEG_TO_RAD
+    for n in indices:
+        r = a * sqrt(n)
+        theta = ((n * ga) % 360.0) * d2r
+        xs.append(r * cos(theta))
+        ys.append(r * sin(theta))
+    return xs, ys
+
+
+def positions(
+    start: int, end: int, a: float = 3.0, dtype: str = "float64"
+) -> tuple[Column, Column]:
+    """
+    Calculate Cartesian positions for the inclusive index range [start, end].
+
+    Args:
+        start: First index (must be positive)
+        end: Last index (inclusive)
+        a: Scale factor (default: 3.0)
+        dtype: Column type, ``"float64"`` or ``"float32"`` (default: float64)
+
+    Returns:
+        tuple: ``(xs, ys)`` columns of length ``end - start + 1`` (empty when
+        ``end < start``)
+
+    Raises:
+        ValueError: If the range is non-empty and start is not positive, or
+            dtype is unknown
+    """
+    check_dtype(dtype)
+    if end < start:
+        return _empty_columns(dtype)
+    if start <= 0:
+        raise ValueError("Index n must be positive")
+    if np is not None:
+        count = end - start + 1
+        xs = np.empty(count, dtype=dtype)
+        ys = np.empty(count, dtype=dtype)
+        narrow = dtype != "float64"
+        if narrow:
+            # float64 scratch block, rounded once into the output columns
+            bx = np.empty(min(count, _BLOCK), dtype=np.float64)
+            by = np.empty_like(bx)
+        for lo in range(0, count, _BLOCK):
+            hi = min(lo + _BLOCK, count)
+            n = np.arange(start + lo, start + hi, dtype=np.float64)
+            if narrow:
+                _positions_numpy(n, a, bx[: hi - lo], by[: hi - lo])
+                xs[lo:hi] = bx[: hi - lo]
+                ys[lo:hi] = by[: hi - lo]
+            else:
+                _positions_numpy(n, a, xs[lo:hi], ys[lo:hi])
+        return xs, ys
+    return _positions_python(range(start, end + 1), a, dtype)
+
+
+def positions_array(
+    indices: Iterable[int], a: float = 3.0, dtype: str = "float64"
+) -> tuple[Column, Column]:
+    """
+    Calculate Cartesian positions for an arbitrary collection of indices.
+
+    Args:
+        indices: Iterable (or integer array) of positive indices
+        a: Scale factor (default: 3.0)
+        dtype: Column type, ``"float64"`` or ``"float32"`` (default: float64)
+
+    Returns:
+        tuple: ``(xs, ys)`` columns in the order of *indices*
+
+    Raises:
+        ValueError: If any index is not positive, or dtype is unknown
+    """
+    check_dtype(dtype)
+    if np is not None:
+        if not hasattr(indices, "__len__"):
+            indices = list(indices)
+        n = np.array(indices, dtype=np.float64).ravel()
+        if n.size and n.min() <= 0:
+            raise ValueError("Index n must be positive")
+        xs = np.empty_like(n)
+        ys = np.empty_like(n)
+        _positions_numpy(n, a, xs, ys)
+        if dtype != "float64":
+            return xs.astype(dtype), ys.astype(dtype)
+        return xs, ys
+    idx = list(indices)
+    if idx and min(idx) <= 0:
+        raise ValueError("Index n must be positive")
+    return _positions_python(idx, a, dtype)
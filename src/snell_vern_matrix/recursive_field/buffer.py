@@ -0,0 +1,184 @@
+"""
+Recursive Field: Columnar storage for computed phyllotaxis fields.
+
+A :class:`FieldBuffer` holds the positions of a contiguous index range as two
+float columns plus the range metadata, costing 16 bytes per point instead of
+the ~100+ bytes of a ``list[tuple[float, float]]``.  It behaves as a read-only
+sequence of ``(x, y)`` tuples, so existing callers keep working; tuples are
+only created for the elements actually accessed, and :meth:`FieldBuffer.to_list`
+materialises the full tuple list on demand.
+
+Large ranges can be streamed chunk-by-chunk into any :class:`FieldSink`;
+:class:`RawFieldSink` writes chunks straight to a binary stream such as a
+file or a socket's ``makefile("wb")``.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator, Sequence
+from typing import Any, BinaryIO, Protocol, overload
+
+from .batch import Column, positions
+
+
+class FieldBuffer(Sequence[tuple[float, float]]):
+    """
+    Columnar (x, y) buffer for the inclusive index range [start, end].
+
+    Args:
+        xs: Column of x coordinates (``numpy.ndarray`` or ``array``)
+        ys: Column of y coordinates, same length as *xs*
+        start: Field index of the first element (default: 1)
+        a: Scale factor the positions were computed with (default: 3.0)
+
+    Raises:
+        ValueError: If the columns differ in length
+    """
+
+    __slots__ = ("xs", "ys", "start", "a")
+
+    def __init__(self, xs: Column, ys: Column, start: int = 1, a: float = 3.0):
+        if len(xs) != len(ys):
+            raise ValueError("x and y columns must have the same length")
+        self.xs = xs
+        self.ys = ys
+        self.start = start
+        self.a = a
+
+    @classmethod
+    def compute(
+        cls, start: int, end: int, a: float = 3.0, dtype: str = "float64"
+    ) -> FieldBuffer:
+        """Compute the positions for [start, end] into a new buffer."""
+        xs, ys = positions(start, end, a, dtype)
+        return cls(xs, ys, start, a)
+
+    @classmethod
+    def empty(
+        cls, start: int = 1, a: float = 3.0, dtype: str = "float64"
+    ) -> FieldBuffer:
+        """Return a buffer holding no points."""
+        return cls.compute(start, start - 1, a, dtype)
+
+    # -- range metadata ----------------------------------------------------
+
+    @property
+    def end(self) -> int:
+        """Field index of the last element (``start - 1`` when empty)."""
+        return self.start + len(self.xs) - 1
+
+    @property
+    def dtype(self) -> str:
+        """Element type of the columns (``"float64"`` or ``"float32"``)."""
+        if isinstance(self.xs, array):
+            return "float32" if self.xs.typecode == "f" else "float64"
+        return str(self.xs.dtype)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the two columns."""
+        return 2 * len(self.xs) * self.xs.itemsize
+
+    def point(self, n: int) -> tuple[float, float]:
+        """
+        Return the position stored for field index *n*.
+
+        Raises:
+            IndexError: If *n* lies outside [start, end]
+        """
+        if not self.start <= n <= self.end:
+            raise IndexError(f"field index {n} outside [{self.start}, {self.end}]")
+        i = n - self.start
+        return (float(self.xs[i]), float(self.ys[i]))
+
+    # -- sequence protocol -------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    @overload
+    def __getitem__(self, i: int) -> tuple[float, float]: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> FieldBuffer: ...
+
+    def __getitem__(self, i: Any) -> Any:
+        # Contiguous slices are sub-buffers; stepped slices cannot keep the
+        # contiguous index layout and fall back to a list of pairs
+        if isinstance(i, slice):
+            lo, hi, step = i.indices(len(self.xs))
+            if step != 1:
+                return [self[j] for j in range(lo, hi, step)]
+            hi = max(hi, lo)
+            return FieldBuffer(self.xs[lo:hi], self.ys[lo:hi], self.start + lo, self.a)
+        return (float(self.xs[i]), float(self.ys[i]))
+
+    def __iter__(self) -> Iterator[tuple[float, float]]:
+        return zip(map(float, self.xs), map(float, self.ys))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FieldBuffer):
+            return (
+                self.start == other.start
+                and len(self) == len(other)
+                and list(self) == list(other)
+            )
+        if isinstance(other, Sequence):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"FieldBuffer(start={self.start}, end={self.end}, "
+            f"a={self.a}, dtype={self.dtype})"
+        )
+
+    def copy(self) -> FieldBuffer:
+        """Buffer holding its own copies of the columns."""
+        xs, ys = self.xs, self.ys
+        if isinstance(xs, array):
+            return FieldBuffer(xs[:], ys[:], self.start, self.a)
+        return FieldBuffer(xs.copy(), ys.copy(), self.start, self.a)
+
+    def to_list(self) -> list[tuple[float, float]]:
+        """Materialise the buffer as a list of ``(x, y)`` tuples."""
+        return list(zip(self.xs.tolist(), self.ys.tolist()))
+
+    def tobytes(self) -> bytes:
+        """Return the points as interleaved native-endian ``x, y`` values."""
+        if isinstance(self.xs, array):
+            pairs = array(self.xs.typecode, bytes(self.nbytes))
+            pairs[0::2] = self.xs
+            pairs[1::2] = self.ys
+            return pairs.tobytes()
+        import numpy as np
+
+        return np.column_stack((self.xs, self.ys)).tobytes()
+
+
+class FieldSink(Protocol):
+    """Destination for streamed field chunks."""
+
+    def write(self, chunk: FieldBuffer) -> None:
+        """Consume one chunk of consecutive field positions."""
+        ...
+
+
+class RawFieldSink:
+    """
+    Field sink writing chunks to a binary stream as interleaved ``x, y`` pairs.
+
+    Args:
+        stream: Writable binary stream (file, ``socket.makefile("wb")``, ...)
+    """
+
+    def __init__(self, stream: BinaryIO) -> None:
+        self.stream = stream
+        self.points_written = 0
+
+    def write(self, chunk: FieldBuffer) -> None:
+        self.stream.write(chunk.tobytes())
+        self.points_written += len(chunk)
@@ -0,0 +1,239 @@
+"""
+Recursive Field: Incremental range cache for computed fields.
+
+Pipelines tend to request growing (``1..N`` then ``1..N+k``) or sliding
+(``i..j`` then ``i+k..j+k``) index ranges.  :class:`FieldCache` keeps each
+computed range as a growable segment and, for a request overlapping or
+adjoining a segment, evaluates only the missing indices at either end.
+Requests are answered with :class:`FieldBuffer` views onto the segment, so
+with NumPy a window that moves by k indices costs O(k) amortised; the view
+columns are read-only so that no caller can alter what later requests see.
+
+Segments over-allocate like a list (up to about twice their live size) so
+that repeated extension does not copy the whole range each time.  The byte
+budget counts allocated storage, slack included; when it is exceeded the
+least recently used segments are evicted first, then the active segment is
+trimmed to the requested range, releasing its storage once most of it is
+dead.  A requested range that alone exceeds the budget is served but not
+kept.  The cache is thread-safe; concurrent requests are serialised.
+"""
+
+from __future__ import annotations
+
+import threading
+from array import array
+from collections.abc import Callable
+from typing import Any
+
+from .batch import Column, check_dtype, positions
+from .buffer import FieldBuffer
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None
+
+# Default storage budget: 16 Mi points of float64 x/y
+DEFAULT_CACHE_BYTES = 256 << 20
+
+
+def _alloc_like(col: Column, capacity: int) -> Column:
+    """Uninitialised column of *capacity* elements, same type as *col*."""
+    if isinstance(col, array):
+        return array(col.typecode, bytes(col.itemsize * capacity))
+    return np.empty(capacity, dtype=col.dtype)
+
+
+class _Segment:
+    """A contiguous computed range held at ``[head, head + count)`` of its columns."""
+
+    __slots__ = ("xs", "ys", "head", "start", "count")
+
+    def __init__(self, xs: Column, ys: Column, start: int):
+        self.xs = xs
+        self.ys = ys
+        self.head = 0
+        self.start = start
+        self.count = len(xs)
+
+    @property
+    def end(self) -> int:
+        return self.start + self.count - 1
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes allocated for both columns, including slack."""
+        return len(self.xs) * self.xs.itemsize + len(self.ys) * self.ys.itemsize
+
+    def view(self, start: int, end: int, a: float) -> FieldBuffer:
+        i = self.head + start - self.start
+        j = i + end - start + 1
+        xs, ys = self.xs[i:j], self.ys[i:j]
+        if not isinstance(xs, array):
+            # NumPy slices share the segment's storage; array slices are copies
+            xs.flags.writeable = False
+            ys.flags.writeable = False
+        return FieldBuffer(xs, ys, start, a)
+
+    def append(self, xs: Column, ys: Column) -> None:
+        k = len(xs)
+        tail = self.head + self.count
+        if tail + k > len(self.xs):
+            self._reallocate(0, k)
+            tail = self.head + self.count
+        self.xs[tail : tail + k] = xs
+        self.ys[tail : tail + k] = ys
+        self.count += k
+
+    def prepend(self, xs: Column, ys: Column) -> None:
+        k = len(xs)
+        if k > self.head:
+            self._reallocate(k, 0)
+        self.head -= k
+        self.xs[self.head : self.head + k] = xs
+        self.ys[self.head : self.head + k] = ys
+        self.start -= k
+        self.count += k
+
+    def trim(self, start: int, end: int) -> None:
+        """Drop points outside [start, end], shrinking storage that is mostly dead."""
+        lo = max(start, self.start) - self.start
+        hi = min(end, self.end) - self.start + 1
+        self.head += lo
+        self.start += lo
+        self.count = max(hi - lo, 0)
+        if 2 * self.count < len(self.xs):
+            self._reallocate(0, 0)
+
+    def _reallocate(self, front: int, back: int) -> None:
+        # Slack equal to the live size on the growing side(s) amortises
+        # copies; with neither side growing the storage fits the live range
+        slack = self.count + front + back
+        head = front + (slack if front else 0)
+        capacity = head + self.count + back + (slack if back else 0)
+        xs, ys = _alloc_like(self.xs, capacity), _alloc_like(self.ys, capacity)
+        lo, hi = self.head, self.head + self.count
+        xs[head : head + self.count] = self.xs[lo:hi]
+        ys[head : head + self.count] = self.ys[lo:hi]
+        self.xs, self.ys, self.head = xs, ys, head
+
+
+class FieldCache:
+    """
+    Cache of computed field ranges, extended incrementally.
+
+    Args:
+        max_bytes: Budget for allocated column storage (16 bytes per point
+            for float64, 8 for float32, slack included; default: 256 MiB);
+            ranges larger than this are not cached.  ``None`` disables
+            eviction
+        a: Scale factor of the cached positions (default: 3.0)
+        compute: ``compute(lo, hi) -> (xs, ys)`` used for missing indices,
+            returning columns of *dtype* (default: :func:`~.batch.positions`
+            with *a* and *dtype*)
+        dtype: Column type, ``"float64"`` or ``"float32"`` (default: float64)
+    """
+
+    def __init__(
+        self,
+        max_bytes: int | None = DEFAULT_CACHE_BYTES,
+        a: float = 3.0,
+        compute: Callable[[int, int], tuple[Column, Column]] | None = None,
+        dtype: str = "float64",
+    ):
+        self.max_bytes = max_bytes
+        self.a = a
+        self.dtype = check_dtype(dtype)
+        self._compute = compute or (lambda lo, hi: positions(lo, hi, a, dtype))
+        # Least recently used first
+        self._segments: list[_Segment] = []
+        self.points_computed = 0
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes allocated by cached segments, including slack."""
+        with self._lock:
+            return self._nbytes_unlocked()
+
+    def _nbytes_unlocked(self) -> int:
+        return sum(seg.nbytes for seg in self._segments)
+
+    def ranges(self) -> list[tuple[int, int]]:
+        """Cached ``(start, end)`` ranges in ascending index order."""
+        with self._lock:
+            segments = list(self._segments)
+        return sorted((seg.start, seg.end) for seg in segments if seg.count)
+
+    def clear(self) -> None:
+        """Drop every cached range."""
+        with self._lock:
+            self._segments = []
+
+    def get(self, start: int, end: int) -> FieldBuffer:
+        """
+        Return the positions for [start, end], computing only missing indices.
+
+        Args:
+            start: First index (must be positive)
+            end: Last index (inclusive)
+
+        Returns:
+            FieldBuffer view of the cached range
+        """
+        if end < start:
+            return FieldBuffer.empty(start, self.a, self.dtype)
+        with self._lock:
+            return self._get_unlocked(start, end)
+
+    def _get_unlocked(self, start: int, end: int) -> FieldBuffer:
+        seg = self._find(start, end)
+        if seg is None:
+            xs, ys = self._run(start, end)
+            seg = _Segment(xs, ys, start)
+        else:
+            # Compute both missing ends before mutating, so a failure leaves
+            # the cache untouched
+            front = self._run(start, seg.start - 1) if start < seg.start else None
+            back = self._run(seg.end + 1, end) if end > seg.end else None
+            if front is not None:
+                seg.prepend(*front)
+            if back is not None:
+                seg.append(*back)
+            self._segments = [
+                s
+                for s in self._segments
+                if not (seg.start <= s.start and s.end <= seg.end)
+            ]
+        self._segments.append(seg)
+        self._evict(seg, start, end)
+        return seg.view(start, end, self.a)
+
+    def _run(self, lo: int, hi: int) -> tuple[Column, Column]:
+        xs, ys = self._compute(lo, hi)
+        self.points_computed += hi - lo + 1
+        return xs, ys
+
+    def _find(self, start: int, end: int) -> _Segment | None:
+        """Segment overlapping or adjoining [start, end] with the largest overlap."""
+        best: Any = None
+        best_overlap = -1
+        for seg in self._segments:
+            if seg.count and start <= seg.end + 1 and seg.start - 1 <= end:
+                overlap = min(end, seg.end) - max(start, seg.start) + 1
+                if overlap > best_overlap:
+                    best, best_overlap = seg, overlap
+        return best
+
+    def _evict(self, active: _Segment, start: int, end: int) -> None:
+        if self.max_bytes is None:
+            return
+        point_bytes = active.xs.itemsize + active.ys.itemsize
+        if (end - start + 1) * point_bytes > self.max_bytes:
+            # Too large to keep even trimmed: serve it without caching
+            self._segments.remove(active)
+            return
+        while self._nbytes_unlocked() > self.max_bytes and len(self._segments) > 1:
+            self._segments.pop(0)
+        if self._nbytes_unlocked() > self.max_bytes:
+            active.trim(start, end)
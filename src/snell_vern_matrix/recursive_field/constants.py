@@ -0,0 +1,21 @@
+"""
+Recursive Field: Precomputed golden-angle constants.
+
+Shared by the field, memory proximity and ternary balance code so that hot
+loops read module constants instead of recomputing square roots, degree
+conversions and fixed cosines on every call.
+"""
+
+from __future__ import annotations
+
+import math
+
+# Golden angle θ = 180° × (3 − √5) ≈ 137.508°
+GOLDEN_ANGLE_DEG = 180.0 * (3.0 - math.sqrt(5.0))
+GOLDEN_ANGLE_RAD = math.radians(GOLDEN_ANGLE_DEG)
+# Same factor as math.radians, so x * DEG_TO_RAD == math.radians(x)
+DEG_TO_RAD = math.pi / 180.0
+
+# Ternary projections: the golden angle and its double
+COS_GOLDEN = math.cos(GOLDEN_ANGLE_RAD)
+COS_2GOLDEN = math.cos(2.0 * GOLDEN_ANGLE_RAD)
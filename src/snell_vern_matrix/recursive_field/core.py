@@ -8,6 +8,8 @@ angular progression based on the golden angle.
 
 import math
 
+from .constants import DEG_TO_RAD, GOLDEN_ANGLE_DEG
+
 
 def golden_angle() -> float:
     """
@@ -19,7 +21,7 @@ def golden_angle() -> float:
     Returns:
         float: The golden angle in degrees
     """
-    return 180.0 * (3.0 - math.sqrt(5.0))
+    return GOLDEN_ANGLE_DEG
 
 
 def radius(n: int, a: float = 3.0) -> float:
@@ -51,8 +53,7 @@ def angle(n: int) -> float:
     Returns:
         float: The angle in degrees, θ_n = n * φ (mod 360)
     """
-    phi = golden_angle()
-    return (n * phi) % 360.0
+    return (n * GOLDEN_ANGLE_DEG) % 360.0
 
 
 def position(n: int, a: float = 3.0) -> tuple[float, float]:
@@ -71,7 +72,76 @@ def position(n: int, a: float = 3.0) -> tuple[float, float]:
     """
     r = radius(n, a)
     theta_deg = angle(n)
-    theta_rad = math.radians(theta_deg)
+    theta_rad = theta_deg * DEG_TO_RAD
     x = r * math.cos(theta_rad)
     y = r * math.sin(theta_rad)
     return (x, y)
+
+
+def index_range_for_radius(
+    r_min: float, r_max: float, a: float = 3.0
+) -> tuple[int, int]:
+    """
+    Calculate the index band whose radii fall inside an annulus.
+
+    Because radius(n) = a * sqrt(n) is monotonic, the indices with
+    r_min <= radius(n) <= r_max form one contiguous range, found in O(1).
+
+    Args:
+        r_min: Inner radius of the annulus
+        r_max: Outer radius of the annulus
+        a: Scale factor (default: 3.0)
+
+    Returns:
+        tuple: Inclusive ``(n_lo, n_hi)`` with n_lo >= 1; empty when
+        n_hi < n_lo
+
+    Raises:
+        ValueError: If a is not positive
+    """
+    if a <= 0:
+        raise ValueError("Scale factor a must be positive")
+    n_lo = max(1, math.ceil((max(r_min, 0.0) / a) ** 2))
+    n_hi = math.floor((max(r_max, 0.0) / a) ** 2)
+    # Settle rounding so the band agrees exactly with radius()
+    while radius(n_lo, a) < r_min:
+        n_lo += 1
+    while n_lo > 1 and radius(n_lo - 1, a) >= r_min:
+        n_lo -= 1
+    while n_hi >= 1 and radius(n_hi, a) > r_max:
+        n_hi -= 1
+    while radius(n_hi + 1, a) <= r_max:
+        n_hi += 1
+    return n_lo, n_hi
+
+
+def nearest_index(x: float, y: float, a: float = 3.0) -> int:
+    """
+    Find the index whose position is nearest to a point.
+
+    Only the radius band around the point's own radius is scanned, widening
+    once if the best candidate found lies outside the initial band, so the
+    cost grows with sqrt(n) rather than n.
+
+    Args:
+        x: Query x coordinate
+        y: Query y coordinate
+        a: Scale factor (default: 3.0)
+
+    Returns:
+        int: The nearest index (ties resolve to the smaller index)
+    """
+    rho = math.hypot(x, y)
+    width = 2.0 * a
+    while True:
+        n_lo, n_hi = index_range_for_radius(rho - width, rho + width, a)
+        best_n, best_d = 0, math.inf
+        for n in range(n_lo, n_hi + 1):
+            px, py = position(n, a)
+            d = math.hypot(px - x, py - y)
+            if d < best_d:
+                best_n, best_d = n, d
+        # Any closer point must have a radius within rho ± best_d
+        if best_n and best_d <= width:
+            return best_n
+        width = max(best_d, 2.0 * width) if best_n else 2.0 * width
@@ -0,0 +1,252 @@
+"""
+Recursive Field: Memory-mapped binary field files.
+
+A field file is a fixed 64-byte little-endian header followed by two raw
+columns, so a computed field can be shared between processes without
+re-computing or re-parsing it::
+
+    offset  size  field
+    0       8     magic  b"SVFIELD\\0"
+    8       2     format version (1)
+    10      1     kind   (0 = x/y positions, 1 = r/θ values)
+    11      1     dtype  (0 = float64, 1 = float32)
+    16      8     a      scale factor (float64)
+    24      8     start  first field index (int64)
+    32      8     end    last field index, inclusive (int64)
+    64      ...   first column (x or r), then second column (y or θ)
+
+Columns are stored back to back rather than interleaved so that
+:func:`open_field` can hand out NumPy views straight onto the mapped pages.
+Without NumPy the columns are copied into ``array`` objects instead.
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+import sys
+from array import array
+from dataclasses import dataclass
+from typing import Any, BinaryIO
+
+from .batch import Column
+from .buffer import FieldBuffer
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None
+
+MAGIC = b"SVFIELD\x00"
+VERSION = 1
+HEADER_SIZE = 64
+
+_HEADER = struct.Struct("<8sHBB4xdqq24x")
+_KINDS = ("xy", "r_theta")
+_DTYPES = ("float64", "float32")
+_TYPECODES = {"float64": "d", "float32": "f"}
+
+
+@dataclass(frozen=True)
+class FieldHeader:
+    """Metadata stored at the start of a field file."""
+
+    kind: str
+    dtype: str
+    a: float
+    start: int
+    end: int
+
+    @property
+    def count(self) -> int:
+        """Number of points in the file."""
+        return max(self.end - self.start + 1, 0)
+
+    @property
+    def itemsize(self) -> int:
+        """Bytes per column element."""
+        return 8 if self.dtype == "float64" else 4
+
+    def pack(self) -> bytes:
+        """Encode the header as its on-disk bytes."""
+        return _HEADER.pack(
+            MAGIC,
+            VERSION,
+            _KINDS.index(self.kind),
+            _DTYPES.index(self.dtype),
+            self.a,
+            self.start,
+            self.end,
+        )
+
+    @classmethod
+    def unpack(cls, data: bytes) -> FieldHeader:
+        """
+        Decode a header from its on-disk bytes.
+
+        Raises:
+            ValueError: If the bytes are not a supported field file header
+        """
+        if len(data) < HEADER_SIZE:
+            raise ValueError("truncated field file header")
+        magic, version, kind, dtype, a, start, end = _HEADER.unpack(data[:HEADER_SIZE])
+        if magic != MAGIC:
+            raise ValueError("not a field file")
+        if version != VERSION:
+            raise ValueError(f"unsupported field file version {version}")
+        if kind >= len(_KINDS) or dtype >= len(_DTYPES):
+            raise ValueError("corrupt field file header")
+        return cls(_KINDS[kind], _DTYPES[dtype], a, start, end)
+
+
+def _check_kind(kind: str) -> None:
+    if kind not in _KINDS:
+        raise ValueError(f"kind must be one of {_KINDS}")
+
+
+def _le_column(col: Column, dtype: str) -> Any:
+    """Return *col* as a contiguous little-endian buffer, copying only if needed."""
+    if isinstance(col, array):
+        if sys.byteorder == "big":
+            col = array(col.typecode, col)
+            col.byteswap()
+        return col
+    return np.ascontiguousarray(col, dtype="<f8" if dtype == "float64" else "<f4")
+
+
+def write_field(path: str, field: FieldBuffer, kind: str = "xy") -> FieldHeader:
+    """
+    Write *field* to *path* in the binary field file format.
+
+    The header and both columns go out through one buffered stream without
+    an intermediate copy of the columns.
+
+    Args:
+        path: Destination file
+        field: Field columns to store (x/y, or r/θ for ``kind="r_theta"``)
+        kind: ``"xy"`` or ``"r_theta"``
+
+    Returns:
+        FieldHeader: The header that was written
+    """
+    _check_kind(kind)
+    header = FieldHeader(kind, field.dtype, field.a, field.start, field.end)
+    with open(path, "wb") as fh:
+        fh.write(header.pack())
+        fh.write(_le_column(field.xs, header.dtype))
+        fh.write(_le_column(field.ys, header.dtype))
+    return header
+
+
+def read_field_header(path: str) -> FieldHeader:
+    """Read only the header of the field file at *path*."""
+    with open(path, "rb") as fh:
+        return FieldHeader.unpack(fh.read(HEADER_SIZE))
+
+
+def open_field(path: str) -> FieldBuffer:
+    """
+    Open the field file at *path* as a :class:`FieldBuffer`.
+
+    With NumPy the columns are read-only views onto a shared ``mmap`` of the
+    file, so opening costs no copy and pages are loaded lazily by the OS;
+    several processes opening the same file share one page-cache copy.
+    Without NumPy the columns are read into ``array`` objects.
+
+    Raises:
+        ValueError: If the file is not a field file or is truncated
+    """
+    with open(path, "rb") as fh:
+        header = FieldHeader.unpack(fh.read(HEADER_SIZE))
+        size = header.count * header.itemsize
+        fh.seek(0, 2)
+        if fh.tell() < HEADER_SIZE + 2 * size:
+            raise ValueError("truncated field file")
+        if np is None:
+            fh.seek(HEADER_SIZE)
+            xs = _read_column(fh, header)
+            ys = _read_column(fh, header)
+        elif size == 0:
+            xs = ys = np.empty(0, dtype=header.dtype)
+        else:
+            mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            dtype = np.dtype("<f8" if header.dtype == "float64" else "<f4")
+            xs = np.frombuffer(mapped, dtype, header.count, HEADER_SIZE)
+            ys = np.frombuffer(mapped, dtype, header.count, HEADER_SIZE + size)
+    return FieldBuffer(xs, ys, header.start, header.a)
+
+
+def _read_column(fh: BinaryIO, header: FieldHeader) -> array:
+    col = array(_TYPECODES[header.dtype])
+    col.frombytes(fh.read(header.count * header.itemsize))
+    if sys.byteorder == "big":
+        col.byteswap()
+    return col
+
+
+class FieldFileSink:
+    """
+    Field sink writing streamed chunks into a preallocated field file.
+
+    The file is sized for [start, end] up front and each chunk is written at
+    its own column offsets, so ``DriveMatrix.stream_field`` can produce a
+    field file of any size while holding only one chunk in memory.
+
+    Args:
+        path: Destination file
+        start: First field index that will be written
+        end: Last field index (inclusive)
+        a: Scale factor recorded in the header (default: 3.0)
+        dtype: Column type, ``"float64"`` or ``"float32"`` (default: float64)
+        kind: ``"xy"`` or ``"r_theta"``
+    """
+
+    def __init__(
+        self,
+        path: str,
+        start: int,
+        end: int,
+        a: float = 3.0,
+        dtype: str = "float64",
+        kind: str = "xy",
+    ) -> None:
+        _check_kind(kind)
+        if dtype not in _DTYPES:
+            raise ValueError(f"dtype must be one of {_DTYPES}")
+        self.header = FieldHeader(kind, dtype, a, start, end)
+        self.points_written = 0
+        self._fh = open(path, "wb")
+        self._fh.write(self.header.pack())
+        self._fh.truncate(HEADER_SIZE + 2 * self.header.count * self.header.itemsize)
+
+    def write(self, chunk: FieldBuffer) -> None:
+        header = self.header
+        if chunk.start < header.start or chunk.end > header.end:
+            raise ValueError(
+                f"chunk [{chunk.start}, {chunk.end}] outside "
+                f"[{header.start}, {header.end}]"
+            )
+        offset = (chunk.start - header.start) * header.itemsize
+        column_size = header.count * header.itemsize
+        self._fh.seek(HEADER_SIZE + offset)
+        self._fh.write(_le_column(_cast(chunk.xs, header.dtype), header.dtype))
+        self._fh.seek(HEADER_SIZE + column_size + offset)
+        self._fh.write(_le_column(_cast(chunk.ys, header.dtype), header.dtype))
+        self.points_written += len(chunk)
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        self._fh.close()
+
+    def __enter__(self) -> FieldFileSink:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def _cast(col: Column, dtype: str) -> Column:
+    """Convert an ``array`` column to the file's element type if it differs."""
+    if isinstance(col, array) and col.typecode != _TYPECODES[dtype]:
+        return array(_TYPECODES[dtype], col)
+    return col
@@ -0,0 +1,148 @@
+"""
+Recursive Field: Multi-process evaluation of phyllotaxis index ranges.
+
+Field positions are independent per index, so a range can be split into
+contiguous spans, evaluated in a process pool, and reassembled in index
+order.  Each span runs the same element-wise kernel as the serial path, so
+the merged result is bit-for-bit identical to a single-process computation.
+"""
+
+from __future__ import annotations
+
+import os
+from array import array
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, TypeVar
+
+from .batch import Column, check_dtype, positions
+
+T = TypeVar("T")
+
+# Spans per worker; more than one keeps workers busy when spans finish unevenly
+_SPANS_PER_WORKER = 4
+# Smallest span worth shipping to another process
+_MIN_SPAN = 1 << 14
+
+
+def resolve_workers(workers: int | None) -> int:
+    """
+    Normalise a worker count.
+
+    Args:
+        workers: Requested process count, or ``None`` for all CPUs
+
+    Returns:
+        int: Worker count (at least 1)
+
+    Raises:
+        ValueError: If workers is less than 1
+    """
+    if workers is None:
+        return os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    return workers
+
+
+def split_range(start: int, end: int, parts: int) -> list[tuple[int, int]]:
+    """
+    Split the inclusive range [start, end] into contiguous spans.
+
+    Args:
+        start: First index
+        end: Last index (inclusive)
+        parts: Maximum number of spans
+
+    Returns:
+        list: Ordered ``(lo, hi)`` inclusive spans of near-equal length
+    """
+    count = end - start + 1
+    if count <= 0:
+        return []
+    parts = max(1, min(parts, count))
+    base, extra = divmod(count, parts)
+    spans = []
+    lo = start
+    for i in range(parts):
+        hi = lo + base + (1 if i < extra else 0) - 1
+        spans.append((lo, hi))
+        lo = hi + 1
+    return spans
+
+
+def map_range(
+    fn: Callable[[int, int], T], start: int, end: int, workers: int
+) -> list[T]:
+    """
+    Apply ``fn(lo, hi)`` over spans of [start, end] in a process pool.
+
+    *fn* must be picklable (a module-level function or a ``partial`` of one).
+
+    Returns:
+        list: Per-span results in index order
+    """
+    count = end - start + 1
+    parts = min(workers * _SPANS_PER_WORKER, max(1, count // _MIN_SPAN))
+    spans = split_range(start, end, parts)
+    if workers == 1 or len(spans) <= 1:
+        return [fn(lo, hi) for lo, hi in spans]
+    with ProcessPoolExecutor(max_workers=min(workers, len(spans))) as pool:
+        return list(pool.map(fn, *zip(*spans)))
+
+
+def concat_columns(columns: Sequence[Column]) -> Column:
+    """Concatenate float columns produced by the batch kernels."""
+    if columns and not isinstance(columns[0], array):
+        import numpy as np
+
+        return np.concatenate(columns)
+    out = array(columns[0].typecode if columns else "d")
+    for col in columns:
+        out.extend(col)
+    return out
+
+
+def _positions_span(
+    lo: int, hi: int, a: float, dtype: str = "float64"
+) -> tuple[Column, Column]:
+    return positions(lo, hi, a, dtype)
+
+
+def parallel_positions(
+    start: int,
+    end: int,
+    a: float = 3.0,
+    workers: int | None = None,
+    dtype: str = "float64",
+) -> tuple[Column, Column]:
+    """
+    Calculate positions for [start, end] across a pool of processes.
+
+    Args:
+        start: First index (must be positive)
+        end: Last index (inclusive)
+        a: Scale factor (default: 3.0)
+        workers: Process count (default: all CPUs)
+        dtype: Column type, ``"float64"`` or ``"float32"`` (default: float64)
+
+    Returns:
+        tuple: ``(xs, ys)`` columns identical to
+        ``positions(start, end, a, dtype)``
+    """
+    check_dtype(dtype)
+    if end < start:
+        return positions(start, end, a, dtype)
+    if start <= 0:
+        raise ValueError("Index n must be positive")
+    parts: list[Any] = map_range(
+        partial(_positions_span, a=a, dtype=dtype),
+        start,
+        end,
+        resolve_workers(workers),
+    )
+    return (
+        concat_columns([xs for xs, _ in parts]),
+        concat_columns([ys for _, ys in parts]),
+    )
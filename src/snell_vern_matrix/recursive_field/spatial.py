@@ -0,0 +1,154 @@
+"""
+Recursive Field: Spatial index over computed phyllotaxis fields.
+
+Answers "which field points lie within R of (x, y)" and "k nearest field
+indices to a point" without scanning the whole field.  Two properties of the
+pattern are exploited:
+
+- r = a√n is monotonic, so the points at distance ρ ± R from the origin form
+  a contiguous index band that can be computed directly;
+- the density is uniform (one point per π·a² of area), so a fixed grid of
+  cells a few spacings wide holds a near-constant number of points.
+
+With NumPy the index sorts point offsets by grid cell once, and a query
+touches only the cells overlapping the query disc.  Without NumPy, queries
+scan the radius band from the first property.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+from .buffer import FieldBuffer
+from .core import index_range_for_radius
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None
+
+
+class FieldIndex:
+    """
+    Neighbourhood index over a :class:`FieldBuffer`.
+
+    Args:
+        field: The field to index (its columns are referenced, not copied)
+        cell_size: Grid cell edge length (default: ``2 * field.a``, about four
+            points per cell)
+    """
+
+    def __init__(self, field: FieldBuffer, cell_size: float | None = None):
+        self.field = field
+        self.cell_size = cell_size if cell_size is not None else 2.0 * field.a
+        if self.cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self._order: Any = None
+        self._keys: Any = None
+        if np is not None and len(field):
+            self._build_grid()
+
+    def _build_grid(self) -> None:
+        xs = np.asarray(self.field.xs, dtype=np.float64)
+        ys = np.asarray(self.field.ys, dtype=np.float64)
+        c = self.cell_size
+        self._cx0 = int(math.floor(xs.min() / c))
+        self._cy0 = int(math.floor(ys.min() / c))
+        cx = np.floor(xs / c).astype(np.int64) - self._cx0
+        cy = np.floor(ys / c).astype(np.int64) - self._cy0
+        self._width = int(cx.max()) + 1
+        self._height = int(cy.max()) + 1
+        keys = cy * self._width + cx
+        order = np.argsort(keys, kind="stable")
+        # 32-bit offsets and cell keys halve the index footprint when they fit
+        small = np.int32 if max(len(xs), self._width * self._height) < 2**31 else None
+        self._order = order.astype(small) if small else order
+        self._keys = keys[order].astype(small) if small else keys[order]
+        self._xs = xs
+        self._ys = ys
+
+    # -- queries -----------------------------------------------------------
+
+    def query_radius(self, x: float, y: float, r: float) -> list[int]:
+        """
+        Return field indices of points within distance *r* of ``(x, y)``.
+
+        Returns:
+            list: Matching field indices in ascending order
+        """
+        if r < 0 or not len(self.field):
+            return []
+        offsets = self._offsets_within(x, y, r)
+        return sorted(o + self.field.start for o in offsets)
+
+    def nearest(self, x: float, y: float, k: int = 1) -> list[int]:
+        """
+        Return the field indices of the *k* points nearest to ``(x, y)``.
+
+        The search radius starts at the disc expected to hold *k* points,
+        ``a·√k``, and doubles until at least *k* points are found.
+
+        Returns:
+            list: Up to *k* field indices ordered by distance (ties by index)
+        """
+        if k < 1 or not len(self.field):
+            return []
+        field = self.field
+        rho = math.hypot(x, y)
+        r_max = field.a * math.sqrt(field.end)
+        r = max(field.a * math.sqrt(k), rho - r_max + field.a)
+        while True:
+            offsets = self._offsets_within(x, y, r)
+            if len(offsets) >= k or r > rho + r_max:
+                break
+            r *= 2.0
+        ranked = sorted((self._dist2(o, x, y), o + field.start) for o in offsets)
+        return [n for _, n in ranked[:k]]
+
+    # -- internals ---------------------------------------------------------
+
+    def _dist2(self, offset: int, x: float, y: float) -> float:
+        dx = float(self.field.xs[offset]) - x
+        dy = float(self.field.ys[offset]) - y
+        return dx * dx + dy * dy
+
+    def _offsets_within(self, x: float, y: float, r: float) -> list[int]:
+        if self._order is not None:
+            return self._grid_offsets(x, y, r)
+        return self._band_offsets(x, y, r)
+
+    def _band_offsets(self, x: float, y: float, r: float) -> list[int]:
+        field = self.field
+        rho = math.hypot(x, y)
+        lo, hi = index_range_for_radius(rho - r, rho + r, field.a)
+        lo, hi = max(lo, field.start), min(hi, field.end)
+        r2 = r * r
+        xs, ys, start = field.xs, field.ys, field.start
+        out = []
+        for o in range(lo - start, hi - start + 1):
+            dx = xs[o] - x
+            dy = ys[o] - y
+            if dx * dx + dy * dy <= r2:
+                out.append(o)
+        return out
+
+    def _grid_offsets(self, x: float, y: float, r: float) -> list[int]:
+        c = self.cell_size
+        cx_lo = max(int(math.floor((x - r) / c)) - self._cx0, 0)
+        cx_hi = min(int(math.floor((x + r) / c)) - self._cx0, self._width - 1)
+        cy_lo = max(int(math.floor((y - r) / c)) - self._cy0, 0)
+        cy_hi = min(int(math.floor((y + r) / c)) - self._cy0, self._height - 1)
+        if cx_lo > cx_hi or cy_lo > cy_hi:
+            return []
+        rows = np.arange(cy_lo, cy_hi + 1, dtype=np.int64) * self._width
+        lefts = np.searchsorted(self._keys, rows + cx_lo, side="left")
+        rights = np.searchsorted(self._keys, rows + cx_hi, side="right")
+        parts = [self._order[i:j] for i, j in zip(lefts, rights) if j > i]
+        if not parts:
+            return []
+        cand = np.concatenate(parts)
+        dx = self._xs[cand] - x
+        dy = self._ys[cand] - y
+        hit = cand[dx * dx + dy * dy <= r * r]
+        return hit.tolist()
@@ -0,0 +1,182 @@
+"""
+Result Cache: Keyed, byte-budgeted LRU store for DriveMatrix results.
+
+Results are keyed on the computing method and its arguments, so repeated
+requests with any previously seen arguments are answered without
+recomputation.  Callers receive a copy of the cached result (see
+:func:`copy_result`), so modifying it never changes later answers.  Entry
+sizes are estimated from the result's containers and buffers; when the
+total exceeds the budget the least recently used entries are evicted.  All
+operations are thread-safe.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping
+from typing import Any
+
+# Default budget for cached results
+DEFAULT_RESULT_CACHE_BYTES = 64 << 20
+
+# Containers larger than this are sized from a sample of their items
+_SAMPLE = 8
+
+
+def estimate_size(obj: Any) -> int:
+    """
+    Estimate the memory held by a computation result, in bytes.
+
+    Buffers (NumPy arrays, ``array`` columns, :class:`FieldBuffer`) count
+    their data size.  Large dicts, lists and tuples are sized from a sample
+    of their first items, which is exact for the homogeneous containers the
+    drive matrix produces and keeps the estimate O(1) in the result size.
+    Views over shared :class:`~.sequences.SequenceEngine` lists count only
+    the view itself, since the engine holds the terms regardless.
+    """
+    nbytes = getattr(obj, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    if isinstance(obj, array):
+        return len(obj) * obj.itemsize
+    terms = getattr(obj, "terms", None)
+    if terms is not None and isinstance(obj, Mapping):
+        shared = isinstance(terms, list)
+        return sys.getsizeof(obj) + (0 if shared else estimate_size(terms))
+    if isinstance(obj, dict):
+        items: Any = obj.items()
+    elif isinstance(obj, (list, tuple)):
+        items = obj
+    else:
+        return sys.getsizeof(obj)
+    size = sys.getsizeof(obj)
+    if not obj:
+        return size
+    sample = 0
+    for count, item in enumerate(items, 1):
+        if isinstance(obj, dict):
+            sample += estimate_size(item[0]) + estimate_size(item[1])
+        else:
+            sample += estimate_size(item)
+        if count == _SAMPLE:
+            break
+    return size + sample * len(obj) // count
+
+
+def copy_result(obj: Any) -> Any:
+    """
+    Copy a cached result so that the caller may modify it freely.
+
+    Dicts and lists are copied at every level and objects with a ``copy()``
+    method (NumPy arrays, :class:`FieldBuffer`, :class:`DensityGrid`) copy
+    themselves; ``array`` columns are sliced.  Other values, including
+    tuples and read-only :class:`~.sequences.SequenceView` mappings, are
+    shared.  Large containers whose first items are plain values are
+    copied without visiting every item, matching the homogeneous results
+    the drive matrix produces.
+    """
+    if isinstance(obj, (dict, list)):
+        items = obj.values() if isinstance(obj, dict) else obj
+        if len(obj) > _SAMPLE and all(
+            _is_plain(item) for _, item in zip(range(_SAMPLE), items)
+        ):
+            return obj.copy()
+        if isinstance(obj, dict):
+            return {key: copy_result(value) for key, value in obj.items()}
+        return [copy_result(item) for item in obj]
+    if isinstance(obj, array):
+        return obj[:]
+    copy = getattr(obj, "copy", None)
+    return copy() if callable(copy) else obj
+
+
+def _is_plain(obj: Any) -> bool:
+    """Whether *obj* is a value no caller can modify in place."""
+    if isinstance(obj, tuple):
+        return all(_is_plain(item) for item in obj)
+    return obj is None or isinstance(obj, (bool, int, float, complex, str))
+
+
+class ResultCache:
+    """
+    LRU cache of computation results with a byte budget.
+
+    Args:
+        max_bytes: Budget for cached results (default: 64 MiB); ``None``
+            disables eviction.  Results larger than the budget are not
+            cached.
+    """
+
+    def __init__(self, max_bytes: int | None = DEFAULT_RESULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the result stored under *key*, counting a hit or miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any) -> bool:
+        """
+        Store *value* under *key*, evicting least recently used entries.
+
+        Returns:
+            bool: Whether the value was cached (False if it exceeds the budget)
+        """
+        size = estimate_size(value)
+        with self._lock:
+            self._discard_unlocked(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                return False
+            self._entries[key] = (value, size)
+            self.nbytes += size
+            if self.max_bytes is not None:
+                while self.nbytes > self.max_bytes:
+                    _, (_, evicted) = self._entries.popitem(last=False)
+                    self.nbytes -= evicted
+            return True
+
+    def discard(self, key: Hashable) -> None:
+        """Remove *key* if present."""
+        with self._lock:
+            self._discard_unlocked(key)
+
+    def _discard_unlocked(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[1]
+
+    def clear(self) -> None:
+        """Drop every entry (hit/miss counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return entry count, bytes and hit/miss counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.nbytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
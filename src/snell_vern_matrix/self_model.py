@@ -10,7 +10,6 @@ from __future__ import annotations
 
 import hashlib
 import json
-import math
 import threading
 from enum import Enum
 from typing import Any, Optional
@@ -24,7 +23,7 @@ from recursive_field_math import (
     signature_summary,
 )
 
-from .recursive_field import golden_angle
+from .recursive_field.constants import COS_2GOLDEN, COS_GOLDEN
 
 # ---------------------------------------------------------------------------
 # SCE-88 constraint topology
@@ -115,7 +114,6 @@ def _validate_state(state: dict[str, Any]) -> None:
 _L3 = L(3)  # 4
 _L4 = L(4)  # 7
 _L5 = L(5)  # 11
-_GOLDEN_ANGLE = golden_angle()  # ≈137.508°
 _EGYPT_NUM: int
 _EGYPT_DEN: int
 _EGYPT_NUM, _EGYPT_DEN = egypt_4_7_11()  # (149, 308)
@@ -158,11 +156,10 @@ def _update_ternary_balance(
     delta: float,
 ) -> tuple[float, float, float]:
     """Rotate ternary balance using golden-angle–weighted update."""
-    angle_rad = math.radians(_GOLDEN_ANGLE)
     # Project delta onto three ternary axes offset by 120°
-    t0 = current[0] + delta * math.cos(0.0)
-    t1 = current[1] + delta * math.cos(angle_rad)
-    t2 = current[2] + delta * math.cos(2 * angle_rad)
+    t0 = current[0] + delta
+    t1 = current[1] + delta * COS_GOLDEN
+    t2 = current[2] + delta * COS_2GOLDEN
     # Normalise so components stay bounded and sum ≈ 0
     mean = (t0 + t1 + t2) / 3.0
     t0 -= mean
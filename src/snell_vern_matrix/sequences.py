@@ -0,0 +1,370 @@
+"""
+Sequence Engine for the Snell-Vern Hybrid Drive Matrix.
+
+Keeps Fibonacci and Lucas terms in contiguous lists indexed by ``n``, extends
+them incrementally with the linear recurrence (each new term from the
+previous two), and answers single large-``n`` lookups with fast doubling in
+O(log n) big-integer steps.  Cached prefixes are exposed through
+:class:`SequenceView` mappings that reference the lists instead of copying
+them.
+
+For indices where exact big integers are impractical, terms can be produced
+modulo a user-supplied modulus (tiled by the cached Pisano period) and Lucas
+ratios can be swept in floating point with error bounds kept in the log
+domain, both at constant memory per term.
+
+Conventions match ``recursive_field_math``: F(0) = 0, F(1) = 1, L(0) = 2,
+L(1) = 1.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from array import array
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Any
+
+_SQRT5 = math.sqrt(5.0)
+_PHI = (1.0 + _SQRT5) / 2.0
+_ABS_PSI = (_SQRT5 - 1.0) / 2.0
+
+# Pisano periods discovered so far, keyed by modulus
+_PISANO_CACHE: dict[int, int] = {}
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None
+
+# ---------------------------------------------------------------------------
+# Fast doubling
+# ---------------------------------------------------------------------------
+
+
+def fib_pair(n: int) -> tuple[int, int]:
+    """Return ``(F(n), F(n + 1))`` by fast doubling.
+
+    Uses F(2k) = F(k)·(2F(k+1) − F(k)) and F(2k+1) = F(k)² + F(k+1)²,
+    walking the bits of *n* from the most significant end.
+
+    Raises:
+        ValueError: If *n* is negative.
+    """
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a, b
+
+
+def fibonacci(n: int) -> int:
+    """Return F(n) by fast doubling."""
+    return fib_pair(n)[0]
+
+
+def lucas(n: int) -> int:
+    """Return L(n) by fast doubling, using L(n) = 2F(n+1) − F(n)."""
+    f, f1 = fib_pair(n)
+    return 2 * f1 - f
+
+
+# ---------------------------------------------------------------------------
+# Modular arithmetic
+# ---------------------------------------------------------------------------
+
+
+def pisano_period(modulus: int) -> int:
+    """Return the Pisano period π(m) of the Fibonacci sequence modulo *m*.
+
+    Computed once per modulus in O(π(m)) ≤ O(6m) steps and cached.
+
+    Raises:
+        ValueError: If *modulus* is less than 1.
+    """
+    if modulus < 1:
+        raise ValueError("modulus must be >= 1")
+    period = _PISANO_CACHE.get(modulus)
+    if period is None:
+        if modulus == 1:
+            period = 1
+        else:
+            a, b, period = 0, 1, 0
+            while True:
+                a, b = b, (a + b) % modulus
+                period += 1
+                if a == 0 and b == 1:
+                    break
+        _PISANO_CACHE[modulus] = period
+    return period
+
+
+def fib_pair_mod(n: int, modulus: int) -> tuple[int, int]:
+    """Return ``(F(n) mod m, F(n + 1) mod m)`` by fast doubling.
+
+    *n* is first reduced by the Pisano period when that period is cached.
+    """
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    if modulus < 1:
+        raise ValueError("modulus must be >= 1")
+    period = _PISANO_CACHE.get(modulus)
+    if period is not None:
+        n %= period
+    a, b = 0, 1 % modulus
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a) % modulus
+        d = (a * a + b * b) % modulus
+        if bit == "1":
+            a, b = d, (c + d) % modulus
+        else:
+            a, b = c, d
+    return a, b
+
+
+def fibonacci_mod(n: int, modulus: int) -> int:
+    """Return F(n) mod *modulus*."""
+    return fib_pair_mod(n, modulus)[0]
+
+
+def lucas_mod(n: int, modulus: int) -> int:
+    """Return L(n) mod *modulus*."""
+    f, f1 = fib_pair_mod(n, modulus)
+    return (2 * f1 - f) % modulus
+
+
+def modular_sequences(max_n: int, modulus: int) -> dict[str, Any]:
+    """Return F(n) and L(n) modulo *modulus* for n in 0..*max_n*.
+
+    Terms are produced by the recurrence on residues and stored in
+    ``array('q')`` columns (8 bytes per term) when the modulus allows.  Once
+    the Pisano period is known — cached from an earlier call or detected
+    during the sweep — the remaining terms are tiled from the first period.
+
+    Returns:
+        dict: ``fibonacci`` and ``lucas`` {n: residue} views, plus
+        ``modulus`` and ``period`` (``None`` if not reached within the range)
+
+    Raises:
+        ValueError: If *modulus* is less than 1.
+    """
+    if modulus < 1:
+        raise ValueError("modulus must be >= 1")
+    count = max_n + 1
+    period = _PISANO_CACHE.get(modulus)
+    if modulus == 1:
+        period = 1
+    typecode = "q" if modulus <= 2**63 else ""
+    fib: Any = array(typecode) if typecode else []
+    luc: Any = array(typecode) if typecode else []
+    limit = count if period is None else min(count, period)
+    f0, f1 = 0, 1 % modulus
+    l0, l1 = 2 % modulus, 1 % modulus
+    for i in range(limit):
+        if i and period is None and f0 == 0 and f1 == 1 % modulus:
+            period = _PISANO_CACHE.setdefault(modulus, i)
+            break
+        fib.append(f0)
+        luc.append(l0)
+        f0, f1 = f1, (f0 + f1) % modulus
+        l0, l1 = l1, (l0 + l1) % modulus
+    if period is not None and len(fib) < count:
+        reps = -(-count // period)
+        fib = (fib * reps)[:count]
+        luc = (luc * reps)[:count]
+    if period is not None:
+        _PISANO_CACHE.setdefault(modulus, period)
+    return {
+        "fibonacci": SequenceView(fib, count),
+        "lucas": SequenceView(luc, count),
+        "modulus": modulus,
+        "period": period,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Floating-point ratio sweeps
+# ---------------------------------------------------------------------------
+
+
+def float_lucas_ratios(max_n: int) -> dict[str, SequenceView]:
+    """Sweep L(n+1)/L(n) for n in 1..*max_n* without big integers.
+
+    The convergence bounds
+
+        √5 / (Lₙ(Lₙ + |ψ|ⁿ)) ≤ |L(n+1)/L(n) − φ| ≤ √5 / (Lₙ(Lₙ − |ψ|ⁿ))
+
+    underflow double precision beyond n ≈ 740, so they are returned as
+    natural logarithms, using log Lₙ = n·log φ + log1p((ψ/φ)ⁿ).
+
+    With NumPy the whole range is evaluated in one vectorised pass from the
+    Binet closed form L(n+1)/L(n) = φ·(1 + qⁿ⁺¹)/(1 + qⁿ), q = ψ/φ.  Without
+    it, ratios follow r(1) = 3, r(n+1) = 1 + 1/r(n); that map is contracting,
+    so rounding error does not accumulate.
+
+    Returns:
+        dict: ``ratios``, ``log_lower_bounds`` and ``log_upper_bounds``
+        {n: float} views backed by float64 columns
+    """
+    count = max(0, max_n)
+    if np is not None:
+        columns = _lucas_ratio_columns_numpy(count)
+    else:
+        columns = _lucas_ratio_columns_python(count)
+    return {
+        key: SequenceView(col, count, start=1)
+        for key, col in zip(("ratios", "log_lower_bounds", "log_upper_bounds"), columns)
+    }
+
+
+def _lucas_ratio_columns_numpy(count: int) -> tuple[Any, Any, Any]:
+    n = np.arange(1, count + 1, dtype=np.float64)
+    q_abs = _ABS_PSI / _PHI
+    # qⁿ with q = ψ/φ < 0: |q|ⁿ with alternating sign
+    qn = np.power(q_abs, n)
+    qn[::2] *= -1.0
+    ratios = _PHI * (1.0 - q_abs * qn) / (1.0 + qn)
+    log_l = n * math.log(_PHI) + np.log1p(qn)
+    # |ψ|ⁿ / Lₙ, computed in the log domain to avoid underflow
+    t = np.exp(n * math.log(_ABS_PSI) - log_l)
+    base = math.log(_SQRT5) - 2.0 * log_l
+    return ratios, base - np.log1p(t), base - np.log1p(-t)
+
+
+def _lucas_ratio_columns_python(count: int) -> tuple[Any, Any, Any]:
+    ratios = array("d")
+    log_lo = array("d")
+    log_hi = array("d")
+    log_phi = math.log(_PHI)
+    log_abs_psi = math.log(_ABS_PSI)
+    log_sqrt5 = math.log(_SQRT5)
+    q = -_ABS_PSI / _PHI
+    r = 3.0
+    for n in range(1, count + 1):
+        ratios.append(r)
+        r = 1.0 + 1.0 / r
+        log_l = n * log_phi + math.log1p(q**n)
+        t = math.exp(n * log_abs_psi - log_l)
+        base = log_sqrt5 - 2.0 * log_l
+        log_lo.append(base - math.log1p(t))
+        log_hi.append(base - math.log1p(-t))
+    return ratios, log_lo, log_hi
+
+
+# ---------------------------------------------------------------------------
+# Views
+# ---------------------------------------------------------------------------
+
+
+class SequenceView(Mapping[int, Any]):
+    """Read-only ``{n: term}`` mapping over the first *length* stored terms.
+
+    The view references the underlying list or array directly; later cache
+    growth does not change the view's length.  ``terms[0]`` holds index
+    *start* (default 0).
+    """
+
+    __slots__ = ("_terms", "_length", "_start")
+
+    def __init__(self, terms: Sequence[Any], length: int, start: int = 0) -> None:
+        self._terms = terms
+        self._length = max(0, min(length, len(terms)))
+        self._start = start
+
+    def __getitem__(self, n: int) -> Any:
+        i = n - self._start if isinstance(n, int) else -1
+        if 0 <= i < self._length:
+            return self._terms[i]
+        raise KeyError(n)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self._start, self._start + self._length))
+
+    def __contains__(self, n: object) -> bool:
+        return isinstance(n, int) and 0 <= n - self._start < self._length
+
+    def __repr__(self) -> str:
+        return f"SequenceView(start={self._start}, length={self._length})"
+
+    @property
+    def terms(self) -> Sequence[Any]:
+        """Underlying list or array, without copying.
+
+        Element ``i`` holds index ``start + i``; it may extend past the view.
+        """
+        return self._terms
+
+    def to_list(self) -> list[Any]:
+        """Return a copy of the viewed terms in index order."""
+        return list(self._terms[: self._length])
+
+
+# ---------------------------------------------------------------------------
+# SequenceEngine
+# ---------------------------------------------------------------------------
+
+
+class SequenceEngine:
+    """Incremental Fibonacci/Lucas cache backed by contiguous lists.
+
+    ``fibonacci[n]`` and ``lucas[n]`` hold F(n) and L(n) for every cached
+    ``n``; :meth:`extend` appends only the missing terms.
+
+    The cache may be shared between threads: lookups never lock, and
+    extensions are serialised by a lock.  ``lucas`` is appended after
+    ``fibonacci``, so ``len(lucas)`` never overstates the complete prefix.
+    """
+
+    def __init__(self) -> None:
+        self.fibonacci: list[int] = []
+        self.lucas: list[int] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of cached terms per sequence."""
+        return len(self.fibonacci)
+
+    def extend(self, max_n: int) -> None:
+        """Ensure terms 0..*max_n* are cached, computing only new ones."""
+        if len(self.lucas) > max_n:
+            return
+        with self._lock:
+            fib, luc = self.fibonacci, self.lucas
+            if max_n >= 0 and not fib:
+                fib.append(0)
+                luc.append(2)
+            if max_n >= 1 and len(fib) == 1:
+                fib.append(1)
+                luc.append(1)
+            for _ in range(len(fib), max_n + 1):
+                fib.append(fib[-1] + fib[-2])
+                luc.append(luc[-1] + luc[-2])
+
+    def fibonacci_at(self, n: int) -> int:
+        """Return F(n) from the cache, or by fast doubling beyond it."""
+        if 0 <= n < len(self.fibonacci):
+            return self.fibonacci[n]
+        return fibonacci(n)
+
+    def lucas_at(self, n: int) -> int:
+        """Return L(n) from the cache, or by fast doubling beyond it."""
+        if 0 <= n < len(self.lucas):
+            return self.lucas[n]
+        return lucas(n)
+
+    def view(self, max_n: int) -> dict[str, SequenceView]:
+        """Return zero-copy views of terms 0..*max_n* (extending as needed)."""
+        self.extend(max_n)
+        return {
+            "fibonacci": SequenceView(self.fibonacci, max_n + 1),
+            "lucas": SequenceView(self.lucas, max_n + 1),
+        }
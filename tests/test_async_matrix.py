@@ -0,0 +1,177 @@
+"""Tests for the asyncio DriveMatrix front-end."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from snell_vern_matrix import (
+    AsyncDriveMatrix,
+    DriveMatrix,
+    MatrixState,
+    async_matrix,
+    drive_matrix,
+)
+from snell_vern_matrix.recursive_field import FieldBuffer, parallel
+
+
+class TestAsyncField:
+    """Test cases for async field computation."""
+
+    def test_compute_field_matches_sync(self):
+        """Test chunked async results equal the synchronous ones."""
+        events = []
+        amatrix = AsyncDriveMatrix(chunk_size=64)
+        field = asyncio.run(amatrix.compute_field(1, 300, progress=events.append))
+        assert field == DriveMatrix().compute_field(1, 300)
+        assert amatrix.matrix.field_data is field
+        assert amatrix.matrix.state == MatrixState.COMPLETE
+        assert [e.done for e in events] == [64, 128, 192, 256, 300]
+        assert events[-1].fraction == 1.0
+
+    def test_compute_field_uses_cache(self):
+        """Test async chunks extend the shared field cache."""
+        matrix = DriveMatrix()
+        matrix.compute_field(1, 100)
+        amatrix = AsyncDriveMatrix(matrix, chunk_size=50)
+        asyncio.run(amatrix.compute_field(1, 150))
+        assert matrix.field_cache.points_computed == 150
+
+    def test_compute_field_uses_workers(self, monkeypatch):
+        """Test chunks are widened to reach the matrix's worker pool."""
+        monkeypatch.setattr(async_matrix, "PARALLEL_MIN_POINTS", 100)
+        monkeypatch.setattr(drive_matrix, "PARALLEL_MIN_POINTS", 100)
+        monkeypatch.setattr(parallel, "_MIN_SPAN", 8)
+        spans = []
+
+        def fan_out(start, end, **kwargs):
+            spans.append((start, end))
+            return parallel.parallel_positions(start, end, **kwargs)
+
+        monkeypatch.setattr(drive_matrix, "parallel_positions", fan_out)
+        events = []
+        amatrix = AsyncDriveMatrix(DriveMatrix(workers=2), chunk_size=16)
+        field = asyncio.run(amatrix.compute_field(1, 250, progress=events.append))
+        assert field == DriveMatrix().compute_field(1, 250)
+        assert spans == [(1, 100), (101, 200)]
+        assert [e.done for e in events] == [100, 200, 250]
+
+    def test_iter_field(self):
+        """Test async streaming yields ordered chunks."""
+        amatrix = AsyncDriveMatrix(chunk_size=4)
+
+        async def collect():
+            return [chunk async for chunk in amatrix.iter_field(1, 10)]
+
+        chunks = asyncio.run(collect())
+        assert [len(c) for c in chunks] == [4, 4, 2]
+        assert [p for c in chunks for p in c] == list(FieldBuffer.compute(1, 10))
+        assert amatrix.matrix.field_data == []
+        assert amatrix.matrix.state == MatrixState.COMPLETE
+
+    def test_iter_field_states(self):
+        """Test async streaming tracks state like the synchronous one."""
+        amatrix = AsyncDriveMatrix(chunk_size=4)
+        states = []
+
+        async def first_chunk():
+            stream = amatrix.iter_field(1, 10)
+            await stream.__anext__()
+            states.append(amatrix.matrix.state)
+            await stream.aclose()
+
+        asyncio.run(first_chunk())
+        assert states == [MatrixState.FIELD_ANALYSIS]
+        assert amatrix.matrix.state == MatrixState.IDLE
+
+        async def invalid():
+            return [chunk async for chunk in amatrix.iter_field(0, 10)]
+
+        with pytest.raises(ValueError):
+            asyncio.run(invalid())
+        assert amatrix.matrix.state == MatrixState.ERROR
+
+    def test_float32(self):
+        """Test float32 chunks come from the matrix's float32 cache."""
+        amatrix = AsyncDriveMatrix(chunk_size=30)
+        field = asyncio.run(amatrix.compute_field(1, 100, dtype="float32"))
+        assert field.dtype == "float32"
+        assert field == amatrix.matrix.compute_field(1, 100, dtype="float32")
+
+    def test_custom_executor(self):
+        """Test chunks run on a supplied executor."""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            amatrix = AsyncDriveMatrix(executor=executor, chunk_size=10)
+            field = asyncio.run(amatrix.compute_field(1, 25))
+        assert len(field) == 25
+
+    def test_cancellation(self):
+        """Test a cancelled job leaves the field untouched."""
+        amatrix = AsyncDriveMatrix(chunk_size=16)
+
+        async def run():
+            task = asyncio.create_task(
+                amatrix.compute_field(1, 1_000_000, progress=lambda e: task.cancel())
+            )
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+        assert amatrix.matrix.state == MatrixState.IDLE
+        assert amatrix.matrix.field_data == []
+
+    def test_error_state(self):
+        """Test failures put the matrix in ERROR."""
+        amatrix = AsyncDriveMatrix()
+        with pytest.raises(ValueError):
+            asyncio.run(amatrix.compute_field(0, 5))
+        assert amatrix.matrix.state == MatrixState.ERROR
+
+    def test_invalid_chunk_size(self):
+        """Test non-positive chunk sizes are rejected."""
+        with pytest.raises(ValueError):
+            AsyncDriveMatrix(chunk_size=0)
+
+
+class TestAsyncSequences:
+    """Test cases for async sequence and ratio analysis."""
+
+    def test_compute_sequences(self):
+        """Test the sequence cache is extended chunk by chunk."""
+        events = []
+        amatrix = AsyncDriveMatrix(chunk_size=10)
+        result = asyncio.run(amatrix.compute_sequences(25, progress=events.append))
+        assert dict(result["lucas"]) == dict(
+            DriveMatrix().compute_sequences(25)["lucas"]
+        )
+        assert [e.done for e in events] == [10, 20, 26]
+        assert amatrix.matrix.computation_results["sequences"] is result
+
+    def test_compute_sequences_modular(self):
+        """Test modular sequences are computed off the loop."""
+        amatrix = AsyncDriveMatrix()
+        result = asyncio.run(amatrix.compute_sequences(30, modulus=7))
+        assert result["period"] == 16
+
+    def test_analyze_lucas_ratios(self):
+        """Test chunked exact analysis matches the synchronous result."""
+        amatrix = AsyncDriveMatrix(chunk_size=7)
+        result = asyncio.run(amatrix.analyze_lucas_ratios(20))
+        expected = DriveMatrix().analyze_lucas_ratios(20)
+        assert result["ratios"] == expected["ratios"]
+        assert result["error_bounds"] == expected["error_bounds"]
+        assert result["signature"] == expected["signature"]
+
+    def test_results_shared_with_sync_api(self):
+        """Test async results land in the matrix result cache."""
+        amatrix = AsyncDriveMatrix()
+        result = asyncio.run(amatrix.analyze_lucas_ratios(10, precision="float"))
+        result["phi"] = 0.0
+        again = amatrix.matrix.analyze_lucas_ratios(10, precision="float")
+        assert amatrix.matrix.result_cache.hits == 1
+        assert again["phi"] != 0.0 and again["ratios"] == result["ratios"]
+
+    def test_invalid_precision(self):
+        """Test unknown precisions are rejected."""
+        with pytest.raises(ValueError):
+            asyncio.run(AsyncDriveMatrix().analyze_lucas_ratios(5, precision="half"))
@@ -1,6 +1,21 @@
 """Tests for the DriveMatrix unified engine."""
 
-from snell_vern_matrix import DriveMatrix, MatrixState, PhaseState
+import io
+import math
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from snell_vern_matrix import (
+    STATE_CODES,
+    DriveMatrix,
+    FieldBuffer,
+    MatrixState,
+    PhaseState,
+)
+from snell_vern_matrix.recursive_field import RawFieldSink
 
 
 class TestDriveMatrix:
@@ -34,6 +49,34 @@ class TestDriveMatrix:
         result = matrix.process_input("")
         assert result == MatrixState.ERROR
 
+    def test_process_inputs_matches_process_input(self):
+        """Test batch processing maps each input like process_input."""
+        inputs = ["test", "", "abcdefghijklmnopqrstuvwxyz0123456789", "glyph"]
+        expected = [DriveMatrix().process_input(s) for s in inputs]
+        matrix = DriveMatrix()
+        result = matrix.process_inputs(iter(inputs))
+        assert [STATE_CODES[c] for c in result["codes"]] == expected
+        assert result["processed"] == 4
+        assert result["first_error"] == 1
+        assert sum(result["counts"].values()) == 4
+        assert result["counts"]["error"] == 1
+        assert matrix.state == expected[-1]
+
+    def test_process_inputs_stop_on_error(self):
+        """Test processing stops after the first ERROR when requested."""
+        matrix = DriveMatrix()
+        result = matrix.process_inputs(["test", "", "test"], stop_on_error=True)
+        assert result["processed"] == 2
+        assert matrix.state == MatrixState.ERROR
+
+    def test_process_inputs_empty(self):
+        """Test an empty batch leaves the state unchanged."""
+        matrix = DriveMatrix()
+        result = matrix.process_inputs([])
+        assert result["processed"] == 0
+        assert result["first_error"] is None
+        assert matrix.state == MatrixState.IDLE
+
     def test_compute_field(self):
         """Test field computation."""
         matrix = DriveMatrix()
@@ -42,6 +85,95 @@ class TestDriveMatrix:
         assert all(isinstance(pos, tuple) and len(pos) == 2 for pos in field)
         assert matrix.state == MatrixState.COMPLETE
 
+    def test_compute_field_columnar(self):
+        """Test field data is stored column-wise with range metadata."""
+        matrix = DriveMatrix()
+        field = matrix.compute_field(1, 5)
+        assert isinstance(field, FieldBuffer)
+        assert matrix.field_data is field
+        assert (field.start, field.end) == (1, 5)
+        assert field.to_list() == list(field)
+
+    def test_iter_field_chunks(self):
+        """Test streamed chunks cover the range in order."""
+        matrix = DriveMatrix()
+        chunks = list(matrix.iter_field(1, 10, chunk_size=4))
+        assert [len(c) for c in chunks] == [4, 4, 2]
+        assert [c.start for c in chunks] == [1, 5, 9]
+        streamed = [p for c in chunks for p in c]
+        assert streamed == list(DriveMatrix().compute_field(1, 10))
+        assert matrix.state == MatrixState.COMPLETE
+        assert len(matrix.field_data) == 0
+
+    def test_iter_field_state_transitions(self):
+        """Test streaming stays in FIELD_ANALYSIS until exhausted."""
+        matrix = DriveMatrix()
+        stream = matrix.iter_field(1, 6, chunk_size=3)
+        assert matrix.state == MatrixState.IDLE
+        next(stream)
+        assert matrix.state == MatrixState.FIELD_ANALYSIS
+        next(stream)
+        assert matrix.state == MatrixState.FIELD_ANALYSIS
+        assert next(stream, None) is None
+        assert matrix.state == MatrixState.COMPLETE
+
+    def test_iter_field_closed_early(self):
+        """Test a consumer stopping early returns the matrix to IDLE."""
+        matrix = DriveMatrix()
+        for _ in matrix.iter_field(1, 10, chunk_size=3):
+            break
+        assert matrix.state == MatrixState.IDLE
+        stream = matrix.iter_field(1, 10, chunk_size=3)
+        next(stream)
+        stream.close()
+        assert matrix.state == MatrixState.IDLE
+
+    def test_iter_field_invalid(self):
+        """Test invalid chunk sizes and ranges."""
+        matrix = DriveMatrix()
+        with pytest.raises(ValueError):
+            matrix.iter_field(1, 10, chunk_size=0)
+        with pytest.raises(ValueError):
+            list(matrix.iter_field(0, 10))
+        assert matrix.state == MatrixState.ERROR
+
+    def test_stream_field_to_sink(self):
+        """Test chunks are delivered to a sink."""
+        matrix = DriveMatrix()
+        received = []
+
+        class ListSink:
+            def write(self, chunk):
+                received.append(chunk.to_list())
+
+        assert matrix.stream_field(1, 7, ListSink(), chunk_size=3) == 7
+        assert [p for block in received for p in block] == list(
+            matrix.compute_field(1, 7)
+        )
+
+    def test_stream_field_raw_bytes(self):
+        """Test the raw sink writes interleaved x, y pairs."""
+        matrix = DriveMatrix()
+        out = io.BytesIO()
+        sink = RawFieldSink(out)
+        matrix.stream_field(1, 5, sink, chunk_size=2)
+        assert sink.points_written == 5
+        values = array("d", out.getvalue())
+        expected = [v for p in matrix.compute_field(1, 5) for v in p]
+        assert values.tolist() == expected
+
+    def test_stream_field_sink_error(self):
+        """Test a failing sink leaves the matrix in ERROR."""
+        matrix = DriveMatrix()
+
+        class FailingSink:
+            def write(self, chunk):
+                raise OSError("disk full")
+
+        with pytest.raises(OSError):
+            matrix.stream_field(1, 5, FailingSink())
+        assert matrix.state == MatrixState.ERROR
+
     def test_compute_r_theta_field(self):
         """Test r_theta field computation."""
         matrix = DriveMatrix()
@@ -100,6 +232,30 @@ class TestDriveMatrix:
         assert matrix.field_data == []
         assert matrix.computation_results == {}
 
+    def test_stream_field_float32(self):
+        """Test float32 streaming writes 4-byte coordinates."""
+        matrix = DriveMatrix()
+        out = io.BytesIO()
+        assert matrix.stream_field(1, 50, RawFieldSink(out), dtype="float32") == 50
+        assert len(out.getvalue()) == 50 * 8
+
+    def test_compute_r_theta_columns(self):
+        """Test r/θ columns match compute_r_theta_field with θ reduced."""
+        matrix = DriveMatrix()
+        expected = matrix.compute_r_theta_field(1, 40)
+        cols = matrix.compute_r_theta_columns(1, 40)
+        for n, (r, theta) in zip(range(1, 41), cols):
+            assert r == expected[n][0]
+            assert theta == pytest.approx(expected[n][1] % (2 * math.pi))
+        narrow = matrix.compute_r_theta_columns(1, 40, dtype="float32")
+        assert narrow.dtype == "float32"
+        assert all(
+            abs(t32 - t64) <= 2.0**-24 * 2 * math.pi
+            for (_, t32), (_, t64) in zip(narrow, cols)
+        )
+        assert matrix.compute_r_theta_columns(1, 40, dtype="float32") == narrow
+        assert matrix.result_cache.hits == 1
+
 
 class TestMatrixState:
     """Test cases for MatrixState enum."""
@@ -112,3 +268,48 @@ class TestMatrixState:
         assert MatrixState.PHASE_SYNC.value == "phase_sync"
         assert MatrixState.COMPLETE.value == "complete"
         assert MatrixState.ERROR.value == "error"
+
+
+class TestConcurrentDriveMatrix:
+    """Test cases for DriveMatrix(concurrent=True)."""
+
+    def test_per_thread_state(self):
+        """Test each thread sees its own state and field data."""
+        matrix = DriveMatrix(concurrent=True)
+        barrier = threading.Barrier(2)
+
+        def run(symbolic_input, end):
+            state = matrix.process_input(symbolic_input)
+            field = matrix.compute_field(1, end)
+            barrier.wait()
+            return state, matrix.state, matrix.field_data is field, len(field)
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            bad = pool.submit(run, "", 10)
+            good = pool.submit(run, "test", 20)
+            assert bad.result() == (MatrixState.ERROR, MatrixState.COMPLETE, True, 10)
+            assert good.result()[2:] == (True, 20)
+        assert matrix.state == MatrixState.IDLE
+        assert matrix.field_data == []
+
+    def test_shared_caches(self):
+        """Test threads share sequence and result caches."""
+        matrix = DriveMatrix(concurrent=True)
+
+        def run(n):
+            matrix.compute_sequences(n)
+            return matrix.compute_r_theta_field(1, 50)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(run, range(10, 210, 10)))
+        assert len(matrix.sequence_cache["lucas"]) == 201
+        assert all(r == results[0] for r in results)
+        assert matrix.get_status()["concurrent"] is True
+
+    def test_default_mode_shares_state(self):
+        """Test the default mode keeps one state for all threads."""
+        matrix = DriveMatrix()
+        thread = threading.Thread(target=matrix.process_input, args=("",))
+        thread.start()
+        thread.join()
+        assert matrix.state == MatrixState.ERROR
@@ -0,0 +1,54 @@
+"""Tests for the columnar FieldBuffer field storage."""
+
+import pytest
+
+from snell_vern_matrix.recursive_field import FieldBuffer, position
+
+
+class TestFieldBuffer:
+    """Test cases for FieldBuffer."""
+
+    def test_compute_range_metadata(self):
+        """Test computed buffers record their index range."""
+        buf = FieldBuffer.compute(3, 12, a=2.0)
+        assert len(buf) == 10
+        assert (buf.start, buf.end, buf.a) == (3, 12, 2.0)
+        assert buf.dtype == "float64"
+        assert buf.nbytes == 2 * 10 * 8
+
+    def test_reads_as_tuple_sequence(self):
+        """Test elements are (x, y) tuples matching position()."""
+        buf = FieldBuffer.compute(1, 5)
+        assert all(isinstance(p, tuple) and len(p) == 2 for p in buf)
+        assert buf[0] == position(1)
+        assert buf[-1] == position(5)
+
+    def test_point_by_field_index(self):
+        """Test lookup by field index rather than offset."""
+        buf = FieldBuffer.compute(10, 20)
+        assert buf.point(15) == position(15)
+        with pytest.raises(IndexError):
+            buf.point(9)
+
+    def test_slice_keeps_metadata(self):
+        """Test contiguous slices are buffers with shifted start."""
+        buf = FieldBuffer.compute(1, 10)
+        part = buf[2:5]
+        assert isinstance(part, FieldBuffer)
+        assert (part.start, part.end) == (3, 5)
+        assert part.to_list() == [position(n) for n in range(3, 6)]
+        assert buf[::2] == [position(n) for n in range(1, 11, 2)]
+
+    def test_equality(self):
+        """Test equality against buffers and plain sequences."""
+        buf = FieldBuffer.compute(1, 4)
+        assert buf == FieldBuffer.compute(1, 4)
+        assert buf != FieldBuffer.compute(2, 5)
+        assert buf == [position(n) for n in range(1, 5)]
+        assert FieldBuffer.empty() == []
+
+    def test_mismatched_columns_rejected(self):
+        """Test columns of different lengths are rejected."""
+        buf = FieldBuffer.compute(1, 3)
+        with pytest.raises(ValueError):
+            FieldBuffer(buf.xs, buf.ys[:2])
@@ -0,0 +1,220 @@
+"""Tests for the incremental field range cache."""
+
+import pytest
+
+from snell_vern_matrix.drive_matrix import DriveMatrix
+from snell_vern_matrix.recursive_field import FieldBuffer, FieldCache, batch, cache
+
+
+class TestFieldCache:
+    """Test cases for FieldCache."""
+
+    def test_matches_direct_computation(self):
+        """Test cached ranges equal freshly computed ones."""
+        fc = FieldCache()
+        assert fc.get(10, 50) == FieldBuffer.compute(10, 50)
+        assert fc.get(1, 80) == FieldBuffer.compute(1, 80)
+        assert fc.get(20, 30) == FieldBuffer.compute(20, 30)
+
+    def test_growing_range_computes_only_new_indices(self):
+        """Test extending a range evaluates just the added indices."""
+        fc = FieldCache()
+        fc.get(1, 1000)
+        fc.get(1, 1100)
+        assert fc.points_computed == 1100
+        fc.get(1, 1100)
+        assert fc.points_computed == 1100
+
+    def test_extends_at_both_ends(self):
+        """Test a range wider on both sides reuses the cached middle."""
+        fc = FieldCache()
+        fc.get(100, 200)
+        field = fc.get(50, 260)
+        assert fc.points_computed == 211
+        assert field == FieldBuffer.compute(50, 260)
+        assert fc.ranges() == [(50, 260)]
+
+    def test_sliding_window(self):
+        """Test a moving window costs only the step per move."""
+        fc = FieldCache()
+        for lo in range(1, 500, 10):
+            field = fc.get(lo, lo + 99)
+        assert field == FieldBuffer.compute(lo, lo + 99)
+        assert fc.points_computed == lo + 99
+
+    def test_disjoint_ranges_kept_separately(self):
+        """Test non-adjoining requests create separate segments."""
+        fc = FieldCache()
+        fc.get(1, 10)
+        fc.get(100, 110)
+        assert fc.ranges() == [(1, 10), (100, 110)]
+        fc.get(11, 20)
+        assert fc.ranges() == [(1, 20), (100, 110)]
+
+    def test_merged_segments_are_dropped(self):
+        """Test segments swallowed by an extension are discarded."""
+        fc = FieldCache()
+        fc.get(1, 10)
+        fc.get(20, 30)
+        fc.get(1, 40)
+        assert fc.ranges() == [(1, 40)]
+
+    def test_evicts_least_recently_used(self):
+        """Test the byte budget evicts the oldest segments first."""
+        fc = FieldCache(max_bytes=16 * 25)
+        fc.get(1, 10)
+        fc.get(100, 109)
+        fc.get(1, 5)
+        fc.get(200, 209)
+        assert fc.ranges() == [(1, 10), (200, 209)]
+        assert fc.nbytes <= fc.max_bytes
+
+    def test_trims_active_segment(self):
+        """Test an over-budget segment is trimmed to the latest request."""
+        fc = FieldCache(max_bytes=16 * 100)
+        fc.get(1, 80)
+        field = fc.get(41, 120)
+        assert fc.ranges() == [(41, 120)]
+        assert field == FieldBuffer.compute(41, 120)
+        assert fc.get(1, 10) == FieldBuffer.compute(1, 10)
+
+    def test_nbytes_counts_slack(self):
+        """Test the budget sees storage over-allocated for growth."""
+        fc = FieldCache()
+        fc.get(1, 100)
+        fc.get(1, 110)
+        assert fc.nbytes > 16 * 110
+        assert fc.nbytes == sum(16 * len(seg.xs) for seg in fc._segments)
+
+    def test_trim_releases_storage(self):
+        """Test trimming a large segment frees its dead storage."""
+        fc = FieldCache(max_bytes=16 * 1000)
+        fc.get(1, 50_000)
+        fc.get(1, 10)
+        assert fc.ranges() == [(1, 10)]
+        assert fc.nbytes == 16 * 10
+        assert fc.get(5, 12) == FieldBuffer.compute(5, 12)
+
+    def test_oversized_range_not_kept(self):
+        """Test a range larger than the budget is served but not cached."""
+        fc = FieldCache(max_bytes=16 * 100)
+        fc.get(1, 50)
+        assert fc.get(1, 500) == FieldBuffer.compute(1, 500)
+        assert fc.ranges() == []
+        assert fc.nbytes == 0
+        fc.get(1, 80)
+        assert fc.ranges() == [(1, 80)]
+
+    def test_earlier_views_unchanged(self):
+        """Test buffers handed out earlier keep their values."""
+        fc = FieldCache(max_bytes=16 * 50)
+        first = fc.get(20, 60)
+        snapshot = first.to_list()
+        fc.get(40, 80)
+        fc.get(1, 60)
+        assert first.to_list() == snapshot
+
+    def test_views_are_read_only(self):
+        """Test a caller cannot alter the cached positions through a view."""
+        np = pytest.importorskip("numpy")
+        fc = FieldCache()
+        field = fc.get(1, 10)
+        with pytest.raises(ValueError):
+            field.xs[0] = 999.0
+        with pytest.raises(ValueError):
+            np.multiply(field.ys, 2.0, out=field.ys)
+        assert fc.get(1, 10) == FieldBuffer.compute(1, 10)
+
+    def test_empty_range(self):
+        """Test an empty range returns an empty buffer without caching."""
+        fc = FieldCache()
+        assert len(fc.get(5, 4)) == 0
+        assert fc.ranges() == []
+
+    def test_invalid_start(self):
+        """Test non-positive indices are rejected."""
+        fc = FieldCache()
+        fc.get(1, 10)
+        with pytest.raises(ValueError):
+            fc.get(0, 10)
+        assert fc.ranges() == [(1, 10)]
+
+    def test_pure_python_fallback(self, monkeypatch):
+        """Test segments grow through array columns without NumPy."""
+        monkeypatch.setattr(batch, "np", None)
+        monkeypatch.setattr(cache, "np", None)
+        fc = FieldCache()
+        fc.get(10, 20)
+        assert fc.get(1, 40) == FieldBuffer.compute(1, 40)
+        assert fc.points_computed == 40
+
+
+class TestDriveMatrixFieldCache:
+    """Test cases for incremental DriveMatrix.compute_field."""
+
+    def test_compute_field_is_incremental(self):
+        """Test growing compute_field calls reuse earlier results."""
+        matrix = DriveMatrix()
+        matrix.compute_field(1, 1000)
+        field = matrix.compute_field(1, 1050)
+        assert matrix.field_cache.points_computed == 1050
+        assert field == FieldBuffer.compute(1, 1050)
+        assert matrix.get_status()["field_cache_ranges"] == [(1, 1050)]
+
+    def test_cache_survives_reset(self):
+        """Test reset keeps cached ranges."""
+        matrix = DriveMatrix()
+        matrix.compute_field(1, 100)
+        matrix.reset()
+        assert matrix.field_data == []
+        matrix.compute_field(1, 100)
+        assert matrix.field_cache.points_computed == 100
+
+    def test_field_not_shared_between_calls(self):
+        """Test writing into a returned field does not leak into later calls."""
+        matrix = DriveMatrix()
+        field = matrix.compute_field(1, 10)
+        try:
+            field.xs[0] = 999.0
+        except ValueError:
+            pass
+        assert matrix.compute_field(1, 10) == FieldBuffer.compute(1, 10)
+
+    def test_cache_budget(self):
+        """Test the constructor budget is applied."""
+        matrix = DriveMatrix(field_cache_bytes=16 * 10)
+        assert matrix.compute_field(1, 50) == FieldBuffer.compute(1, 50)
+        assert matrix.get_status()["field_cache_bytes"] == 0
+        matrix.compute_field(100, 104)
+        assert matrix.field_cache.ranges() == [(100, 104)]
+
+    def test_budget_holds_for_every_dtype(self):
+        """Test no dtype's cache outgrows the budget."""
+        matrix = DriveMatrix(field_cache_bytes=16_000)
+        matrix.compute_field(1, 100_000)
+        matrix.compute_field(1, 100_000, dtype="float32")
+        matrix.reset()
+        assert matrix.get_status()["field_cache_bytes"] == 0
+
+    def test_clear_field_cache(self):
+        """Test clear_field_cache drops the ranges of every dtype."""
+        matrix = DriveMatrix()
+        matrix.compute_field(1, 100)
+        matrix.compute_field(1, 100, dtype="float32")
+        matrix.clear_field_cache()
+        assert matrix.get_status()["field_cache_bytes"] == 0
+        assert matrix.compute_field(1, 100) == FieldBuffer.compute(1, 100)
+        assert matrix.field_cache.points_computed == 200
+
+    def test_float32_cache(self):
+        """Test float32 ranges are cached separately at half the size."""
+        matrix = DriveMatrix()
+        matrix.compute_field(1, 100)
+        field = matrix.compute_field(1, 100, dtype="float32")
+        assert field.dtype == "float32"
+        assert field.nbytes == 8 * 100
+        assert field == FieldBuffer.compute(1, 100, dtype="float32")
+        assert matrix.field_cache.points_computed == 100
+        assert matrix.get_status()["field_cache_bytes"] == 16 * 100 + 8 * 100
+        with pytest.raises(ValueError):
+            matrix.compute_field(1, 10, dtype="int8")
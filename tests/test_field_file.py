@@ -0,0 +1,151 @@
+"""Tests for memory-mapped binary field files."""
+
+from array import array
+
+import pytest
+
+from snell_vern_matrix.drive_matrix import DriveMatrix
+from snell_vern_matrix.recursive_field import (
+    FieldBuffer,
+    FieldFileSink,
+    batch,
+    fieldfile,
+    open_field,
+    read_field_header,
+    write_field,
+)
+
+
+class TestFieldFile:
+    """Test cases for writing and opening field files."""
+
+    def test_round_trip(self, tmp_path):
+        """Test a written field reopens with identical points and metadata."""
+        path = str(tmp_path / "field.bin")
+        field = FieldBuffer.compute(5, 1004, a=2.5)
+        header = write_field(path, field)
+        assert (header.start, header.end, header.a) == (5, 1004, 2.5)
+        assert header.dtype == "float64"
+        loaded = open_field(path)
+        assert loaded == field
+        assert loaded.a == 2.5
+        assert read_field_header(path) == header
+
+    def test_file_layout(self, tmp_path):
+        """Test the file is the header followed by two raw columns."""
+        path = tmp_path / "field.bin"
+        write_field(str(path), FieldBuffer.compute(1, 10))
+        assert path.stat().st_size == fieldfile.HEADER_SIZE + 2 * 10 * 8
+        assert path.read_bytes()[:8] == fieldfile.MAGIC
+
+    def test_open_is_zero_copy(self, tmp_path):
+        """Test NumPy columns are read-only views onto the mapped file."""
+        if fieldfile.np is None:
+            pytest.skip("numpy not installed")
+        path = str(tmp_path / "field.bin")
+        write_field(path, FieldBuffer.compute(1, 100))
+        loaded = open_field(path)
+        assert not loaded.xs.flags.owndata
+        assert not loaded.xs.flags.writeable
+
+    def test_pure_python_fallback(self, tmp_path, monkeypatch):
+        """Test files round-trip through array columns without NumPy."""
+        monkeypatch.setattr(batch, "np", None)
+        monkeypatch.setattr(fieldfile, "np", None)
+        path = str(tmp_path / "field.bin")
+        field = FieldBuffer.compute(1, 50)
+        write_field(path, field)
+        loaded = open_field(path)
+        assert isinstance(loaded.xs, array)
+        assert loaded == field
+
+    def test_float32_columns(self, tmp_path, monkeypatch):
+        """Test single-precision columns keep their dtype."""
+        monkeypatch.setattr(fieldfile, "np", None)
+        path = str(tmp_path / "field.bin")
+        field = FieldBuffer(array("f", [1.5, 2.5]), array("f", [3.5, 4.5]))
+        assert write_field(path, field).dtype == "float32"
+        loaded = open_field(path)
+        assert loaded.dtype == "float32"
+        assert loaded.to_list() == [(1.5, 3.5), (2.5, 4.5)]
+
+    def test_empty_field(self, tmp_path):
+        """Test an empty field round-trips."""
+        path = str(tmp_path / "field.bin")
+        write_field(path, FieldBuffer.empty(start=7))
+        loaded = open_field(path)
+        assert len(loaded) == 0
+        assert loaded.start == 7
+
+    def test_rejects_foreign_file(self, tmp_path):
+        """Test files without the magic bytes are rejected."""
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"\x00" * 128)
+        with pytest.raises(ValueError, match="not a field file"):
+            open_field(str(path))
+
+    def test_rejects_truncated_file(self, tmp_path):
+        """Test files shorter than their header claims are rejected."""
+        path = tmp_path / "field.bin"
+        write_field(str(path), FieldBuffer.compute(1, 10))
+        path.write_bytes(path.read_bytes()[:-8])
+        with pytest.raises(ValueError, match="truncated"):
+            open_field(str(path))
+
+    def test_invalid_kind(self, tmp_path):
+        """Test unknown field kinds are rejected."""
+        with pytest.raises(ValueError):
+            write_field(str(tmp_path / "f.bin"), FieldBuffer.empty(), kind="polar")
+
+
+class TestFieldFileSink:
+    """Test cases for streaming fields into a file."""
+
+    def test_streamed_file_matches_computed(self, tmp_path):
+        """Test chunked writes produce the same file as a single write."""
+        streamed = tmp_path / "streamed.bin"
+        whole = tmp_path / "whole.bin"
+        matrix = DriveMatrix()
+        with FieldFileSink(str(streamed), 1, 1000) as sink:
+            assert matrix.stream_field(1, 1000, sink, chunk_size=96) == 1000
+        assert sink.points_written == 1000
+        write_field(str(whole), FieldBuffer.compute(1, 1000))
+        assert streamed.read_bytes() == whole.read_bytes()
+
+    def test_chunk_outside_range(self, tmp_path):
+        """Test chunks beyond the declared range are rejected."""
+        with FieldFileSink(str(tmp_path / "f.bin"), 1, 10) as sink:
+            with pytest.raises(ValueError):
+                sink.write(FieldBuffer.compute(8, 12))
+
+
+class TestDriveMatrixFieldFiles:
+    """Test cases for DriveMatrix export and load."""
+
+    def test_export_and_load(self, tmp_path):
+        """Test a computed field survives export and load."""
+        path = str(tmp_path / "field.bin")
+        matrix = DriveMatrix()
+        field = matrix.compute_field(1, 300)
+        matrix.export_field(path)
+        other = DriveMatrix()
+        assert other.load_field(path) == field
+        assert other.field_data == field
+        assert other.nearest_field_indices(*field.point(42)) == [42]
+
+    def test_export_r_theta_field(self, tmp_path):
+        """Test r/θ results are stored as a field file of kind r_theta."""
+        path = str(tmp_path / "r_theta.bin")
+        matrix = DriveMatrix()
+        values = matrix.compute_r_theta_field(3, 20)
+        header = matrix.export_r_theta_field(path)
+        assert (header.kind, header.start, header.end) == ("r_theta", 3, 20)
+        loaded = open_field(path)
+        assert dict(zip(range(3, 21), loaded)) == values
+        with pytest.raises(ValueError):
+            matrix.load_field(path)
+
+    def test_export_r_theta_requires_result(self, tmp_path):
+        """Test exporting before computing an r/θ field fails."""
+        with pytest.raises(ValueError):
+            DriveMatrix().export_r_theta_field(str(tmp_path / "f.bin"))
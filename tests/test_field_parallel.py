@@ -0,0 +1,75 @@
+"""Tests for multi-process field generation."""
+
+import pytest
+
+from snell_vern_matrix import drive_matrix
+from snell_vern_matrix.drive_matrix import DriveMatrix
+from snell_vern_matrix.recursive_field import parallel, positions
+from snell_vern_matrix.recursive_field.parallel import (
+    parallel_positions,
+    resolve_workers,
+    split_range,
+)
+
+
+class TestSplitRange:
+    """Tests for range splitting."""
+
+    def test_spans_cover_range_in_order(self):
+        """Test spans are contiguous and cover the range exactly."""
+        spans = split_range(3, 22, 6)
+        assert spans[0][0] == 3 and spans[-1][1] == 22
+        for (_, hi), (lo, _) in zip(spans, spans[1:]):
+            assert lo == hi + 1
+        sizes = [hi - lo + 1 for lo, hi in spans]
+        assert sum(sizes) == 20 and max(sizes) - min(sizes) <= 1
+
+    def test_more_parts_than_indices(self):
+        """Test a short range yields one span per index."""
+        assert split_range(1, 3, 10) == [(1, 1), (2, 2), (3, 3)]
+
+    def test_empty_range(self):
+        """Test an empty range yields no spans."""
+        assert split_range(5, 4, 3) == []
+
+    def test_resolve_workers(self):
+        """Test worker count normalisation."""
+        assert resolve_workers(3) == 3
+        assert resolve_workers(None) >= 1
+        with pytest.raises(ValueError):
+            resolve_workers(0)
+
+
+class TestParallelPositions:
+    """Tests for process-pool position generation."""
+
+    def test_bit_identical_to_serial(self, monkeypatch):
+        """Test merged parallel columns equal the serial columns exactly."""
+        monkeypatch.setattr(parallel, "_MIN_SPAN", 16)
+        xs, ys = parallel_positions(1, 500, workers=2)
+        sx, sy = positions(1, 500)
+        assert list(xs) == list(sx)
+        assert list(ys) == list(sy)
+
+    def test_invalid_start(self):
+        """Test non-positive start indices are rejected."""
+        with pytest.raises(ValueError):
+            parallel_positions(0, 10, workers=2)
+
+
+class TestDriveMatrixWorkers:
+    """Tests for DriveMatrix worker configuration."""
+
+    def test_workers_in_status(self):
+        """Test the configured worker count is reported."""
+        assert DriveMatrix(workers=3).get_status()["workers"] == 3
+        assert DriveMatrix().workers == 1
+
+    def test_parallel_matrix_matches_serial(self, monkeypatch):
+        """Test parallel fields and r_theta maps equal the serial ones."""
+        monkeypatch.setattr(drive_matrix, "PARALLEL_MIN_POINTS", 1)
+        monkeypatch.setattr(parallel, "_MIN_SPAN", 8)
+        par = DriveMatrix(workers=2)
+        ser = DriveMatrix()
+        assert par.compute_field(1, 100) == ser.compute_field(1, 100)
+        assert par.compute_r_theta_field(1, 100) == ser.compute_r_theta_field(1, 100)
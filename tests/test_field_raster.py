@@ -0,0 +1,151 @@
+"""Tests for density rasterisation of phyllotaxis fields."""
+
+import math
+
+import pytest
+
+from snell_vern_matrix import drive_matrix
+from snell_vern_matrix.drive_matrix import DriveMatrix
+from snell_vern_matrix.recursive_field import (
+    DensityGrid,
+    FieldBuffer,
+    batch,
+    position,
+    raster,
+    rasterize,
+)
+from snell_vern_matrix.recursive_field.raster import field_extent
+
+
+def _naive_counts(start, end, width, height, extent):
+    """Bin points one at a time with the documented bin rule."""
+    x_min, x_max, y_min, y_max = extent
+    counts = [[0] * width for _ in range(height)]
+    for n in range(start, end + 1):
+        x, y = position(n)
+        if x_min <= x <= x_max and y_min <= y <= y_max:
+            col = min(int((x - x_min) * width / (x_max - x_min)), width - 1)
+            row = min(int((y - y_min) * height / (y_max - y_min)), height - 1)
+            counts[row][col] += 1
+    return counts
+
+
+class TestDensityGrid:
+    """Test cases for DensityGrid and rasterize."""
+
+    @pytest.fixture(autouse=True, params=["numpy", "python"])
+    def backend(self, request, monkeypatch):
+        """Run every test with NumPy (when installed) and without it."""
+        if request.param == "python":
+            monkeypatch.setattr(raster, "np", None)
+            monkeypatch.setattr(batch, "np", None)
+        return request.param
+
+    def test_matches_naive_binning(self):
+        """Test vectorised binning equals per-point binning."""
+        extent = field_extent(2000)
+        grid = rasterize(1, 2000, 16, 12, extent)
+        assert grid.to_rows() == _naive_counts(1, 2000, 16, 12, extent)
+        assert grid.points == 2000 and grid.outside == 0
+
+    def test_tiles_do_not_change_result(self):
+        """Test the tile size only bounds memory."""
+        whole = rasterize(1, 5000, 32, 32, tile_size=5000)
+        tiled = rasterize(1, 5000, 32, 32, tile_size=333)
+        assert tiled.to_rows() == whole.to_rows()
+
+    def test_points_outside_extent(self):
+        """Test points beyond the extent are counted separately."""
+        grid = rasterize(1, 1000, 8, 8, extent=(0.0, 50.0, 0.0, 50.0))
+        assert grid.points + grid.outside == 1000
+        assert 0 < grid.points < 1000
+        assert grid.points == sum(map(sum, grid.to_rows()))
+
+    def test_edges_inclusive(self):
+        """Test points on the max edges land in the last bins."""
+        grid = DensityGrid(4, 2, (0.0, 4.0, 0.0, 2.0))
+        assert grid.add([4.0, 0.0, 3.99], [2.0, 0.0, 0.5]) == 3
+        assert grid.count(1, 3) == 1
+        assert grid.count(0, 0) == 1
+        assert grid.count(0, 3) == 1
+
+    def test_is_field_sink(self):
+        """Test a grid can be filled by stream_field."""
+        grid = DensityGrid(10, 10, field_extent(3000))
+        DriveMatrix().stream_field(1, 3000, grid, chunk_size=256)
+        assert grid.to_rows() == rasterize(1, 3000, 10, 10).to_rows()
+
+    def test_merge(self):
+        """Test grids over disjoint ranges add up to the whole range."""
+        extent = field_extent(4000)
+        grid = rasterize(1, 1500, 20, 20, extent)
+        grid.merge(rasterize(1501, 4000, 20, 20, extent))
+        assert grid.to_rows() == rasterize(1, 4000, 20, 20, extent).to_rows()
+        with pytest.raises(ValueError):
+            grid.merge(DensityGrid(10, 20, extent))
+
+    def test_density_is_uniform(self):
+        """Test interior density is close to one point per π·a²."""
+        grid = rasterize(1, 200_000, 10, 10)
+        expected = 1.0 / (math.pi * 9.0)
+        inner = [grid.density()[r][c] for r in (4, 5) for c in (4, 5)]
+        assert all(abs(d - expected) / expected < 0.02 for d in inner)
+
+    def test_float32_columns(self):
+        """Test float32 chunks are binned like float64 ones."""
+        grid = DensityGrid(8, 8, field_extent(500))
+        grid.write(FieldBuffer.compute(1, 500, dtype="float32"))
+        assert grid.points == 500
+
+    def test_invalid_arguments(self):
+        """Test bad shapes, extents and tile sizes are rejected."""
+        with pytest.raises(ValueError):
+            DensityGrid(0, 5, (0.0, 1.0, 0.0, 1.0))
+        with pytest.raises(ValueError):
+            DensityGrid(5, 5, (1.0, 1.0, 0.0, 1.0))
+        with pytest.raises(ValueError):
+            rasterize(1, 10, 5, 5, tile_size=0)
+
+    def test_pure_python_fallback(self, monkeypatch):
+        """Test binning through array('q') counts without NumPy."""
+        extent = field_extent(800)
+        expected = rasterize(1, 800, 6, 6, extent)
+        monkeypatch.setattr(raster, "np", None)
+        monkeypatch.setattr(batch, "np", None)
+        grid = rasterize(1, 800, 6, 6, extent, tile_size=100)
+        assert grid.to_rows() == expected.to_rows()
+        density = grid.density()
+        assert len(density) == 6 and len(density[0]) == 6
+        grid.merge(expected)
+        assert grid.points == 1600
+
+
+class TestDriveMatrixRaster:
+    """Test cases for DriveMatrix.rasterize_field."""
+
+    def test_rasterize_field(self):
+        """Test the matrix result equals rasterize and is cached."""
+        matrix = DriveMatrix()
+        grid = matrix.rasterize_field(1, 3000, 24)
+        assert (grid.width, grid.height) == (24, 24)
+        assert grid.to_rows() == rasterize(1, 3000, 24, 24).to_rows()
+        assert matrix.rasterize_field(1, 3000, 24).to_rows() == grid.to_rows()
+        assert matrix.result_cache.hits == 1
+        assert matrix.field_data == []
+
+    def test_cached_grid_not_shared(self):
+        """Test filling a returned grid leaves the cached one unchanged."""
+        matrix = DriveMatrix()
+        grid = matrix.rasterize_field(1, 100, 8)
+        grid.add([0.0], [0.0])
+        matrix.stream_field(1, 50, grid)
+        again = matrix.rasterize_field(1, 100, 8)
+        assert again.points == 100
+        assert again.to_rows() == rasterize(1, 100, 8, 8).to_rows()
+
+    def test_parallel_matches_serial(self, monkeypatch):
+        """Test merged worker grids equal the serial grid."""
+        monkeypatch.setattr(drive_matrix, "PARALLEL_MIN_POINTS", 1)
+        matrix = DriveMatrix(workers=2)
+        grid = matrix.rasterize_field(1, 40_000, 16, tile_size=4096)
+        assert grid.to_rows() == rasterize(1, 40_000, 16, 16).to_rows()
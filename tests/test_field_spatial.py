@@ -0,0 +1,117 @@
+"""Tests for the spatial index over phyllotaxis fields."""
+
+import math
+
+import pytest
+
+from snell_vern_matrix.drive_matrix import DriveMatrix
+from snell_vern_matrix.recursive_field import FieldBuffer, FieldIndex, spatial
+
+QUERIES = [(0.0, 0.0, 5.0), (40.0, -25.0, 12.5), (-90.0, 60.0, 3.0), (500.0, 0.0, 9.0)]
+
+
+def _brute_radius(field, x, y, r):
+    return [
+        n
+        for n in range(field.start, field.end + 1)
+        if math.dist(field.point(n), (x, y)) <= r
+    ]
+
+
+def _brute_nearest(field, x, y, k):
+    ranked = sorted(
+        (math.dist(field.point(n), (x, y)), n)
+        for n in range(field.start, field.end + 1)
+    )
+    return [n for _, n in ranked[:k]]
+
+
+@pytest.fixture(params=["grid", "band"])
+def backend(request, monkeypatch):
+    """Run each test with the NumPy grid and the pure-Python band scan."""
+    if request.param == "band":
+        monkeypatch.setattr(spatial, "np", None)
+    return request.param
+
+
+class TestFieldIndex:
+    """Test cases for FieldIndex queries."""
+
+    def test_query_radius_matches_scan(self, backend):
+        """Test radius queries agree with a full scan."""
+        field = FieldBuffer.compute(3, 2000)
+        index = FieldIndex(field)
+        for x, y, r in QUERIES:
+            assert index.query_radius(x, y, r) == _brute_radius(field, x, y, r)
+
+    def test_nearest_matches_scan(self, backend):
+        """Test k-nearest queries agree with a full scan."""
+        field = FieldBuffer.compute(1, 2000)
+        index = FieldIndex(field)
+        for x, y, _ in QUERIES:
+            for k in (1, 7):
+                assert index.nearest(x, y, k) == _brute_nearest(field, x, y, k)
+
+    def test_nearest_more_than_field(self, backend):
+        """Test asking for more neighbours than points returns them all."""
+        field = FieldBuffer.compute(1, 5)
+        assert sorted(FieldIndex(field).nearest(100.0, 100.0, 10)) == [1, 2, 3, 4, 5]
+
+    def test_empty_field(self):
+        """Test queries on an empty field return nothing."""
+        index = FieldIndex(FieldBuffer.empty())
+        assert index.query_radius(0.0, 0.0, 10.0) == []
+        assert index.nearest(0.0, 0.0, 3) == []
+
+    def test_invalid_cell_size(self):
+        """Test non-positive cell sizes are rejected."""
+        with pytest.raises(ValueError):
+            FieldIndex(FieldBuffer.compute(1, 5), cell_size=0.0)
+
+
+class TestDriveMatrixQueries:
+    """Test cases for DriveMatrix field queries."""
+
+    def test_index_follows_field(self):
+        """Test the index is rebuilt when the field is recomputed."""
+        matrix = DriveMatrix()
+        matrix.compute_field(1, 100)
+        first = matrix.field_index
+        assert matrix.field_index is first
+        matrix.compute_field(1, 200)
+        assert matrix.field_index is not first
+        assert matrix.field_index.field is matrix.field_data
+
+    def test_query_field(self):
+        """Test neighbourhood queries over the computed field."""
+        matrix = DriveMatrix()
+        field = matrix.compute_field(1, 500)
+        x, y = field.point(250)
+        assert 250 in matrix.query_field(x, y, 1.0)
+        assert matrix.nearest_field_indices(x, y, 1) == [250]
+
+    def test_compute_annulus(self):
+        """Test annulus bands without touching the stored field."""
+        matrix = DriveMatrix()
+        band = matrix.compute_annulus(30.0, 45.0)
+        assert (band.start, band.end) == (100, 225)
+        assert band == FieldBuffer.compute(100, 225)
+        assert matrix.field_data == []
+        assert matrix.state.value == "complete"
+
+    @pytest.mark.parametrize("x, y, r", QUERIES)
+    def test_compute_region(self, x, y, r):
+        """Test region queries match a brute-force scan."""
+        matrix = DriveMatrix()
+        region = matrix.compute_region(x, y, r)
+        field = FieldBuffer.compute(1, 40000)
+        assert sorted(region) == _brute_radius(field, x, y, r)
+        for n, point in region.items():
+            assert point == field.point(n)
+
+    def test_compute_region_reuses_field(self):
+        """Test regions inside the stored field slice it instead of recomputing."""
+        matrix = DriveMatrix()
+        field = matrix.compute_field(1, 1000)
+        x, y = field.point(500)
+        assert matrix.compute_region(x, y, 2.0)[500] == field.point(500)
@@ -17,13 +17,18 @@ Covers:
 from __future__ import annotations
 
 import json
+import math
 import os
 import pathlib
+import time
 
 import pytest
 
+from snell_vern_matrix import memory
 from snell_vern_matrix.cli import main as cli_main
 from snell_vern_matrix.memory import (
+    _BUCKET_HASHES,
+    _PROXIMITY_TABLE,
     FieldMemory,
     _proximity_score,
     lucas_phi_hash,
@@ -103,6 +108,13 @@ class TestProximityScore:
     def test_deterministic(self) -> None:
         assert _proximity_score(10, 20) == _proximity_score(10, 20)
 
+    def test_matches_three_phase_gate(self) -> None:
+        g = math.radians(180.0 * (3.0 - math.sqrt(5.0)))
+        for a, b in [(0, 0), (3, 50_000), (104_000, 7)]:
+            theta = (abs(a - b) % 104_729) / 104_729 * 2.0 * math.pi
+            raw = (math.cos(theta) + math.cos(theta + g) + math.cos(theta + 2 * g)) / 3
+            assert _proximity_score(a, b) == (raw + 1) / 2
+
 
 # =========================================================================
 # FieldMemory — init
@@ -217,6 +229,118 @@ class TestRecall:
         assert rec["usage_count"] >= 1
 
 
+# =========================================================================
+# Hash-bucket recall index
+# =========================================================================
+
+
+def _brute_force_recall(m: FieldMemory, query: str, threshold: float) -> dict:
+    q = lucas_phi_hash(query)
+    return {
+        key: rec["coherence_score"] * _proximity_score(q, rec["hash"])
+        for key, rec in m._records.items()
+        if rec["coherence_score"] * _proximity_score(q, rec["hash"]) >= threshold
+    }
+
+
+class TestRecallIndex:
+    def test_table_matches_scoring(self) -> None:
+        assert len(_PROXIMITY_TABLE) == 30 * 30
+        for (a, b), score in _PROXIMITY_TABLE.items():
+            assert score == _proximity_score(a, b)
+        keys = [f"key-{i}" for i in range(500)]
+        assert {lucas_phi_hash(k) for k in keys} <= set(_BUCKET_HASHES)
+
+    def test_recall_matches_full_scan(self) -> None:
+        m = FieldMemory(capacity=1000, coherence_threshold=0.0)
+        for i in range(300):
+            m.store(f"rec-{i}", {"i": i}, (i % 10 + 1) / 10)
+        for query in ("rec-7", "alpha", ""):
+            for threshold in (0.0, 0.3, 0.6, 0.9):
+                expected = _brute_force_recall(m, query, threshold)
+                results = m.recall(query, threshold=threshold)
+                assert {r["key"]: r["score"] for r in results} == expected
+                scores = [r["score"] for r in results]
+                assert scores == sorted(scores, reverse=True)
+
+    def test_recall_does_not_rescore_records(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        m = FieldMemory()
+        for i in range(50):
+            m.store(f"k{i}", {"i": i}, 0.8)
+
+        def fail(a: int, b: int) -> float:
+            raise AssertionError("proximity recomputed")
+
+        monkeypatch.setattr(memory, "_proximity_score", fail)
+        assert m.recall("k1", threshold=0.0)
+
+    def test_index_follows_prune_and_load(self, tmp_path: pathlib.Path) -> None:
+        m = FieldMemory(coherence_threshold=0.5)
+        m.store("low", {"v": 1}, 0.2)
+        m.store("high", {"v": 2}, 0.9)
+        m.prune()
+        assert [k for b in m._buckets.values() for k in b] == ["high"]
+        assert all(r["key"] == "high" for r in m.recall("low", threshold=0.0))
+        path = str(tmp_path / "mem.json")
+        m.persist(path)
+        m2 = FieldMemory()
+        m2.load(path)
+        assert m2._buckets == {lucas_phi_hash("high"): {"high": None}}
+
+
+class _CountingDict(dict):
+    lookups = 0
+
+    def __getitem__(self, key):  # type: ignore[no-untyped-def]
+        type(self).lookups += 1
+        return super().__getitem__(key)
+
+
+class TestRecallTopK:
+    def _memory(self, n: int = 300) -> FieldMemory:
+        m = FieldMemory(capacity=n, coherence_threshold=0.0)
+        for i in range(n):
+            # Few distinct coherences, so many scores tie
+            m.store(f"rec-{i}", {"i": i}, (i % 4 + 1) / 4)
+        return m
+
+    def test_matches_recall_prefix(self) -> None:
+        m = self._memory()
+        for query in ("rec-3", "beta", ""):
+            for threshold in (0.0, 0.4, 0.8):
+                full = m.recall(query, threshold=threshold)
+                for k in (1, 5, 40, 1000):
+                    top = m.recall_top_k(query, k, threshold=threshold)
+                    assert [(r["key"], r["score"]) for r in top] == [
+                        (r["key"], r["score"]) for r in full[:k]
+                    ]
+
+    def test_only_winners_counted(self) -> None:
+        m = self._memory(50)
+        top = m.recall_top_k("rec-1", 3, threshold=0.0)
+        winners = {r["key"] for r in top}
+        for key in m.keys():
+            rec = m.get(key)
+            assert rec is not None
+            assert rec["usage_count"] == (1 if key in winners else 0)
+
+    def test_stops_early(self) -> None:
+        m = self._memory(3000)
+        m._records = _CountingDict(m._records)
+        _CountingDict.lookups = 0
+        m.recall_top_k("rec-1", 1, threshold=0.0)
+        assert _CountingDict.lookups < m.size
+
+    def test_invalid_k(self) -> None:
+        with pytest.raises(ValueError):
+            FieldMemory().recall_top_k("q", 0)
+
+    def test_empty_memory(self) -> None:
+        assert FieldMemory().recall_top_k("q", 3) == []
+
+
 # =========================================================================
 # Decay
 # =========================================================================
@@ -261,6 +385,76 @@ class TestDecay:
         assert 0.0 <= rec["coherence_score"] <= 1.0
 
 
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    now = [1000.0]
+    monkeypatch.setattr(memory.time, "monotonic", lambda: now[0])
+    return now
+
+
+class TestLazyDecay:
+    def _pair(self) -> tuple[FieldMemory, FieldMemory]:
+        pair = (
+            FieldMemory(decay_rate=0.3, coherence_threshold=0.0),
+            FieldMemory(decay_rate=0.3, coherence_threshold=0.0, lazy_decay=True),
+        )
+        for m in pair:
+            for i in range(20):
+                m.store(f"rec-{i}", {"i": i}, 0.5 + i / 40)
+        return pair
+
+    def test_matches_eager_decay(self, clock: list[float]) -> None:
+        eager, lazy = self._pair()
+        for step in range(5):
+            clock[0] += 1.5
+            assert eager.decay() == lazy.decay() == 20
+            # Recalls between ticks change the usage-dampened rates
+            for m in (eager, lazy):
+                m.recall(f"rec-{step}", threshold=0.3)
+        for key in eager.keys():
+            a, b = eager.get(key), lazy.get(key)
+            assert a is not None and b is not None
+            assert b["usage_count"] == a["usage_count"]
+            assert b["coherence_score"] == pytest.approx(a["coherence_score"])
+
+    def test_decay_does_not_touch_records(self, clock: list[float]) -> None:
+        _, m = self._pair()
+        clock[0] += 10.0
+        m.decay()
+        assert m._records["rec-0"]["coherence_score"] == 0.5
+        rec = m.get("rec-0")
+        assert rec is not None
+        assert rec["coherence_score"] == pytest.approx(0.5 * math.exp(-3.0))
+
+    def test_zero_elapsed_decays_nothing(self, clock: list[float]) -> None:
+        _, m = self._pair()
+        assert m.decay() == 0
+
+    def test_recall_and_prune_see_decay(self, clock: list[float]) -> None:
+        _, m = self._pair()
+        m.coherence_threshold = 0.3
+        clock[0] += 2.0
+        m.decay()
+        # exp(-0.6) ≈ 0.55: records stored below ≈ 0.545 fall under 0.3
+        assert m.recall("rec-0", threshold=0.5) == []
+        assert m.prune() == 2
+        assert "rec-0" not in m and "rec-2" in m
+
+    def test_persist_writes_decayed(
+        self, clock: list[float], tmp_path: pathlib.Path
+    ) -> None:
+        _, m = self._pair()
+        clock[0] += 1.0
+        m.decay()
+        path = str(tmp_path / "mem.json")
+        m.persist(path)
+        loaded = FieldMemory(lazy_decay=True)
+        loaded.load(path)
+        rec = loaded.get("rec-0")
+        assert rec is not None
+        assert rec["coherence_score"] == pytest.approx(0.5 * math.exp(-0.3))
+
+
 # =========================================================================
 # Prune
 # =========================================================================
@@ -298,6 +492,98 @@ class TestPrune:
         assert m.prune() == 0
 
 
+class TestEviction:
+    def test_full_store_evicts_lowest_only(self) -> None:
+        m = FieldMemory(capacity=3, coherence_threshold=0.5)
+        m.store("a", {"v": 1}, 0.3)
+        m.store("b", {"v": 2}, 0.2)
+        m.store("c", {"v": 3}, 0.9)
+        assert m.store("d", {"v": 4}, 0.9) is True
+        assert m.keys() == ["a", "c", "d"]
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_prune_matches_sorted_order(self, clock: list[float], lazy: bool) -> None:
+        m = FieldMemory(
+            capacity=200, decay_rate=0.2, coherence_threshold=0.3, lazy_decay=lazy
+        )
+        for i in range(200):
+            m.store(f"rec-{i}", {"i": i}, 0.25 + (i * 37 % 200) / 266)
+        for step in range(6):
+            clock[0] += 0.7
+            m.decay()
+            m.recall(f"rec-{step * 11}", threshold=0.45)
+        records = [m.get(key) for key in m.keys()]
+        kept = [r for r in records if r and r["coherence_score"] >= 0.3]
+        kept.sort(key=lambda r: r["coherence_score"] * (1 + r["usage_count"]))
+        m.capacity = 60
+        assert m.prune() == 200 - 60
+        assert m.keys() == sorted(r["key"] for r in kept[-60:])
+
+    def test_full_store_does_not_scan(self) -> None:
+        m = FieldMemory(capacity=2000, coherence_threshold=0.5)
+        for i in range(2000):
+            m.store(f"rec-{i}", {"i": i}, 0.4 if i == 1234 else 0.9)
+        m._records = _CountingDict(m._records)
+        _CountingDict.lookups = 0
+        assert m.store("new", {"v": 1}, 0.9) is True
+        assert "rec-1234" not in m
+        assert _CountingDict.lookups < 10
+
+    def test_prune_many_usage_counts(
+        self, clock: list[float], tmp_path: pathlib.Path
+    ) -> None:
+        n = 8000
+        path = tmp_path / "memory.json"
+
+        def pruned(distinct: bool) -> tuple[FieldMemory, set[str], float]:
+            records = {
+                f"rec-{i}": {
+                    "hash": 0,
+                    "data": {"i": i},
+                    "coherence_score": 0.2 + (i * 7919 % n) / n * 0.6,
+                    "timestamp": 0.0,
+                    "usage_count": i if distinct else 0,
+                }
+                for i in range(n)
+            }
+            payload = {
+                "capacity": n,
+                "decay_rate": 0.05,
+                "coherence_threshold": 0.5,
+                "records": records,
+            }
+            path.write_text(json.dumps(payload), encoding="utf-8")
+            m = FieldMemory()
+            m.load(str(path))
+            clock[0] += 3.0
+            m.decay()
+            kept = {k for k in m.keys() if m.get(k)["coherence_score"] >= 0.5}
+            start = time.perf_counter()
+            m.prune()
+            return m, kept, time.perf_counter() - start
+
+        m, kept, elapsed = pruned(distinct=True)
+        _, _, baseline = pruned(distinct=False)
+        assert set(m.keys()) == kept
+        # One heap per power-of-two usage class, not per usage count
+        assert len(m._eviction._heaps) <= n.bit_length()
+        assert elapsed < 10 * baseline + 0.1
+
+    def test_decay_rate_change(self, clock: list[float]) -> None:
+        m = FieldMemory(decay_rate=0.0, coherence_threshold=0.0, lazy_decay=True)
+        m.store("used", {"v": 2}, 0.4)
+        m.recall("used", threshold=0.0)
+        m.store("idle", {"v": 1}, 0.9)
+        # Weighted scores are 0.8 (used) and 0.9 (idle) until the rate
+        # changes, then 0.4·e^-0.5·2 ≈ 0.49 and 0.9·e^-1 ≈ 0.33
+        m.decay_rate = 1.0
+        clock[0] += 1.0
+        m.decay()
+        m.capacity = 1
+        assert m.prune() == 1
+        assert m.keys() == ["used"]
+
+
 # =========================================================================
 # Persist / Load roundtrip
 # =========================================================================
@@ -338,6 +624,81 @@ class TestPersistence:
             m.load("/tmp/does_not_exist_memory.json")
 
 
+# =========================================================================
+# Columnar storage
+# =========================================================================
+
+
+def _rounded(obj: object) -> object:
+    return json.loads(json.dumps(obj), parse_float=lambda x: round(float(x), 9))
+
+
+class TestColumnarStorage:
+    def _run(self, storage: str, clock: list[float], path: str) -> list[object]:
+        m = FieldMemory(
+            capacity=40, decay_rate=0.3, coherence_threshold=0.35, storage=storage
+        )
+        out: list[object] = []
+        for i in range(60):
+            out.append(m.store(f"rec-{i}", {"i": i}, 0.3 + (i * 7 % 60) / 90))
+        out.append(m.recall("rec-5", threshold=0.3))
+        out.append(m.recall_top_k("rec-9", 5, threshold=0.2))
+        clock[0] += 2.0
+        out.append(m.decay())
+        out.append(m.prune())
+        m.persist(path)
+        loaded = FieldMemory(storage=storage)
+        loaded.load(path)
+        out.append([loaded.get(key) for key in loaded.keys()])
+        return out
+
+    def test_matches_dict_storage(
+        self, clock: list[float], tmp_path: pathlib.Path
+    ) -> None:
+        expected = self._run("dict", clock, str(tmp_path / "dict.json"))
+        actual = self._run("columnar", clock, str(tmp_path / "columnar.json"))
+        # Vectorised exp may differ from math.exp in the last bit
+        assert _rounded(actual) == _rounded(expected)
+
+    def test_slots_reused(self) -> None:
+        m = FieldMemory(capacity=10, coherence_threshold=0.5, storage="columnar")
+        for i in range(10):
+            m.store(f"rec-{i}", {"i": i}, 0.9 if i % 2 else 0.2)
+        for i in range(5):
+            assert m.store(f"new-{i}", {"i": i}, 0.9) is True
+        columns = m._records.columns  # type: ignore[attr-defined]
+        assert len(columns["data"]) == 10
+        assert len(columns["coherence_score"]) == 10
+        rec = m.get("new-4")
+        assert rec is not None and rec["data"] == {"i": 4}
+
+    def test_decay_without_numpy(
+        self, clock: list[float], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        results = []
+        for module_np in (memory.np, None):
+            monkeypatch.setattr(memory, "np", module_np)
+            m = FieldMemory(decay_rate=0.5, storage="columnar")
+            for key in ("used", "idle", "gone"):
+                m.store(key, {"v": 1}, 0.9)
+            with m._lock:
+                m._records["used"]["usage_count"] = 3
+                m._delete_unlocked("gone")
+            clock[0] += 10.0
+            count = m.decay()
+            scores = [m._records[key]["coherence_score"] for key in ("used", "idle")]
+            results.append((count, scores))
+        assert results[0][0] == results[1][0] == 2
+        assert results[0][1] == pytest.approx(results[1][1])
+        assert results[0][1] == pytest.approx(
+            [0.9 * math.exp(-1.25), 0.9 * math.exp(-5)]
+        )
+
+    def test_invalid_storage(self) -> None:
+        with pytest.raises(ValueError, match="storage"):
+            FieldMemory(storage="sqlite")
+
+
 # =========================================================================
 # Introspection helpers
 # =========================================================================
@@ -0,0 +1,93 @@
+"""Tests for the persistent r/θ lookup table."""
+
+from array import array
+
+import pytest
+from recursive_field_math import r_theta
+
+from snell_vern_matrix import DriveMatrix, RThetaTable, drive_matrix
+from snell_vern_matrix.recursive_field import FieldBuffer, write_field
+
+
+class TestRThetaTable:
+    """Test cases for RThetaTable."""
+
+    def test_build_matches_r_theta(self):
+        """Test every entry equals r_theta(n) exactly."""
+        table = RThetaTable.build(5, 300)
+        assert (table.start, table.end, len(table)) == (5, 300, 296)
+        assert all(table.lookup(n) == r_theta(n) for n in range(5, 301))
+        assert list(table.pairs(10, 12)) == [r_theta(n) for n in (10, 11, 12)]
+
+    def test_save_and_load(self, tmp_path):
+        """Test a saved table loads back with identical entries."""
+        path = tmp_path / "r_theta.svf"
+        RThetaTable.build(1, 1000).save(str(path))
+        table = RThetaTable.load(str(path))
+        assert (table.start, table.end) == (1, 1000)
+        assert table.lookup(777) == r_theta(777)
+
+    def test_covers(self):
+        """Test coverage checks for contained and overhanging ranges."""
+        table = RThetaTable.build(10, 20)
+        assert table.covers(10, 20) and table.covers(12, 15)
+        assert not table.covers(9, 15) and not table.covers(15, 21)
+        with pytest.raises(IndexError):
+            table.pairs(1, 5)
+        with pytest.raises(IndexError):
+            table.lookup(21)
+
+    def test_rejects_stale_table(self, tmp_path):
+        """Test tables whose entries differ from r_theta are refused."""
+        table = RThetaTable.build(1, 50)
+        rs = array("d", (r for r, _ in table.pairs(1, 50)))
+        thetas = array("d", (t + 1e-9 for _, t in table.pairs(1, 50)))
+        path = str(tmp_path / "stale.svf")
+        write_field(path, FieldBuffer(rs, thetas, 1, table.columns.a), "r_theta")
+        with pytest.raises(ValueError):
+            RThetaTable.load(path)
+        assert len(RThetaTable.load(path, verify=False)) == 50
+
+    def test_rejects_other_files(self, tmp_path):
+        """Test x/y files and other scales are refused."""
+        path = str(tmp_path / "xy.svf")
+        write_field(path, FieldBuffer.compute(1, 10))
+        with pytest.raises(ValueError):
+            RThetaTable.load(path)
+        write_field(path, FieldBuffer.compute(1, 10, a=2.0), kind="r_theta")
+        with pytest.raises(ValueError):
+            RThetaTable.load(path)
+
+    def test_invalid_start(self):
+        """Test indices below 1 are rejected."""
+        with pytest.raises(ValueError):
+            RThetaTable.build(0, 10)
+
+
+class TestDriveMatrixRThetaTable:
+    """Test cases for DriveMatrix r/θ table integration."""
+
+    def test_compute_r_theta_field_uses_table(self, tmp_path, monkeypatch):
+        """Test covered ranges are served without calling r_theta."""
+        path = str(tmp_path / "table.svf")
+        expected = DriveMatrix().compute_r_theta_field(1, 500)
+        DriveMatrix().build_r_theta_table(1, 1000, path)
+        matrix = DriveMatrix()
+        matrix.load_r_theta_table(path)
+        monkeypatch.setattr(drive_matrix, "r_theta", None)
+        assert matrix.compute_r_theta_field(1, 500) == expected
+        assert len(matrix.compute_r_theta_columns(1, 500)) == 500
+        assert matrix.get_status()["r_theta_table"] == (1, 1000)
+
+    def test_uncovered_range_is_computed(self):
+        """Test ranges outside the table fall back to r_theta."""
+        matrix = DriveMatrix(r_theta_table=RThetaTable.build(1, 10))
+        result = matrix.compute_r_theta_field(5, 20)
+        assert result == {n: r_theta(n) for n in range(5, 21)}
+
+    def test_table_survives_reset(self):
+        """Test reset keeps the loaded table."""
+        matrix = DriveMatrix()
+        table = matrix.build_r_theta_table(1, 10)
+        matrix.reset()
+        assert matrix.r_theta_table is table
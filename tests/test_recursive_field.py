@@ -2,7 +2,20 @@
 
 import math
 
-from snell_vern_matrix.recursive_field import angle, golden_angle, position, radius
+import pytest
+
+from snell_vern_matrix.recursive_field import (
+    angle,
+    batch,
+    constants,
+    golden_angle,
+    index_range_for_radius,
+    nearest_index,
+    position,
+    positions,
+    positions_array,
+    radius,
+)
 
 
 class TestGoldenAngle:
@@ -90,3 +103,116 @@ class TestPosition:
 
         with pytest.raises(ValueError):
             position(-1)
+
+
+class TestBatchPositions:
+    """Tests for vectorised batch position calculations."""
+
+    def test_positions_match_scalar(self):
+        """Test batch columns agree with the scalar position function."""
+        xs, ys = positions(1, 50)
+        assert len(xs) == len(ys) == 50
+        for i, n in enumerate(range(1, 51)):
+            x, y = position(n)
+            assert abs(xs[i] - x) < 1e-12
+            assert abs(ys[i] - y) < 1e-12
+
+    def test_positions_with_scale(self):
+        """Test batch positions honour the scale factor."""
+        xs, ys = positions(4, 4, a=2.0)
+        assert abs(math.hypot(xs[0], ys[0]) - 4.0) < 1e-12
+
+    def test_positions_empty_range(self):
+        """Test an empty range yields empty columns."""
+        xs, ys = positions(5, 4)
+        assert len(xs) == 0 and len(ys) == 0
+
+    def test_positions_invalid_start(self):
+        """Test batch positions reject non-positive indices."""
+        with pytest.raises(ValueError, match="positive"):
+            positions(0, 5)
+
+    def test_positions_array_order(self):
+        """Test arbitrary index collections keep their order."""
+        xs, ys = positions_array([7, 2, 7])
+        assert (xs[0], ys[0]) == (xs[2], ys[2])
+        assert abs(xs[1] - position(2)[0]) < 1e-12
+
+    def test_positions_array_invalid(self):
+        """Test positions_array rejects non-positive indices."""
+        with pytest.raises(ValueError):
+            positions_array([3, -1])
+
+    def test_pure_python_fallback(self, monkeypatch):
+        """Test the array('d') fallback when NumPy is unavailable."""
+        monkeypatch.setattr(batch, "np", None)
+        xs, ys = positions(1, 20)
+        assert xs.typecode == "d" and ys.typecode == "d"
+        assert all(position(n) == (xs[n - 1], ys[n - 1]) for n in range(1, 21))
+        xs, ys = positions_array(iter([3, 1]))
+        assert (xs[0], ys[0]) == position(3)
+
+    @pytest.mark.parametrize("numpy", [True, False])
+    def test_float32(self, monkeypatch, numpy):
+        """Test float32 columns stay within the documented error bound."""
+        if not numpy:
+            monkeypatch.setattr(batch, "np", None)
+        xs, ys = positions(1, 5000, dtype="float32")
+        assert xs.itemsize == 4 and ys.itemsize == 4
+        for n in (1, 2, 999, 5000):
+            x, y = position(n)
+            bound = 2.0**-24 * 3.0 * math.sqrt(n)
+            assert abs(xs[n - 1] - x) <= bound
+            assert abs(ys[n - 1] - y) <= bound
+        xs, ys = positions_array([7, 3], dtype="float32")
+        assert xs.itemsize == 4 and abs(xs[1] - position(3)[0]) <= 1e-6
+
+    def test_invalid_dtype(self):
+        """Test unknown dtypes are rejected."""
+        with pytest.raises(ValueError):
+            positions(1, 10, dtype="float16")
+
+
+class TestConstants:
+    """Tests for precomputed golden-angle constants."""
+
+    def test_constants_match_derivation(self):
+        """Test shared constants agree with their definitions."""
+        assert constants.GOLDEN_ANGLE_DEG == golden_angle()
+        assert constants.GOLDEN_ANGLE_RAD == math.radians(golden_angle())
+        assert constants.COS_GOLDEN == math.cos(constants.GOLDEN_ANGLE_RAD)
+
+
+class TestInverseLookup:
+    """Tests for radius-to-index and point-to-index inversion."""
+
+    def test_index_range_matches_brute_force(self):
+        """Test the band holds exactly the indices with radius in range."""
+        for r_min, r_max in [(0.0, 3.0), (10.0, 20.0), (29.9, 30.0), (30.0, 30.0)]:
+            lo, hi = index_range_for_radius(r_min, r_max)
+            expected = [n for n in range(1, 500) if r_min <= radius(n) <= r_max]
+            assert list(range(lo, hi + 1)) == expected
+
+    def test_index_range_empty(self):
+        """Test ranges containing no field radius give an empty band."""
+        lo, hi = index_range_for_radius(3.1, 4.0)
+        assert hi < lo
+        lo, hi = index_range_for_radius(5.0, 1.0)
+        assert hi < lo
+
+    def test_index_range_invalid_scale(self):
+        """Test non-positive scale factors are rejected."""
+        with pytest.raises(ValueError):
+            index_range_for_radius(0.0, 1.0, a=0.0)
+
+    def test_nearest_index_matches_brute_force(self):
+        """Test the nearest index agrees with a full scan."""
+        for x, y in [(0.0, 0.0), (17.3, -4.2), (-55.0, 61.0), (300.0, 0.0)]:
+            expected = min(
+                range(1, 20000), key=lambda n: math.dist(position(n), (x, y))
+            )
+            assert nearest_index(x, y) == expected
+
+    def test_nearest_index_of_field_point(self):
+        """Test a field point maps back to its own index."""
+        assert nearest_index(*position(12345)) == 12345
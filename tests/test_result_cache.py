@@ -0,0 +1,130 @@
+"""Tests for the keyed DriveMatrix result cache."""
+
+from array import array
+
+from snell_vern_matrix.drive_matrix import DriveMatrix
+from snell_vern_matrix.recursive_field import FieldBuffer
+from snell_vern_matrix.result_cache import ResultCache, estimate_size
+
+
+class TestEstimateSize:
+    """Test cases for result size estimation."""
+
+    def test_buffers_count_their_data(self):
+        """Test array and field buffers are sized by their data."""
+        assert estimate_size(array("d", [0.0] * 100)) == 800
+        assert estimate_size(FieldBuffer.compute(1, 10)) == 160
+
+    def test_grows_with_container_length(self):
+        """Test larger containers of the same items are estimated larger."""
+        small = {n: (float(n), float(n)) for n in range(10)}
+        large = {n: (float(n), float(n)) for n in range(1000)}
+        assert estimate_size(large) > 10 * estimate_size(small)
+
+    def test_empty_containers(self):
+        """Test empty containers are sized by their own overhead."""
+        assert estimate_size({}) > 0
+        assert estimate_size([]) > 0
+
+
+class TestResultCache:
+    """Test cases for ResultCache."""
+
+    def test_hit_and_miss_counters(self):
+        """Test lookups count hits and misses."""
+        cache = ResultCache()
+        assert cache.get("a") is None
+        cache.put("a", [1, 2, 3])
+        assert cache.get("a") == [1, 2, 3]
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted first."""
+        value = array("d", [0.0] * 10)
+        cache = ResultCache(max_bytes=3 * 80)
+        cache.put("a", value)
+        cache.put("b", value)
+        cache.put("c", value)
+        cache.get("a")
+        cache.put("d", value)
+        assert "b" not in cache
+        assert all(k in cache for k in "acd")
+        assert cache.nbytes == 240
+
+    def test_oversized_value_not_cached(self):
+        """Test results larger than the budget are skipped."""
+        cache = ResultCache(max_bytes=10)
+        assert cache.put("a", array("d", [0.0] * 10)) is False
+        assert len(cache) == 0
+
+    def test_replace_updates_size(self):
+        """Test re-putting a key replaces its size accounting."""
+        cache = ResultCache()
+        cache.put("a", array("d", [0.0] * 10))
+        cache.put("a", array("d", [0.0] * 2))
+        assert cache.nbytes == 16
+        assert len(cache) == 1
+
+
+class TestDriveMatrixResultCache:
+    """Test cases for cached DriveMatrix results."""
+
+    def test_repeated_arguments_hit(self):
+        """Test repeated calls with earlier arguments reuse results."""
+        matrix = DriveMatrix()
+        first = matrix.compute_r_theta_field(1, 50)
+        matrix.compute_r_theta_field(1, 60)
+        again = matrix.compute_r_theta_field(1, 50)
+        assert again == first
+        assert matrix.computation_results["r_theta_field"] is again
+        stats = matrix.get_status()["result_cache"]
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 2, 2)
+
+    def test_keys_include_arguments(self):
+        """Test differing arguments are cached separately."""
+        matrix = DriveMatrix()
+        exact = matrix.analyze_lucas_ratios(10)
+        floats = matrix.analyze_lucas_ratios(10, precision="float")
+        assert exact["precision"] != floats["precision"]
+        assert matrix.analyze_lucas_ratios(10, precision="float") == floats
+        plain = matrix.compute_sequences(20)
+        modular = matrix.compute_sequences(20, modulus=7)
+        assert matrix.compute_sequences(20) == plain
+        assert matrix.compute_sequences(20, modulus=7) == modular
+        stats = matrix.get_status()["result_cache"]
+        assert (stats["hits"], stats["misses"]) == (3, 4)
+
+    def test_reset_clears_by_default(self):
+        """Test reset drops cached results unless asked to keep them."""
+        matrix = DriveMatrix()
+        result = matrix.compute_r_theta_field(1, 10)
+        matrix.reset(keep_result_cache=True)
+        assert matrix.computation_results == {}
+        assert matrix.compute_r_theta_field(1, 10) == result
+        assert matrix.result_cache.hits == 1
+        matrix.reset()
+        assert matrix.compute_r_theta_field(1, 10) == result
+        assert matrix.result_cache.hits == 1
+
+    def test_results_are_copies(self):
+        """Test modifying a returned result leaves later calls intact."""
+        matrix = DriveMatrix()
+        matrix.compute_r_theta_field(1, 3).clear()
+        assert matrix.compute_r_theta_field(1, 3) != {}
+        analysis = matrix.analyze_lucas_ratios(3)
+        analysis["ratios"][1] = 99
+        analysis["error_bounds"].clear()
+        again = matrix.analyze_lucas_ratios(3)
+        assert again["ratios"][1] != 99 and again["error_bounds"]
+        columns = matrix.compute_r_theta_columns(1, 5)
+        columns.xs[0] = -1.0
+        assert matrix.compute_r_theta_columns(1, 5).xs[0] != -1.0
+        assert matrix.result_cache.hits == 3
+
+    def test_budget(self):
+        """Test the constructor budget limits cached results."""
+        matrix = DriveMatrix(result_cache_bytes=0)
+        matrix.compute_r_theta_field(1, 10)
+        assert matrix.get_status()["result_cache"]["entries"] == 0
+        assert "r_theta_field" in matrix.computation_results
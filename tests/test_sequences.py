@@ -0,0 +1,175 @@
+"""Tests for the incremental Fibonacci/Lucas sequence engine."""
+
+import math
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from snell_vern_matrix import sequences
+from snell_vern_matrix.drive_matrix import DriveMatrix
+from snell_vern_matrix.sequences import (
+    SequenceEngine,
+    SequenceView,
+    fib_pair,
+    fibonacci,
+    fibonacci_mod,
+    float_lucas_ratios,
+    lucas,
+    lucas_mod,
+    modular_sequences,
+    pisano_period,
+)
+
+FIB = [0, 1, 1, 2, 3, 5, 8, 13, 21, 34, 55]
+LUC = [2, 1, 3, 4, 7, 11, 18, 29, 47, 76, 123]
+
+
+class TestFastDoubling:
+    def test_small_values(self) -> None:
+        assert [fibonacci(n) for n in range(11)] == FIB
+        assert [lucas(n) for n in range(11)] == LUC
+
+    def test_pair(self) -> None:
+        assert fib_pair(10) == (55, 89)
+
+    def test_large_n_matches_recurrence(self) -> None:
+        engine = SequenceEngine()
+        engine.extend(1000)
+        assert fibonacci(1000) == engine.fibonacci[1000]
+        assert lucas(999) == engine.lucas[999]
+
+    def test_negative_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            fib_pair(-1)
+
+
+class TestSequenceEngine:
+    def test_extend_is_incremental(self) -> None:
+        engine = SequenceEngine()
+        engine.extend(5)
+        first = engine.fibonacci
+        engine.extend(10)
+        assert engine.fibonacci is first
+        assert engine.fibonacci == FIB and engine.lucas == LUC
+        engine.extend(3)
+        assert len(engine) == 11
+
+    def test_lookup_beyond_cache(self) -> None:
+        engine = SequenceEngine()
+        engine.extend(5)
+        assert engine.fibonacci_at(4) == 3
+        assert engine.lucas_at(10) == 123
+        assert len(engine) == 6
+
+    def test_view_is_zero_copy_mapping(self) -> None:
+        engine = SequenceEngine()
+        views = engine.view(4)
+        fib = views["fibonacci"]
+        assert isinstance(fib, SequenceView)
+        assert dict(fib) == {0: 0, 1: 1, 2: 1, 3: 2, 4: 3}
+        assert list(views["lucas"].values()) == LUC[:5]
+        engine.extend(10)
+        assert len(fib) == 5
+        assert 5 not in fib
+        with pytest.raises(KeyError):
+            fib[5]
+
+    def test_empty_view(self) -> None:
+        assert len(SequenceEngine().view(-1)["lucas"]) == 0
+
+    def test_concurrent_extension(self) -> None:
+        engine = SequenceEngine()
+        sizes = [(i * 37) % 500 for i in range(200)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            views = list(pool.map(engine.view, sizes))
+        assert len(engine) == max(sizes) + 1
+        assert engine.lucas[-1] == sequences.lucas(max(sizes))
+        for size, view in zip(sizes, views):
+            assert len(view["lucas"]) == size + 1
+
+
+class TestModular:
+    def test_pisano_period(self) -> None:
+        assert pisano_period(1) == 1
+        assert pisano_period(2) == 3
+        assert pisano_period(10) == 60
+        with pytest.raises(ValueError):
+            pisano_period(0)
+
+    def test_single_term_mod(self) -> None:
+        assert fibonacci_mod(10, 7) == 55 % 7
+        assert lucas_mod(10, 7) == 123 % 7
+        assert fibonacci_mod(10**18, 10) == fibonacci_mod(10**18 % 60, 10)
+
+    def test_sweep_matches_exact(self) -> None:
+        result = modular_sequences(200, 10)
+        assert result["period"] == 60
+        assert result["fibonacci"].to_list() == [fibonacci(n) % 10 for n in range(201)]
+        assert result["lucas"].to_list() == [lucas(n) % 10 for n in range(201)]
+
+    def test_period_not_reached(self) -> None:
+        result = modular_sequences(10, 10**40)
+        assert result["period"] is None
+        assert result["fibonacci"][10] == 55
+
+
+class TestFloatRatios:
+    def test_ratios_match_exact(self) -> None:
+        result = float_lucas_ratios(40)
+        for n in (1, 2, 10, 40):
+            assert abs(result["ratios"][n] - lucas(n + 1) / lucas(n)) < 1e-15
+        assert 0 not in result["ratios"]
+
+    def test_log_bounds_bracket_error(self) -> None:
+        # Keep n small so the float reference error is itself accurate
+        result = float_lucas_ratios(12)
+        phi = (1 + math.sqrt(5)) / 2
+        for n in range(1, 13):
+            err = abs(lucas(n + 1) / lucas(n) - phi)
+            lo = math.exp(result["log_lower_bounds"][n])
+            hi = math.exp(result["log_upper_bounds"][n])
+            assert lo * (1 - 1e-6) <= err <= hi * (1 + 1e-6)
+
+    def test_closed_form_matches_recurrence(self, monkeypatch) -> None:
+        vectorised = float_lucas_ratios(500)
+        monkeypatch.setattr(sequences, "np", None)
+        looped = float_lucas_ratios(500)
+        for key in ("ratios", "log_lower_bounds", "log_upper_bounds"):
+            for n in (1, 2, 3, 50, 500):
+                assert vectorised[key][n] == pytest.approx(looped[key][n], rel=1e-14)
+
+    def test_huge_n_stays_finite(self) -> None:
+        result = float_lucas_ratios(5000)
+        assert math.isfinite(result["log_upper_bounds"][5000])
+        assert result["log_upper_bounds"][5000] < -4000
+
+
+class TestDriveMatrixSequences:
+    def test_compute_sequences_reuses_cache(self) -> None:
+        matrix = DriveMatrix()
+        matrix.compute_sequences(10)
+        cache = matrix.sequence_cache["fibonacci"]
+        result = matrix.compute_sequences(5)
+        assert matrix.sequence_cache["fibonacci"] is cache
+        assert len(cache) == 11
+        assert result["fibonacci"].to_list() == FIB[:6]
+        assert matrix.get_status()["cached_lucas"] == 11
+
+    def test_modular_mode_leaves_cache(self) -> None:
+        matrix = DriveMatrix()
+        result = matrix.compute_sequences(100, modulus=7)
+        assert result["modulus"] == 7 and result["period"] == 16
+        assert result["lucas"][100] == lucas(100) % 7
+        assert len(matrix.sequence_cache["fibonacci"]) == 0
+
+    def test_float_ratio_analysis(self) -> None:
+        matrix = DriveMatrix()
+        result = matrix.analyze_lucas_ratios(1000, precision="float")
+        assert result["precision"] == "float"
+        assert len(result["ratios"]) == 1000
+        assert "log_upper_bounds" in result
+        assert result["egyptian_fraction"] == (149, 308)
+        result["signature"]["L3"] = 0
+        assert matrix.analyze_lucas_ratios(3)["signature"]["L3"] == 4
+        with pytest.raises(ValueError):
+            matrix.analyze_lucas_ratios(5, precision="decimal")